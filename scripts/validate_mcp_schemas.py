@@ -6,67 +6,154 @@ This script ensures all tools follow the MCP protocol specification
 and have valid JSON schemas.
 """
 
+import hashlib
 import json
 import sys
+from functools import lru_cache
 from pathlib import Path
 from typing import Dict, List, Any
 
+from jsonschema import Draft202012Validator
+
+
+# MCP tool shape, expressed as a JSON Schema so the whole walk runs in one
+# compiled validator pass
+MCP_TOOL_META: Dict[str, Any] = {
+    'type': 'object',
+    # One 'required' per field, so each error names the field it is about
+    'allOf': [
+        {'required': ['name']},
+        {'required': ['description']},
+        {'required': ['inputSchema']}
+    ],
+    'properties': {
+        # Tool names follow 'category.action'
+        'name': {'type': 'string', 'pattern': r'\.'},
+        'description': {'type': 'string', 'minLength': 10},
+        'inputSchema': {
+            'type': 'object',
+            'required': ['type'],
+            'properties': {
+                'type': {'type': 'string'},
+                'properties': {
+                    'type': 'object',
+                    # Each property should have a type (or a $ref)
+                    'additionalProperties': {
+                        'type': 'object',
+                        'anyOf': [
+                            {'required': ['type']},
+                            {'required': ['$ref']}
+                        ]
+                    }
+                }
+            },
+            # Object schemas must declare their properties
+            'if': {'required': ['type'], 'properties': {'type': {'const': 'object'}}},
+            'then': {'required': ['properties']}
+        }
+    }
+}
+
+VALIDATOR = Draft202012Validator(MCP_TOOL_META)
+
+# Validation results keyed by a digest of the tool's canonical JSON
+_VALIDATION_CACHE: Dict[bytes, List[str]] = {}
+
+
+@lru_cache(maxsize=None)
+def _get_validator() -> Draft202012Validator:
+    """Return the (compiled once) JSON Schema draft 2020-12 meta-validator."""
+    return Draft202012Validator(Draft202012Validator.META_SCHEMA)
+
+
+def _format_error(error) -> str:
+    """
+    Describe a failed MCP_TOOL_META rule in the validator's own words.
+    
+    Args:
+        error: jsonschema ValidationError raised against a tool
+        
+    Returns:
+        Human readable message for the broken rule
+    """
+    path = tuple(error.absolute_path)
+    rule = error.validator
+    value = error.instance
+    
+    if not path and rule == 'required':
+        return f"Missing required field: {error.validator_value[0]}"
+    
+    if path == ('name',):
+        if rule == 'type':
+            return f"Tool name must be string, got {type(value)}"
+        return f"Tool name should follow 'category.action' format: {value}"
+    
+    if path == ('description',):
+        if rule == 'type':
+            return "Description must be string"
+        return f"Description too short: {value}"
+    
+    if path == ('inputSchema',):
+        if rule == 'type':
+            return "inputSchema must be dict"
+        if error.validator_value == ['type']:
+            return "inputSchema missing 'type' field"
+        return "Object schema missing 'properties'"
+    
+    if path == ('inputSchema', 'properties'):
+        return "properties must be dict"
+    
+    if len(path) == 3 and path[:2] == ('inputSchema', 'properties'):
+        if rule == 'type':
+            return f"Property {path[2]} schema must be dict"
+        return f"Property {path[2]} missing type"
+    
+    location = '/'.join(str(part) for part in path)
+    return f"{location}: {error.message}" if location else error.message
+
+
+@lru_cache(maxsize=None)
+def _input_schema_errors(schema_json: str) -> tuple:
+    """
+    Validate a canonicalised inputSchema against the draft meta-schema.
+    
+    Results are memoized per schema text, so tools sharing an identical
+    inputSchema are only checked once.
+    """
+    schema = json.loads(schema_json)
+    return tuple(
+        f"inputSchema invalid at '{'/'.join(map(str, error.absolute_path)) or '<root>'}': {error.message}"
+        for error in _get_validator().iter_errors(schema)
+    )
+
 
 def validate_tool_schema(tool: Dict[str, Any]) -> List[str]:
     """
     Validate a single tool schema.
     
-    Returns list of validation errors (empty if valid).
+    Returns list of validation errors (empty if valid). Identical tool
+    definitions are only validated once per process.
     """
-    errors = []
-    
-    # Required fields
-    required_fields = ['name', 'description', 'inputSchema']
-    for field in required_fields:
-        if field not in tool:
-            errors.append(f"Missing required field: {field}")
-    
-    # Name format
-    if 'name' in tool:
-        name = tool['name']
-        if not isinstance(name, str):
-            errors.append(f"Tool name must be string, got {type(name)}")
-        elif '.' not in name:
-            errors.append(f"Tool name should follow 'category.action' format: {name}")
-    
-    # Description
-    if 'description' in tool:
-        desc = tool['description']
-        if not isinstance(desc, str):
-            errors.append(f"Description must be string")
-        elif len(desc) < 10:
-            errors.append(f"Description too short: {desc}")
-    
-    # Input schema
-    if 'inputSchema' in tool:
-        schema = tool['inputSchema']
-        if not isinstance(schema, dict):
-            errors.append(f"inputSchema must be dict")
-        else:
-            # Validate JSON Schema structure
-            if 'type' not in schema:
-                errors.append(f"inputSchema missing 'type' field")
-            
-            if schema.get('type') == 'object' and 'properties' not in schema:
-                errors.append(f"Object schema missing 'properties'")
-            
-            # Check for required fields definition
-            if 'properties' in schema:
-                props = schema['properties']
-                if not isinstance(props, dict):
-                    errors.append(f"properties must be dict")
-                
-                # Each property should have a type
-                for prop_name, prop_schema in props.items():
-                    if not isinstance(prop_schema, dict):
-                        errors.append(f"Property {prop_name} schema must be dict")
-                    elif 'type' not in prop_schema and '$ref' not in prop_schema:
-                        errors.append(f"Property {prop_name} missing type")
+    key = hashlib.blake2b(
+        json.dumps(tool, sort_keys=True, default=repr).encode(),
+        digest_size=16
+    ).digest()
+    
+    if key not in _VALIDATION_CACHE:
+        _VALIDATION_CACHE[key] = _validate_tool_schema(tool)
+    
+    return list(_VALIDATION_CACHE[key])
+
+
+def _validate_tool_schema(tool: Dict[str, Any]) -> List[str]:
+    """Run the compiled validators against a single tool."""
+    errors = [_format_error(error) for error in VALIDATOR.iter_errors(tool)]
+    
+    # Validate against the JSON Schema meta-schema
+    schema = tool.get('inputSchema')
+    if isinstance(schema, dict):
+        schema_json = json.dumps(schema, sort_keys=True)
+        errors.extend(_input_schema_errors(schema_json))
     
     return errors
 
@@ -1,15 +1,84 @@
 """AI Agent with plan-execute-reflect loop for autonomous DevOps operations."""
 
+import json
 import logging
 import asyncio
-from typing import Dict, Any, List, Optional
+import hashlib
+import re
+import reprlib
+import sys
+import time
+from types import MappingProxyType
+from typing import Dict, Any, AsyncIterator, List, Mapping, Optional, Tuple
+from collections import OrderedDict
 from dataclasses import dataclass
 from enum import Enum
 
 from ..llm.providers import LLMClient, LLMMessage
 
+try:
+    import orjson
+except ImportError:  # pragma: no cover - optional speedup
+    orjson = None
+
 logger = logging.getLogger(__name__)
 
+_JSON_DECODER = json.JSONDecoder()
+
+# Bounded repr for step results: never materializes the full object text
+_RESULT_REPR = reprlib.Repr()
+_RESULT_REPR.maxstring = 500
+_RESULT_REPR.maxother = 500
+_RESULT_REPR.maxlist = _RESULT_REPR.maxtuple = _RESULT_REPR.maxdict = 20
+
+# dataclass(slots=True) needs Python 3.10+
+_DATACLASS_SLOTS = {'slots': True} if sys.version_info >= (3, 10) else {}
+
+# Static system prompts, shared across calls
+_SYSTEM_INTENT = """You are an intent parser for a DevOps AI assistant.
+Analyze the user's request and extract:
+1. Intent type (check_status, diagnose_failure, get_logs, execute_command, etc.)
+2. Target entities (servers, services, clusters)
+3. Key parameters
+4. Urgency level
+
+Respond in JSON format."""
+
+_SYSTEM_PLAN_PREFIX = """You are a DevOps planning AI. Create a step-by-step plan to fulfill user requests.
+
+Available tools:
+"""
+
+_SYSTEM_PLAN_SUFFIX = """
+
+Create a plan as a JSON array of steps. Each step should have:
+- description: what to do
+- tool: which tool to use
+- args: arguments for the tool
+- depends_on: list of previous step numbers this depends on (steps without it may run in parallel)
+
+Make the plan efficient and safe. For diagnostic tasks, gather data before analysis."""
+
+_SYSTEM_SYNTH = """You are a DevOps AI assistant. Synthesize the execution results into a clear, helpful response for the user.
+
+Focus on:
+1. Directly answering their question
+2. Highlighting key findings
+3. Suggesting next steps if relevant
+4. Being concise but informative
+
+Use markdown formatting for readability."""
+
+_SYSTEM_DIRECT = "You are a helpful DevOps assistant."
+
+
+def _loads_json(content: str) -> Any:
+    """Decode an LLM JSON payload, preferring orjson when installed."""
+    if orjson is not None:
+        return orjson.loads(content.encode() if isinstance(content, str) else content)
+    
+    return _JSON_DECODER.decode(content)
+
 
 class TaskComplexity(Enum):
     """Task complexity levels."""
@@ -19,7 +88,7 @@ class TaskComplexity(Enum):
     ADVANCED = 10   # Requires deep reasoning, many steps
 
 
-@dataclass
+@dataclass(**_DATACLASS_SLOTS)
 class AgentStep:
     """Single step in agent execution."""
     step_num: int
@@ -30,7 +99,7 @@ class AgentStep:
     error: Optional[str] = None
 
 
-@dataclass
+@dataclass(**_DATACLASS_SLOTS)
 class AgentPlan:
     """Agent execution plan."""
     goal: str
@@ -42,11 +111,48 @@ class AgentPlan:
 class AIAgent:
     """Autonomous AI agent with plan-execute-reflect capabilities."""
     
+    # Simple queries
+    _SIMPLE_PATTERNS = (
+        'what is', 'who is', 'how do you', 'can you explain',
+        'tell me about', 'what does', 'define', 'help'
+    )
+    
+    # Tool-requiring patterns
+    _ACTION_PATTERNS = (
+        'check', 'show me', 'get', 'fetch', 'restart', 'deploy',
+        'status of', 'logs from', 'running on'
+    )
+    
+    # Compiled once so each chat turn is a single scan per pattern set
+    _SIMPLE_QUERY_RE = re.compile('|'.join(map(re.escape, _SIMPLE_PATTERNS)))
+    _ACTION_QUERY_RE = re.compile('|'.join(map(re.escape, _ACTION_PATTERNS)))
+    
+    # Output caps for the structured (JSON) LLM calls
+    INTENT_MAX_TOKENS = 256
+    PLAN_MAX_TOKENS = 1024
+    
+    # Conversation messages kept after a trim, and how many more may
+    # accumulate before the next one
+    HISTORY_WINDOW = 20
+    HISTORY_BUFFER = 10
+    
+    # Repeated identical prompts within a session reuse the final response
+    RESPONSE_CACHE_SIZE = 64
+    RESPONSE_CACHE_TTL = 60.0  # seconds
+    
+    # Tools that only read state; only plans made of these are replayed
+    READ_ONLY_TOOLS = frozenset({'docker.list', 'k8s.get_pods'})
+    
+    _CRITICAL_ERROR_RE = re.compile(
+        r'connection|authentication|permission|not found', re.IGNORECASE
+    )
+    
     def __init__(
         self,
         llm_client: LLMClient,
         tool_registry: Dict[str, Any],
-        max_iterations: int = 10
+        max_iterations: int = 10,
+        speculative_planning: bool = False
     ):
         """
         Initialize AI agent.
@@ -55,17 +161,37 @@ class AIAgent:
             llm_client: LLM client for AI operations
             tool_registry: Available tools
             max_iterations: Maximum plan-execute iterations
+            speculative_planning: Request a fallback-intent plan concurrently
+                with intent parsing (saves a round-trip when the intent is
+                unknown, at the cost of an extra LLM call otherwise)
         """
         self.llm = llm_client
-        self.tools = tool_registry
+        # Read-only view: cached tool descriptions must not go stale
+        self.tools: Mapping[str, Any] = MappingProxyType(dict(tool_registry))
         self.max_iterations = max_iterations
+        self.speculative_planning = speculative_planning
+        
+        # Tool registry is fixed for the agent's lifetime; format it once
+        self._tool_descriptions = self._build_tool_descriptions()
+        self._plan_system_prompt = (
+            _SYSTEM_PLAN_PREFIX + self._tool_descriptions + _SYSTEM_PLAN_SUFFIX
+        )
         
+        # Append-only so earlier turns stay a byte-identical prompt prefix;
+        # trimmed in batches (see _trim_history) rather than one at a time
         self.conversation_history: List[LLMMessage] = []
+        
+        # Recent final responses: (prompt, context digest) -> (timestamp, response)
+        self._response_cache: "OrderedDict[Tuple[str, bytes], Tuple[float, str]]" = OrderedDict()
+        
+        # Whether the last process_prompt result is safe to replay from a cache
+        self.last_response_cacheable = False
     
     async def process_prompt(
         self,
         user_prompt: str,
-        context: Optional[Dict[str, Any]] = None
+        context: Optional[Dict[str, Any]] = None,
+        raise_errors: bool = False
     ) -> str:
         """
         Process user prompt through plan-execute-reflect loop.
@@ -73,19 +199,54 @@ class AIAgent:
         Args:
             user_prompt: User's natural language request
             context: Additional context (profile, environment, etc.)
+            raise_errors: Re-raise failures instead of answering with an
+                error message (for callers that record outcomes)
             
         Returns:
             Final response
         """
         logger.info(f"Processing prompt: {user_prompt[:100]}...")
         
+        self.last_response_cacheable = False
+        
+        cache_key = (user_prompt, self._context_digest(context))
+        cached = self._get_cached_response(cache_key)
+        if cached is not None:
+            logger.info("Returning cached response for repeated prompt")
+            self.last_response_cacheable = True
+            return cached
+        
+        speculative_plan = None
+        
         try:
+            if self.speculative_planning:
+                # Plan against the fallback intent while the real one is parsed
+                speculative_plan = asyncio.create_task(
+                    self._create_plan(user_prompt, self._fallback_intent(), context)
+                )
+                speculative_plan.add_done_callback(
+                    lambda task: task.cancelled() or task.exception()
+                )
+            
             # Phase 1: Parse & Understand
             intent = await self._parse_intent(user_prompt, context)
             logger.info(f"Intent: {intent['intent_type']}")
             
+            # Unparseable intent on a knowledge question: answer directly
+            # instead of planning a generic tool run
+            if intent.get('intent_type') == 'unknown' and self._is_simple_query(user_prompt):
+                logger.info("Unknown intent on simple query - answering directly")
+                final_response = await self._respond_directly(user_prompt)
+                if not intent.get('fallback'):
+                    self._cache_response(cache_key, final_response)
+                    self.last_response_cacheable = True
+                return final_response
+            
             # Phase 2: Plan
-            plan = await self._create_plan(user_prompt, intent, context)
+            if speculative_plan is not None and intent.get('intent_type') == 'unknown':
+                plan = await speculative_plan
+            else:
+                plan = await self._create_plan(user_prompt, intent, context)
             logger.info(f"Plan created with {len(plan.steps)} steps")
             
             # Phase 3: Execute
@@ -99,11 +260,84 @@ class AIAgent:
                 execution_results
             )
             
+            # Never replay responses for potentially destructive actions,
+            # or for requests whose intent could not be parsed
+            if self._is_replayable(intent, plan):
+                self._cache_response(cache_key, final_response)
+                self.last_response_cacheable = True
+            
             return final_response
         
         except Exception as e:
             logger.error(f"Agent error: {e}", exc_info=True)
+            if raise_errors:
+                raise
             return f"I encountered an error processing your request: {str(e)}"
+        
+        finally:
+            if speculative_plan is not None:
+                speculative_plan.cancel()
+    
+    def _is_replayable(self, intent: Dict[str, Any], plan: AgentPlan) -> bool:
+        """Whether a response may be served again from a cache."""
+        if intent.get('fallback') or intent.get('requires_confirmation'):
+            return False
+        return self._is_read_only(plan)
+    
+    def _is_read_only(self, plan: AgentPlan) -> bool:
+        """
+        Whether a plan only reads state, so its response may be replayed.
+        
+        Decided from the steps themselves rather than the model's
+        requires_confirmation flag: every tool step must use a tool in
+        READ_ONLY_TOOLS (a plan with no tool steps qualifies).
+        """
+        for step in plan.steps:
+            if not isinstance(step, dict):
+                return False
+            tool = step.get('tool')
+            if tool and tool not in self.READ_ONLY_TOOLS:
+                return False
+        return True
+    
+    @staticmethod
+    def _context_digest(context: Optional[Dict[str, Any]]) -> bytes:
+        """Stable digest of the prompt context for response caching."""
+        if orjson is not None:
+            try:
+                payload = orjson.dumps(
+                    context or {},
+                    option=orjson.OPT_SORT_KEYS | orjson.OPT_NON_STR_KEYS,
+                    default=repr
+                )
+            except TypeError:
+                payload = repr(context).encode()
+        else:
+            payload = json.dumps(context or {}, sort_keys=True, default=repr).encode()
+        
+        return hashlib.blake2b(payload, digest_size=16).digest()
+    
+    def _get_cached_response(self, key: Tuple[str, bytes]) -> Optional[str]:
+        """Return a cached response if it is still fresh."""
+        entry = self._response_cache.get(key)
+        if entry is None:
+            return None
+        
+        timestamp, response = entry
+        if time.monotonic() - timestamp > self.RESPONSE_CACHE_TTL:
+            del self._response_cache[key]
+            return None
+        
+        self._response_cache.move_to_end(key)
+        return response
+    
+    def _cache_response(self, key: Tuple[str, bytes], response: str):
+        """Store a final response, evicting the least recently used entry."""
+        self._response_cache[key] = (time.monotonic(), response)
+        self._response_cache.move_to_end(key)
+        
+        while len(self._response_cache) > self.RESPONSE_CACHE_SIZE:
+            self._response_cache.popitem(last=False)
     
     async def _parse_intent(
         self,
@@ -120,15 +354,6 @@ class AIAgent:
         Returns:
             Intent structure
         """
-        system_prompt = """You are an intent parser for a DevOps AI assistant.
-Analyze the user's request and extract:
-1. Intent type (check_status, diagnose_failure, get_logs, execute_command, etc.)
-2. Target entities (servers, services, clusters)
-3. Key parameters
-4. Urgency level
-
-Respond in JSON format."""
-        
         parse_prompt = f"""User request: {prompt}
         
 Context: {context or 'None'}
@@ -142,26 +367,33 @@ Parse this request and respond with JSON containing:
         
         response = await self.llm.generate(
             parse_prompt,
-            system=system_prompt,
-            temperature=0.3
+            system=_SYSTEM_INTENT,
+            temperature=0.0,
+            max_tokens=self.INTENT_MAX_TOKENS
         )
         
         # Parse JSON response
-        import json
         try:
-            intent = json.loads(response.content)
-        except json.JSONDecodeError:
+            intent = _loads_json(response.content)
+        except ValueError:
             # Fallback to basic parsing
-            intent = {
-                'intent_type': 'unknown',
-                'entities': [],
-                'parameters': {},
-                'urgency': 'medium',
-                'requires_confirmation': False
-            }
+            intent = self._fallback_intent()
         
         return intent
     
+    @staticmethod
+    def _fallback_intent() -> Dict[str, Any]:
+        """Intent used when the LLM response cannot be parsed."""
+        return {
+            'intent_type': 'unknown',
+            'entities': [],
+            'parameters': {},
+            'urgency': 'medium',
+            'requires_confirmation': False,
+            # Nothing is known about this request; never replay its response
+            'fallback': True
+        }
+    
     async def _create_plan(
         self,
         prompt: str,
@@ -179,22 +411,6 @@ Parse this request and respond with JSON containing:
         Returns:
             Execution plan
         """
-        # Build tool descriptions
-        tool_descriptions = self._format_available_tools()
-        
-        system_prompt = f"""You are a DevOps planning AI. Create a step-by-step plan to fulfill user requests.
-
-Available tools:
-{tool_descriptions}
-
-Create a plan as a JSON array of steps. Each step should have:
-- description: what to do
-- tool: which tool to use
-- args: arguments for the tool
-- depends_on: list of previous step numbers this depends on (optional)
-
-Make the plan efficient and safe. For diagnostic tasks, gather data before analysis."""
-        
         plan_prompt = f"""User request: {prompt}
 
 Intent: {intent['intent_type']}
@@ -209,16 +425,16 @@ Respond with JSON plan."""
         
         response = await self.llm.generate(
             plan_prompt,
-            system=system_prompt,
-            temperature=0.5
+            system=self._plan_system_prompt,
+            temperature=0.5,
+            max_tokens=self.PLAN_MAX_TOKENS
         )
         
         # Parse plan
-        import json
         try:
-            plan_data = json.loads(response.content)
+            plan_data = _loads_json(response.content)
             steps = plan_data if isinstance(plan_data, list) else plan_data.get('steps', [])
-        except json.JSONDecodeError:
+        except ValueError:
             logger.warning("Failed to parse plan JSON, using fallback")
             steps = self._create_fallback_plan(intent)
         
@@ -234,6 +450,10 @@ Respond with JSON plan."""
     
     def _format_available_tools(self) -> str:
         """Format tool registry for LLM."""
+        return self._tool_descriptions
+    
+    def _build_tool_descriptions(self) -> str:
+        """Build the tool description block used in planning prompts."""
         descriptions = []
         for name, tool in self.tools.items():
             desc = tool.get('description', 'No description')
@@ -291,50 +511,112 @@ Respond with JSON plan."""
         """
         Execute plan steps.
         
+        Steps are grouped into waves using their ``depends_on`` lists; all
+        steps in a wave have their dependencies satisfied and run
+        concurrently.
+        
         Args:
             plan: Execution plan
             
         Returns:
             Execution results
         """
+        step_defs = list(enumerate(plan.steps, 1))
+        
+        if len(step_defs) > self.max_iterations:
+            logger.warning(f"Max iterations ({self.max_iterations}) reached")
+            step_defs = step_defs[:self.max_iterations]
+        
+        step_ids = {idx for idx, _ in step_defs}
+        pending = {
+            idx: (step_def, self._step_dependencies(idx, step_def, step_ids))
+            for idx, step_def in step_defs
+        }
+        completed = set()
         results = []
         
-        for idx, step_def in enumerate(plan.steps, 1):
-            if idx > self.max_iterations:
-                logger.warning(f"Max iterations ({self.max_iterations}) reached")
-                break
+        while pending:
+            wave = [idx for idx, (_, deps) in pending.items() if deps <= completed]
             
-            step = AgentStep(
-                step_num=idx,
-                description=step_def.get('description', ''),
-                tool=step_def.get('tool', ''),
-                args=step_def.get('args', {})
-            )
-            
-            logger.info(f"Step {idx}/{len(plan.steps)}: {step.description}")
+            if not wave:
+                # Dependency cycle - fall back to plan order
+                logger.warning("Unresolvable step dependencies - running next step in order")
+                wave = [min(pending)]
             
-            try:
-                # Execute tool
-                result = await self._execute_tool(step.tool, step.args)
-                step.result = result
-                logger.info(f"Step {idx} completed successfully")
+            wave_results = await asyncio.gather(*(
+                self._run_step(idx, pending[idx][0], len(plan.steps))
+                for idx in wave
+            ))
             
-            except Exception as e:
-                step.error = str(e)
-                logger.error(f"Step {idx} failed: {e}")
-                
-                # Decide whether to continue or abort
-                if self._is_critical_failure(step, e):
-                    logger.error("Critical failure - aborting plan")
-                    break
+            for idx in wave:
+                del pending[idx]
+                completed.add(idx)
             
-            results.append(step)
+            results.extend(step for step, _ in wave_results)
             
-            # Small delay between steps
-            await asyncio.sleep(0.5)
+            if any(critical for _, critical in wave_results):
+                logger.error("Critical failure - aborting plan")
+                break
         
+        results.sort(key=lambda step: step.step_num)
         return results
     
+    def _step_dependencies(
+        self,
+        idx: int,
+        step_def: Dict[str, Any],
+        step_ids: set
+    ) -> set:
+        """Resolve a step's ``depends_on`` list to known step numbers."""
+        deps = set()
+        
+        for dep in step_def.get('depends_on') or []:
+            try:
+                dep = int(dep)
+            except (TypeError, ValueError):
+                continue
+            
+            if dep != idx and dep in step_ids:
+                deps.add(dep)
+        
+        return deps
+    
+    async def _run_step(
+        self,
+        idx: int,
+        step_def: Dict[str, Any],
+        total_steps: int
+    ) -> Tuple[AgentStep, bool]:
+        """
+        Execute a single plan step.
+        
+        Returns:
+            Tuple of (step result, whether the failure is critical)
+        """
+        step = AgentStep(
+            step_num=idx,
+            description=step_def.get('description', ''),
+            tool=step_def.get('tool', ''),
+            args=step_def.get('args', {})
+        )
+        
+        logger.info(f"Step {idx}/{total_steps}: {step.description}")
+        
+        try:
+            # Execute tool
+            result = await self._execute_tool(step.tool, step.args)
+            step.result = result
+            logger.info(f"Step {idx} completed successfully")
+        
+        except Exception as e:
+            step.error = str(e)
+            logger.error(f"Step {idx} failed: {e}")
+            
+            # Decide whether to continue or abort
+            return step, self._is_critical_failure(step, e)
+        
+        return step, False
+    
     async def _execute_tool(self, tool_name: str, args: Dict[str, Any]) -> Any:
         """
         Execute a tool.
@@ -366,10 +648,7 @@ Respond with JSON plan."""
     def _is_critical_failure(self, step: AgentStep, error: Exception) -> bool:
         """Determine if failure is critical (should abort)."""
         # Connection errors, auth errors are critical
-        error_str = str(error).lower()
-        critical_keywords = ['connection', 'authentication', 'permission', 'not found']
-        
-        return any(keyword in error_str for keyword in critical_keywords)
+        return self._CRITICAL_ERROR_RE.search(str(error)) is not None
     
     async def _reflect_and_synthesize(
         self,
@@ -391,16 +670,6 @@ Respond with JSON plan."""
         # Format execution summary
         execution_summary = self._format_execution_summary(execution_results)
         
-        system_prompt = """You are a DevOps AI assistant. Synthesize the execution results into a clear, helpful response for the user.
-
-Focus on:
-1. Directly answering their question
-2. Highlighting key findings
-3. Suggesting next steps if relevant
-4. Being concise but informative
-
-Use markdown formatting for readability."""
-        
         synthesis_prompt = f"""Original request: {original_prompt}
 
 Execution results:
@@ -410,7 +679,7 @@ Synthesize these results into a clear response. If there were failures, explain
         
         response = await self.llm.generate(
             synthesis_prompt,
-            system=system_prompt,
+            system=_SYSTEM_SYNTH,
             temperature=0.7
         )
         
@@ -428,7 +697,10 @@ Synthesize these results into a clear response. If there were failures, explain
                 lines.append(f"   Error: {step.error}")
             elif step.result:
                 # Truncate long results
-                result_str = str(step.result)[:500]
+                if isinstance(step.result, str):
+                    result_str = step.result[:500]
+                else:
+                    result_str = _RESULT_REPR.repr(step.result)[:500]
                 lines.append(f"   Result: {result_str}")
         
         return '\n'.join(lines)
@@ -450,13 +722,8 @@ Synthesize these results into a clear response. If there were failures, explain
         
         # Check if this is a simple conversational query or requires tools
         if self._is_simple_query(user_message):
-            # Direct LLM response
-            response = await self.llm.generate(
-                user_message,
-                system="You are a helpful DevOps assistant.",
-                temperature=0.7
-            )
-            answer = response.content
+            # Direct LLM response with conversation context
+            answer = await self._respond_in_conversation()
         else:
             # Full agent loop
             answer = await self.process_prompt(user_message)
@@ -465,36 +732,122 @@ Synthesize these results into a clear response. If there were failures, explain
         self.conversation_history.append(
             LLMMessage(role='assistant', content=answer)
         )
-        
-        # Keep history manageable
-        if len(self.conversation_history) > 20:
-            self.conversation_history = self.conversation_history[-20:]
+        self._trim_history()
         
         return answer
     
-    def _is_simple_query(self, message: str) -> bool:
-        """Check if query is simple conversation (no tools needed)."""
-        message_lower = message.lower()
+    async def chat_turn_stream(self, user_message: str) -> AsyncIterator[str]:
+        """
+        Streaming variant of chat_turn (for REPL mode).
         
-        # Simple queries
-        simple_patterns = [
-            'what is', 'who is', 'how do you', 'can you explain',
-            'tell me about', 'what does', 'define', 'help'
-        ]
+        Conversational answers are yielded as the provider generates them;
+        tool-using requests run the full agent loop and yield its final
+        response in one chunk.
+        
+        Args:
+            user_message: User's message
+            
+        Yields:
+            Response text chunks
+        """
+        pending = LLMMessage(role='user', content=user_message)
+        self.conversation_history.append(pending)
+        
+        chunks: List[str] = []
+        
+        try:
+            if self._is_simple_query(user_message):
+                async for chunk in self.llm.chat_stream(
+                    self._conversation_messages(),
+                    system=_SYSTEM_DIRECT,
+                    temperature=0.7
+                ):
+                    chunks.append(chunk)
+                    yield chunk
+            else:
+                answer = await self.process_prompt(user_message)
+                chunks.append(answer)
+                yield answer
+        finally:
+            if chunks:
+                # Record whatever was produced, even if interrupted mid-stream
+                self.conversation_history.append(
+                    LLMMessage(role='assistant', content=''.join(chunks))
+                )
+                self._trim_history()
+            elif self.conversation_history and self.conversation_history[-1] is pending:
+                # Nothing came back (e.g. the provider failed): forget the
+                # turn rather than resend an empty assistant message forever
+                self.conversation_history.pop()
+    
+    def _trim_history(self):
+        """
+        Drop old turns once history exceeds HISTORY_WINDOW + HISTORY_BUFFER.
         
-        # Tool-requiring patterns
-        action_patterns = [
-            'check', 'show me', 'get', 'fetch', 'restart', 'deploy',
-            'status of', 'logs from', 'running on'
+        Trimming a whole buffer at once keeps the remaining messages a
+        stable prefix for the next HISTORY_BUFFER messages, instead of
+        shifting the prefix (and invalidating provider prompt caches) on
+        every turn.
+        """
+        if len(self.conversation_history) > self.HISTORY_WINDOW + self.HISTORY_BUFFER:
+            del self.conversation_history[:-self.HISTORY_WINDOW]
+            logger.debug("Trimmed conversation history")
+    
+    def _conversation_messages(self) -> List[LLMMessage]:
+        """History to send, with a cache breakpoint on the newest turn."""
+        latest = self.conversation_history[-1]
+        
+        # Earlier turns are sent unchanged so they remain a cached prefix
+        return [
+            *self.conversation_history[:-1],
+            LLMMessage(role=latest.role, content=latest.content, cache=True)
         ]
+    
+    async def _respond_in_conversation(self) -> str:
+        """Answer the latest user message using the conversation so far."""
+        response = await self.llm.chat(
+            self._conversation_messages(),
+            system=_SYSTEM_DIRECT,
+            temperature=0.7
+        )
+        return response.content
+    
+    async def _respond_directly(self, message: str) -> str:
+        """Answer a message with a single LLM call (no tools)."""
+        response = await self.llm.generate(
+            message,
+            system=_SYSTEM_DIRECT,
+            temperature=0.7
+        )
+        return response.content
+    
+    def _is_simple_query(self, message: str) -> bool:
+        """Check if query is simple conversation (no tools needed)."""
+        message_lower = message.lower()
         
-        has_simple = any(p in message_lower for p in simple_patterns)
-        has_action = any(p in message_lower for p in action_patterns)
+        has_simple = self._SIMPLE_QUERY_RE.search(message_lower) is not None
+        has_action = self._ACTION_QUERY_RE.search(message_lower) is not None
         
         # Simple if it's a knowledge question and not an action
         return has_simple and not has_action
     
+    def export_conversation(self) -> List[Dict[str, str]]:
+        """Conversation history as plain dicts (for saving sessions)."""
+        return [
+            {'role': msg.role, 'content': msg.content}
+            for msg in self.conversation_history
+        ]
+    
+    def import_conversation(self, messages: List[Dict[str, str]]):
+        """Replace conversation history with previously exported messages."""
+        self.conversation_history = [
+            LLMMessage(role=msg['role'], content=msg['content'])
+            for msg in messages
+        ]
+        self._trim_history()
+    
     def reset_conversation(self):
         """Reset conversation history."""
-        self.conversation_history = []
+        self.conversation_history.clear()
+        self._response_cache.clear()
         logger.info("Conversation history reset")
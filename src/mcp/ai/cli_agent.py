@@ -1,36 +1,84 @@
 """CLI mode for orbit-mcp AI agent - one-shot queries."""
 
 import asyncio
-from rich.console import Console
+import json
+import time
+from pathlib import Path
+from typing import Any, Dict, List, Optional
 from rich.markdown import Markdown
 from rich.panel import Panel
 from rich.spinner import Spinner
 from rich.live import Live
 
+from ..console import get_console
 from .agent import AIAgent
+from .response_cache import ResponseCache
 
+try:
+    import orjson
+except ImportError:  # pragma: no cover - optional speedup
+    orjson = None
 
-async def process_one_shot(agent: AIAgent, prompt: str) -> str:
+
+def _dumps(payload: Any, indent: bool = False) -> str:
+    """Encode JSON output (orjson when installed)."""
+    if orjson is not None:
+        option = orjson.OPT_NON_STR_KEYS | (orjson.OPT_INDENT_2 if indent else 0)
+        return orjson.dumps(payload, option=option).decode()
+    
+    return json.dumps(payload, indent=2 if indent else None)
+
+
+def _cache_namespace(agent: AIAgent) -> str:
+    """Cache namespace for the agent's active provider and model."""
+    llm = agent.llm
+    provider_name = getattr(llm, 'default_provider', '')
+    provider = getattr(llm, 'providers', {}).get(provider_name)
+    model = getattr(provider, 'model', '')
+    return f"{provider_name}:{model}"
+
+
+async def process_one_shot(
+    agent: AIAgent,
+    prompt: str,
+    cache: Optional[ResponseCache] = None
+) -> str:
     """
     Process a single prompt and return response.
     
     Args:
         agent: AI agent instance
         prompt: User prompt
+        cache: Optional persistent response cache
         
     Returns:
         Response text
     """
-    console = Console()
+    namespace = _cache_namespace(agent) if cache else ''
+    
+    if cache:
+        cached = cache.get(prompt, namespace)
+        if cached is not None:
+            return cached
+    
+    console = get_console()
     
     # Show progress
     with Live(Spinner("dots", text="[yellow]Processing...[/yellow]"), console=console):
         response = await agent.process_prompt(prompt)
     
+    if cache and agent.last_response_cacheable:
+        cache.put(prompt, response, namespace)
+    
     return response
 
 
-async def run_ai_cli(agent: AIAgent, prompt: str, output_format: str = 'markdown'):
+async def run_ai_cli(
+    agent: AIAgent,
+    prompt: str,
+    output_format: str = 'markdown',
+    use_cache: bool = True
+):
     """
     Run AI agent in CLI mode (one-shot).
     
@@ -38,11 +86,19 @@ async def run_ai_cli(agent: AIAgent, prompt: str, output_format: str = 'markdown
         agent: AI agent instance
         prompt: User prompt
         output_format: Output format (markdown, plain, json)
+        use_cache: Reuse recent responses to the same prompt
     """
-    console = Console()
+    console = get_console()
+    cache = None
     
     try:
-        response = await process_one_shot(agent, prompt)
+        if use_cache:
+            try:
+                cache = ResponseCache()
+            except Exception as e:
+                console.print(f"[dim]Response cache unavailable: {e}[/dim]")
+        
+        response = await process_one_shot(agent, prompt, cache)
         
         # Format output
         if output_format == 'markdown':
@@ -50,16 +106,15 @@ async def run_ai_cli(agent: AIAgent, prompt: str, output_format: str = 'markdown
             console.print(Panel(Markdown(response), title="Orbit AI Response", border_style="green"))
         
         elif output_format == 'plain':
-            console.print(response)
+            console.print(response, markup=False, highlight=False)
         
         elif output_format == 'json':
-            import json
             output = {
                 'prompt': prompt,
                 'response': response,
                 'status': 'success'
             }
-            console.print(json.dumps(output, indent=2))
+            console.print(_dumps(output, indent=True), markup=False, highlight=False)
         
         # Show cost if available
         if hasattr(agent.llm, 'cost_manager'):
@@ -70,10 +125,140 @@ async def run_ai_cli(agent: AIAgent, prompt: str, output_format: str = 'markdown
         console.print(f"[red]Error: {e}[/red]", style="bold")
         
         if output_format == 'json':
-            import json
             error_output = {
                 'prompt': prompt,
                 'error': str(e),
                 'status': 'error'
             }
-            console.print(json.dumps(error_output, indent=2))
+            console.print(_dumps(error_output, indent=True), markup=False, highlight=False)
+    
+    finally:
+        if cache:
+            cache.close()
+
+
+def _load_batch(in_path: Path, out_path: Path) -> List[Dict[str, Any]]:
+    """
+    Read batch prompts, skipping ids already completed in the output file.
+    
+    Each input line is a JSON object with a "prompt" and optional "id"
+    (defaults to the line number) or a bare JSON string.
+    
+    Raises:
+        ValueError: If an input line is not a JSON object or string, or
+            has no prompt (the message names the line)
+    """
+    done = set()
+    if out_path.exists():
+        with open(out_path) as f:
+            for line in f:
+                try:
+                    record = json.loads(line)
+                except json.JSONDecodeError:
+                    continue  # Truncated final line from an interrupted run
+                if isinstance(record, dict) and record.get('status') == 'success':
+                    done.add(str(record.get('id')))
+    
+    items = []
+    with open(in_path) as f:
+        for line_num, line in enumerate(f, 1):
+            if not line.strip():
+                continue
+            
+            try:
+                item = json.loads(line)
+            except json.JSONDecodeError as e:
+                raise ValueError(f"{in_path}:{line_num}: invalid JSON ({e.msg})") from None
+            
+            if isinstance(item, str):
+                item = {'prompt': item}
+            if not isinstance(item, dict) or 'prompt' not in item:
+                raise ValueError(
+                    f"{in_path}:{line_num}: expected a prompt string or an object with a \"prompt\""
+                )
+            item.setdefault('id', line_num)
+            
+            if str(item['id']) not in done:
+                items.append(item)
+    
+    return items
+
+
+async def run_ai_batch(
+    agent: AIAgent,
+    in_path: str,
+    out_path: str,
+    max_concurrency: int = 4,
+    rate_limit: Optional[float] = None
+):
+    """
+    Run AI agent over a JSONL file of prompts (batch mode).
+    
+    Prompts are processed concurrently and each result is appended to the
+    output file as soon as it completes, so an interrupted run can be
+    resumed by re-running the same command.
+    
+    Args:
+        agent: AI agent instance
+        in_path: Input JSONL path
+        out_path: Output JSONL path (appended to)
+        max_concurrency: Maximum prompts in flight
+        rate_limit: Maximum prompts started per minute (unlimited if None)
+    """
+    from rich.progress import Progress
+    
+    console = get_console()
+    out_file = Path(out_path)
+    
+    try:
+        items = _load_batch(Path(in_path), out_file)
+    except ValueError as e:
+        console.print(f"[red]Error: {e}[/red]", style="bold")
+        return
+    
+    if not items:
+        console.print("[green]Nothing to do - all prompts already completed[/green]")
+        return
+    
+    semaphore = asyncio.Semaphore(max_concurrency)
+    interval = 60.0 / rate_limit if rate_limit else 0.0
+    start_lock = asyncio.Lock()
+    next_start = time.monotonic()
+    failures = 0
+    
+    with open(out_file, 'a') as out, Progress(console=console) as progress:
+        task = progress.add_task("Processing prompts", total=len(items))
+        
+        async def run(item):
+            nonlocal next_start, failures
+            
+            async with semaphore:
+                if interval:
+                    # Space out starts to respect the provider rate limit
+                    async with start_lock:
+                        delay = next_start - time.monotonic()
+                        next_start = max(next_start, time.monotonic()) + interval
+                    if delay > 0:
+                        await asyncio.sleep(delay)
+                
+                record = {'id': item['id'], 'prompt': item['prompt']}
+                try:
+                    record['response'] = await agent.process_prompt(
+                        item['prompt'], item.get('context'), raise_errors=True
+                    )
+                    record['status'] = 'success'
+                except Exception as e:
+                    record['error'] = str(e)
+                    record['status'] = 'error'
+                    failures += 1
+                
+                out.write(_dumps(record) + '\n')
+                out.flush()
+                progress.advance(task)
+        
+        await asyncio.gather(*(run(item) for item in items))
+    
+    console.print(
+        f"[green]Completed {len(items) - failures}/{len(items)} prompts[/green]"
+        + (f" [red]({failures} failed - rerun to retry)[/red]" if failures else "")
+    )
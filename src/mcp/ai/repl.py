@@ -1,35 +1,37 @@
 """Interactive REPL mode for orbit-mcp AI agent."""
 
 import asyncio
+import json
+import os
+import re
 import sys
+from pathlib import Path
 from typing import Optional
-from rich.console import Console
 from rich.markdown import Markdown
 from rich.panel import Panel
 from rich.prompt import Prompt
 from rich.live import Live
 from rich.spinner import Spinner
 
+from ..console import get_console
 from .agent import AIAgent
 
+try:
+    from prompt_toolkit import PromptSession
+    from prompt_toolkit.completion import WordCompleter
+    from prompt_toolkit.formatted_text import HTML
+    from prompt_toolkit.history import FileHistory
+except ImportError:  # pragma: no cover - optional line editing
+    PromptSession = None
 
-class OrbitREPL:
-    """Interactive REPL for natural language DevOps interactions."""
-    
-    def __init__(self, agent: AIAgent):
-        """
-        Initialize REPL.
-        
-        Args:
-            agent: AI agent instance
-        """
-        self.agent = agent
-        self.console = Console()
-        self.running = False
-    
-    def print_welcome(self):
-        """Print welcome message."""
-        welcome = """# Welcome to Orbit AI ??
+HISTORY_PATH = Path.home() / '.orbit' / 'history'
+
+SESSIONS_DIR = Path.home() / '.orbit' / 'sessions'
+
+_SESSION_NAME_RE = re.compile(r'^[\w-][\w.-]*$')
+
+
+WELCOME_MD = """# Welcome to Orbit AI ??
 
 Your intelligent DevOps assistant powered by LLM.
 
@@ -39,6 +41,7 @@ Your intelligent DevOps assistant powered by LLM.
 - `/status` - Show usage statistics
 - `/reset` - Reset conversation
 - `/model <name>` - Switch LLM model
+- `/save <name>` - Save conversation
 - `/exit` or Ctrl+C - Exit
 
 **Examples:**
@@ -47,7 +50,96 @@ Your intelligent DevOps assistant powered by LLM.
 - "Why did the OpenSearch cluster fail?"
 - "List all running containers on staging"
 """
-        self.console.print(Panel(Markdown(welcome), title="Orbit AI", border_style="blue"))
+
+HELP_MD = """# Orbit AI Commands
+
+**Conversation:**
+- Just type your DevOps questions naturally
+- Context is maintained across messages in a session
+
+**Commands:**
+{commands}
+
+**Examples:**
+```
+Check if server prod-db-01 is running
+Show me nginx error logs from last hour
+What's the status of Kubernetes pods in staging?
+Explain why the OpenSearch cluster is red
+```
+"""
+
+STATUS_MD = """# Usage Statistics
+
+**Today:**
+- Cost: ${daily[cost]:.4f} / ${daily[limit]:.2f}
+- Tokens: {daily[tokens]:,}
+- Remaining: ${daily[remaining]:.2f}
+
+**This Month:**
+- Cost: ${monthly[cost]:.2f} / ${monthly[limit]:.2f}
+- Tokens: {monthly[tokens]:,}
+- Remaining: ${monthly[remaining]:.2f}
+
+**All Time:**
+- Total Cost: ${total[cost]:.2f}
+- Total Tokens: {total[tokens]:,}
+"""
+
+_WELCOME_PANEL = Panel(Markdown(WELCOME_MD), title="Orbit AI", border_style="blue")
+
+
+class OrbitREPL:
+    """Interactive REPL for natural language DevOps interactions."""
+    
+    # Rendered /help, built on first use
+    _help_markdown: Optional[Markdown] = None
+    
+    def __init__(self, agent: AIAgent, session_name: Optional[str] = None):
+        """
+        Initialize REPL.
+        
+        Args:
+            agent: AI agent instance
+            session_name: Named session to resume (if saved) and save on exit
+        """
+        self.agent = agent
+        self.console = get_console()
+        self.running = False
+        self.session = self._create_session()
+        self.session_name = session_name
+        
+        if session_name and self._session_path(session_name).exists():
+            self._load_session(session_name)
+    
+    @staticmethod
+    def _create_session():
+        """Create a prompt_toolkit session with history and command completion."""
+        # Piped input gets the plain prompt
+        if PromptSession is None or not sys.stdin.isatty():
+            return None
+        
+        HISTORY_PATH.parent.mkdir(parents=True, exist_ok=True)
+        return PromptSession(
+            history=FileHistory(str(HISTORY_PATH)),
+            completer=WordCompleter(list(OrbitREPL._COMMANDS), sentence=True)
+        )
+    
+    async def _read_input(self) -> str:
+        """Read a line without blocking the event loop."""
+        if self.session is not None:
+            return await self.session.prompt_async(
+                HTML('\n<ansicyan><b>You</b></ansicyan>: ')
+            )
+        
+        # Plain fallback: run the blocking prompt off the event loop
+        return await asyncio.to_thread(
+            Prompt.ask, "\n[bold cyan]You[/bold cyan]", console=self.console
+        )
+    
+    def print_welcome(self):
+        """Print welcome message."""
+        self.console.print(_WELCOME_PANEL)
     
     async def run(self):
         """Run interactive REPL loop."""
@@ -57,7 +149,7 @@ Your intelligent DevOps assistant powered by LLM.
         while self.running:
             try:
                 # Get user input
-                user_input = Prompt.ask("\n[bold cyan]You[/bold cyan]")
+                user_input = await self._read_input()
                 
                 if not user_input.strip():
                     continue
@@ -80,71 +172,60 @@ Your intelligent DevOps assistant powered by LLM.
             except Exception as e:
                 self.console.print(f"[red]Error: {e}[/red]")
         
+        if self.session_name:
+            self._save_session(self.session_name)
+        
         self.console.print("\n[cyan]Goodbye! ??[/cyan]")
     
     async def _process_input(self, user_input: str):
-        """Process user input through agent."""
-        # Show thinking indicator
-        with Live(Spinner("dots", text="[yellow]Thinking...[/yellow]"), console=self.console):
-            response = await self.agent.chat_turn(user_input)
-        
-        # Display response
+        """Process user input through agent, rendering the response as it streams."""
         self.console.print(f"\n[bold green]Orbit AI[/bold green]:")
-        self.console.print(Markdown(response))
+        
+        chunks = []
+        
+        # Thinking indicator until the first chunk arrives
+        with Live(
+            Spinner("dots", text="[yellow]Thinking...[/yellow]"),
+            console=self.console,
+            refresh_per_second=15
+        ) as live:
+            async for chunk in self.agent.chat_turn_stream(user_input):
+                chunks.append(chunk)
+                live.update(Markdown(''.join(chunks)))
     
     async def _handle_command(self, command: str):
         """Handle special commands."""
-        cmd = command.lower().strip()
-        
-        if cmd == '/help':
-            self._show_help()
-        
-        elif cmd == '/exit' or cmd == '/quit':
-            self.running = False
-        
-        elif cmd == '/reset':
-            self.agent.reset_conversation()
-            self.console.print("[green]? Conversation reset[/green]")
+        name, _, arg = command.strip().partition(' ')
+        handler = self._COMMANDS.get(name.lower())
         
-        elif cmd == '/status':
-            await self._show_status()
+        if handler is None:
+            self.console.print(f"[red]Unknown command: {name}[/red]")
+            self.console.print("[yellow]Type /help for available commands[/yellow]")
+            return
         
-        elif cmd.startswith('/model'):
-            parts = cmd.split(maxsplit=1)
-            if len(parts) > 1:
-                model = parts[1]
-                await self._switch_model(model)
-            else:
-                self._list_models()
+        result = handler(self, arg.strip())
+        if asyncio.iscoroutine(result):
+            await result
+    
+    def _command_help(self) -> str:
+        """Markdown list of commands, generated from the dispatch table."""
+        names_by_handler = {}
+        for name, handler in self._COMMANDS.items():
+            names_by_handler.setdefault(handler, []).append(f"`{name}`")
         
-        else:
-            self.console.print(f"[red]Unknown command: {cmd}[/red]")
-            self.console.print("[yellow]Type /help for available commands[/yellow]")
+        return "\n".join(
+            f"- {', '.join(names)} - {handler.__doc__.strip().rstrip('.')}"
+            for handler, names in names_by_handler.items()
+        )
     
     def _show_help(self):
         """Show help information."""
-        help_text = """# Orbit AI Commands
-
-**Conversation:**
-- Just type your DevOps questions naturally
-- Context is maintained across messages in a session
-
-**Commands:**
-- `/help` - Show this help
-- `/status` - Show usage and cost statistics
-- `/reset` - Start fresh conversation
-- `/model [name]` - Switch LLM model or list available models
-- `/exit` - Exit REPL
-
-**Examples:**
-```
-Check if server prod-db-01 is running
-Show me nginx error logs from last hour
-What's the status of Kubernetes pods in staging?
-Explain why the OpenSearch cluster is red
-```
-"""
-        self.console.print(Markdown(help_text))
+        # The command table is fixed, so the rendered help is built once
+        if OrbitREPL._help_markdown is None:
+            OrbitREPL._help_markdown = Markdown(
+                HELP_MD.format(commands=self._command_help())
+            )
+        self.console.print(OrbitREPL._help_markdown)
     
     async def _show_status(self):
         """Show usage statistics."""
@@ -152,23 +233,7 @@ Explain why the OpenSearch cluster is red
         if hasattr(self.agent.llm, 'cost_manager'):
             usage = self.agent.llm.cost_manager.get_usage_summary()
             
-            status = f"""# Usage Statistics
-
-**Today:**
-- Cost: ${usage['daily']['cost']:.4f} / ${usage['daily']['limit']:.2f}
-- Tokens: {usage['daily']['tokens']:,}
-- Remaining: ${usage['daily']['remaining']:.2f}
-
-**This Month:**
-- Cost: ${usage['monthly']['cost']:.2f} / ${usage['monthly']['limit']:.2f}
-- Tokens: {usage['monthly']['tokens']:,}
-- Remaining: ${usage['monthly']['remaining']:.2f}
-
-**All Time:**
-- Total Cost: ${usage['total']['cost']:.2f}
-- Total Tokens: {usage['total']['tokens']:,}
-"""
-            self.console.print(Markdown(status))
+            self.console.print(Markdown(STATUS_MD.format(**usage)))
         else:
             self.console.print("[yellow]Usage tracking not available[/yellow]")
     
@@ -192,14 +257,109 @@ Explain why the OpenSearch cluster is red
             self.console.print(f"[green]? Switched to: {model}[/green]")
         except Exception as e:
             self.console.print(f"[red]Failed to switch model: {e}[/red]")
+    
+    @staticmethod
+    def _session_path(name: str) -> Path:
+        """Path of a saved session file."""
+        if not _SESSION_NAME_RE.match(name):
+            raise ValueError(f"Invalid session name: {name}")
+        return SESSIONS_DIR / f"{name}.json"
+    
+    def _save_session(self, name: str):
+        """Save the conversation so a later REPL can resume it."""
+        try:
+            path = self._session_path(name)
+            path.parent.mkdir(parents=True, exist_ok=True)
+            
+            # Write-then-rename so an interrupted save never truncates a session
+            tmp_path = path.with_suffix('.tmp')
+            with open(tmp_path, 'w') as f:
+                json.dump({'messages': self.agent.export_conversation()}, f)
+            os.replace(tmp_path, path)
+            
+            self.console.print(f"[green]? Session saved: {name}[/green]")
+        except (OSError, ValueError) as e:
+            self.console.print(f"[red]Failed to save session: {e}[/red]")
+    
+    def _load_session(self, name: str):
+        """Restore a saved conversation."""
+        try:
+            with open(self._session_path(name)) as f:
+                data = json.load(f)
+            
+            self.agent.import_conversation(data.get('messages', []))
+            self.console.print(
+                f"[green]? Resumed session: {name} "
+                f"({len(self.agent.conversation_history)} messages)[/green]"
+            )
+        except (OSError, ValueError, KeyError, TypeError) as e:
+            self.console.print(f"[red]Failed to load session: {e}[/red]")
+    
+    # Command handlers: called with the text after the command name.
+    # Docstrings are shown by /help.
+    
+    def _cmd_help(self, arg: str):
+        """Show this help."""
+        self._show_help()
+    
+    async def _cmd_status(self, arg: str):
+        """Show usage and cost statistics."""
+        await self._show_status()
+    
+    def _cmd_reset(self, arg: str):
+        """Start fresh conversation."""
+        self.agent.reset_conversation()
+        self.console.print("[green]? Conversation reset[/green]")
+    
+    async def _cmd_model(self, arg: str):
+        """Switch LLM model (`/model <name>`) or list available models."""
+        if arg:
+            await self._switch_model(arg.lower())
+        else:
+            self._list_models()
+    
+    def _cmd_save(self, arg: str):
+        """Save conversation (`/save <name>`); it is also saved on exit."""
+        name = arg or self.session_name
+        if not name:
+            self.console.print("[yellow]Usage: /save <name>[/yellow]")
+            return
+        
+        self._save_session(name)
+        self.session_name = name
+    
+    def _cmd_load(self, arg: str):
+        """Resume a saved conversation (`/load <name>`)."""
+        if not arg:
+            self.console.print("[yellow]Usage: /load <name>[/yellow]")
+            return
+        
+        self._load_session(arg)
+        self.session_name = arg
+    
+    def _cmd_exit(self, arg: str):
+        """Exit REPL."""
+        self.running = False
+    
+    _COMMANDS = {
+        '/help': _cmd_help,
+        '/status': _cmd_status,
+        '/reset': _cmd_reset,
+        '/model': _cmd_model,
+        '/save': _cmd_save,
+        '/load': _cmd_load,
+        '/exit': _cmd_exit,
+        '/quit': _cmd_exit,
+    }
 
 
-async def start_repl(agent: AIAgent):
+async def start_repl(agent: AIAgent, session_name: Optional[str] = None):
     """
     Start interactive REPL.
     
     Args:
         agent: AI agent instance
+        session_name: Named session to resume and save on exit
     """
-    repl = OrbitREPL(agent)
+    repl = OrbitREPL(agent, session_name)
     await repl.run()
@@ -0,0 +1,132 @@
+"""Persistent response cache for one-shot AI queries."""
+
+import hashlib
+import logging
+import re
+import sqlite3
+import time
+from pathlib import Path
+from typing import Optional
+
+logger = logging.getLogger(__name__)
+
+_WHITESPACE_RE = re.compile(r'\s+')
+
+
+class ResponseCache:
+    """SQLite-backed cache of agent responses keyed by normalized prompt."""
+
+    def __init__(
+        self,
+        path: Optional[Path] = None,
+        ttl: float = 300.0,
+        max_entries: int = 256
+    ):
+        """
+        Initialize response cache.
+
+        Args:
+            path: SQLite database path (defaults to ~/.orbit/cache.db)
+            ttl: Seconds a cached response stays valid
+            max_entries: Maximum cached responses (least recently used are evicted)
+        """
+        self.path = Path(path) if path else Path.home() / '.orbit' / 'cache.db'
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self.ttl = ttl
+        self.max_entries = max_entries
+
+        self._conn = sqlite3.connect(str(self.path))
+        self._conn.execute(
+            """CREATE TABLE IF NOT EXISTS responses (
+                key TEXT PRIMARY KEY,
+                prompt TEXT NOT NULL,
+                response TEXT NOT NULL,
+                created REAL NOT NULL,
+                last_used REAL NOT NULL
+            )"""
+        )
+        self._conn.commit()
+
+    @staticmethod
+    def normalize(prompt: str) -> str:
+        """
+        Normalize a prompt so trivially different phrasings share an entry.
+
+        Surrounding whitespace, repeated whitespace and trailing
+        punctuation are ignored. Case is kept: container and host names
+        are case-sensitive.
+        """
+        normalized = _WHITESPACE_RE.sub(' ', prompt).strip()
+        return normalized.rstrip('?.! ')
+
+    def _key(self, prompt: str, namespace: str) -> str:
+        """Cache key for a prompt within a namespace (e.g. provider)."""
+        payload = f"{namespace}\0{self.normalize(prompt)}".encode()
+        return hashlib.blake2b(payload, digest_size=16).hexdigest()
+
+    def get(self, prompt: str, namespace: str = '') -> Optional[str]:
+        """
+        Look up a cached response.
+
+        Args:
+            prompt: User prompt
+            namespace: Cache namespace (e.g. provider name)
+
+        Returns:
+            Cached response, or None on miss/expiry
+        """
+        key = self._key(prompt, namespace)
+        now = time.time()
+
+        row = self._conn.execute(
+            "SELECT response, created FROM responses WHERE key = ?", (key,)
+        ).fetchone()
+
+        if row is None:
+            return None
+
+        response, created = row
+        if now - created > self.ttl:
+            self._conn.execute("DELETE FROM responses WHERE key = ?", (key,))
+            self._conn.commit()
+            return None
+
+        self._conn.execute(
+            "UPDATE responses SET last_used = ? WHERE key = ?", (now, key)
+        )
+        self._conn.commit()
+
+        logger.info("Response cache hit")
+        return response
+
+    def put(self, prompt: str, response: str, namespace: str = ''):
+        """
+        Store a response, evicting least recently used entries if needed.
+
+        Args:
+            prompt: User prompt
+            response: Agent response
+            namespace: Cache namespace (e.g. provider name)
+        """
+        now = time.time()
+
+        self._conn.execute(
+            "INSERT OR REPLACE INTO responses (key, prompt, response, created, last_used) "
+            "VALUES (?, ?, ?, ?, ?)",
+            (self._key(prompt, namespace), prompt, response, now, now)
+        )
+        self._conn.execute(
+            "DELETE FROM responses WHERE key NOT IN "
+            "(SELECT key FROM responses ORDER BY last_used DESC, rowid DESC LIMIT ?)",
+            (self.max_entries,)
+        )
+        self._conn.commit()
+
+    def clear(self):
+        """Remove all cached responses."""
+        self._conn.execute("DELETE FROM responses")
+        self._conn.commit()
+
+    def close(self):
+        """Close the underlying database."""
+        self._conn.close()
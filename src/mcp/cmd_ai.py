@@ -0,0 +1,284 @@
+"""AI agent commands."""
+
+import click
+
+from .cli import console, _run
+
+
+@click.group()
+def ai():
+    """AI-powered DevOps assistant commands."""
+    pass
+
+
+def _create_agent(ctx, provider=None):
+    """
+    Build an AI agent from the LLM configuration.
+    
+    Returns:
+        AIAgent, or None if AI features are unavailable or the provider
+        is not configured (an error has been printed)
+    """
+    try:
+        from .llm.providers import LLMClient
+        from .ai.agent import AIAgent
+    except ImportError as e:
+        console.print(f"[red]AI features not available: {e}[/red]")
+        console.print("[yellow]Install AI dependencies: pip install openai anthropic[/yellow]")
+        return None
+    
+    # Initialize AI agent
+    config_mgr = ctx.obj['config']
+    llm_config = config_mgr.config.get('llm', {})
+    
+    if not llm_config:
+        console.print("[yellow]No LLM configuration found. Using defaults.[/yellow]")
+        llm_config = {
+            'default_provider': 'ollama',
+            'providers': {
+                'ollama': {'enabled': True, 'model': 'llama2'}
+            }
+        }
+    
+    llm_client = LLMClient(llm_config)
+    
+    # Build tool registry
+    tool_registry = _build_tool_registry(ctx.obj)
+    
+    agent = AIAgent(llm_client, tool_registry)
+    
+    # Override provider if specified
+    if provider:
+        try:
+            llm_client.set_default_provider(provider)
+        except ValueError as e:
+            console.print(f"[red]Error: {e}[/red]")
+            return None
+    
+    return agent
+
+
+def _run_agent(agent, coro):
+    """Run an agent coroutine, then close the LLM providers' pooled connections."""
+    async def run():
+        try:
+            return await coro
+        finally:
+            await agent.llm.aclose()
+    
+    return _run(run())
+
+
+@ai.command()
+@click.argument('prompt', nargs=-1, required=False)
+@click.option('--provider', '-p', help='LLM provider (openai, anthropic, ollama)')
+@click.option('--format', '-f', type=click.Choice(['markdown', 'plain', 'json']), default='markdown',
+              help='Output format')
+@click.option('--no-cache', is_flag=True, help='Bypass the response cache')
+@click.pass_context
+def ask(ctx, prompt, provider, format, no_cache):
+    """
+    Ask the AI agent a question (one-shot mode).
+    
+    Examples:
+        mcp ai ask "Check status of server prod-web-01"
+        mcp ai ask "Why did the OpenSearch cluster fail?"
+    """
+    if not prompt:
+        console.print("[red]Error: Please provide a prompt[/red]")
+        console.print("[yellow]Example: mcp ai ask \"Check server status\"[/yellow]")
+        return
+    
+    prompt_text = ' '.join(prompt)
+    
+    # Import AI components
+    try:
+        from .ai.cli_agent import run_ai_cli
+    except ImportError as e:
+        console.print(f"[red]AI features not available: {e}[/red]")
+        console.print("[yellow]Install AI dependencies: pip install openai anthropic[/yellow]")
+        return
+    
+    agent = _create_agent(ctx, provider)
+    if agent is None:
+        return
+    
+    # Run agent
+    _run_agent(agent, run_ai_cli(agent, prompt_text, format, use_cache=not no_cache))
+
+
+@ai.command()
+@click.option('--provider', '-p', help='LLM provider (openai, anthropic, ollama)')
+@click.option('--session', '-s', help='Named session to resume and save on exit')
+@click.pass_context
+def chat(ctx, provider, session):
+    """
+    Start interactive AI chat (REPL mode).
+    
+    Examples:
+        mcp ai chat
+        mcp ai chat --provider anthropic
+        mcp ai chat --session incident-42
+    """
+    # Import AI components
+    try:
+        from .ai.repl import start_repl
+    except ImportError as e:
+        console.print(f"[red]AI features not available: {e}[/red]")
+        console.print("[yellow]Install AI dependencies: pip install openai anthropic[/yellow]")
+        return
+    
+    agent = _create_agent(ctx, provider)
+    if agent is None:
+        return
+    
+    # Start REPL
+    _run_agent(agent, start_repl(agent, session))
+
+
+@ai.command()
+@click.argument('session')
+@click.option('--provider', '-p', help='LLM provider (openai, anthropic, ollama)')
+@click.pass_context
+def resume(ctx, session, provider):
+    """
+    Resume a saved AI chat session.
+    
+    Examples:
+        mcp ai resume incident-42
+    """
+    ctx.invoke(chat, provider=provider, session=session)
+
+
+@ai.command()
+@click.option('--in', 'in_path', required=True, type=click.Path(exists=True, dir_okay=False),
+              help='JSONL file of prompts ({"id": ..., "prompt": ...} per line)')
+@click.option('--out', 'out_path', required=True, type=click.Path(dir_okay=False),
+              help='JSONL file to append results to (completed ids are skipped on rerun)')
+@click.option('--provider', '-p', help='LLM provider (openai, anthropic, ollama)')
+@click.option('--concurrency', default=4, show_default=True, help='Prompts processed at once')
+@click.option('--rate-limit', type=float, help='Maximum prompts started per minute')
+@click.pass_context
+def batch(ctx, in_path, out_path, provider, concurrency, rate_limit):
+    """
+    Process a file of prompts concurrently.
+    
+    Examples:
+        mcp ai batch --in prompts.jsonl --out results.jsonl
+        mcp ai batch --in prompts.jsonl --out results.jsonl --concurrency 8 --rate-limit 60
+    """
+    # Import AI components
+    try:
+        from .ai.cli_agent import run_ai_batch
+    except ImportError as e:
+        console.print(f"[red]AI features not available: {e}[/red]")
+        console.print("[yellow]Install AI dependencies: pip install openai anthropic[/yellow]")
+        return
+    
+    agent = _create_agent(ctx, provider)
+    if agent is None:
+        return
+    
+    _run_agent(agent, run_ai_batch(agent, in_path, out_path, concurrency, rate_limit))
+
+
+@ai.command()
+@click.pass_context
+def models(ctx):
+    """List available LLM models."""
+    try:
+        from .llm.providers import LLMClient
+    except ImportError as e:
+        console.print(f"[red]AI features not available: {e}[/red]")
+        return
+    
+    config_mgr = ctx.obj['config']
+    llm_config = config_mgr.config.get('llm', {})
+    
+    if not llm_config:
+        console.print("[yellow]No LLM configuration found.[/yellow]")
+        return
+    
+    llm_client = LLMClient(llm_config)
+    
+    from rich.table import Table
+    
+    table = Table(title="Available LLM Models")
+    table.add_column("Provider", style="cyan")
+    table.add_column("Status", style="green")
+    table.add_column("Default", style="yellow")
+    
+    default = llm_client.get_default_provider()
+    
+    for provider in llm_client.list_providers():
+        is_default = "?" if provider == default else ""
+        table.add_row(provider, "? Available", is_default)
+    
+    console.print(table)
+
+
+@ai.command()
+@click.pass_context
+def usage(ctx):
+    """Show AI usage statistics and costs."""
+    try:
+        from .llm.providers import LLMClient
+        from .llm.cost_manager import CostManager
+    except ImportError as e:
+        console.print(f"[red]AI features not available: {e}[/red]")
+        return
+    
+    config_mgr = ctx.obj['config']
+    llm_config = config_mgr.config.get('llm', {})
+    cost_config = llm_config.get('cost_control', {
+        'daily_budget': 10.0,
+        'monthly_budget': 200.0
+    })
+    
+    cost_mgr = CostManager(cost_config)
+    summary = cost_mgr.get_usage_summary()
+    
+    console.print("\n[bold]AI Usage Statistics[/bold]\n")
+    
+    # Daily
+    console.print("[cyan]Today:[/cyan]")
+    console.print(f"  Cost:      ${summary['daily']['cost']:.4f} / ${summary['daily']['limit']:.2f}")
+    console.print(f"  Tokens:    {summary['daily']['tokens']:,}")
+    console.print(f"  Remaining: ${summary['daily']['remaining']:.2f}\n")
+    
+    # Monthly
+    console.print("[cyan]This Month:[/cyan]")
+    console.print(f"  Cost:      ${summary['monthly']['cost']:.2f} / ${summary['monthly']['limit']:.2f}")
+    console.print(f"  Tokens:    {summary['monthly']['tokens']:,}")
+    console.print(f"  Remaining: ${summary['monthly']['remaining']:.2f}\n")
+    
+    # Total
+    console.print("[cyan]All Time:[/cyan]")
+    console.print(f"  Total Cost:   ${summary['total']['cost']:.2f}")
+    console.print(f"  Total Tokens: {summary['total']['tokens']:,}\n")
+
+
+def _build_tool_registry(managers: dict) -> dict:
+    """Build tool registry for AI agent."""
+    ssh_mgr = managers['ssh']
+    docker_mgr = managers['docker']
+    k8s_mgr = managers['k8s']
+    config_mgr = managers['config']
+    
+    # Map tools to their handlers
+    # This is a simplified version - full implementation would include all tools
+    return {
+        'ssh.execute': {
+            'description': 'Execute command on remote server via SSH',
+            'handler': ssh_mgr.execute_command
+        },
+        'docker.list': {
+            'description': 'List Docker containers',
+            'handler': docker_mgr.list_containers
+        },
+        'k8s.get_pods': {
+            'description': 'List Kubernetes pods',
+            'handler': k8s_mgr.list_pods
+        },
+        # Add more tools as needed
+    }
@@ -0,0 +1,107 @@
+"""Configuration commands."""
+
+import click
+
+from .cli import console
+
+
+@click.group()
+def config():
+    """Manage MCP configuration."""
+    pass
+
+
+@config.command('init')
+@click.pass_context
+def config_init(ctx):
+    """Initialize MCP configuration."""
+    config_mgr = ctx.obj['config']
+    console.print("[green]MCP configuration initialized successfully![/green]")
+    console.print(f"Configuration file: {config_mgr.config_path}")
+
+
+@config.command('list')
+@click.pass_context
+def config_list(ctx):
+    """List all configured profiles."""
+    config_mgr = ctx.obj['config']
+    profiles = config_mgr.list_profiles()
+    
+    console.print("\n[bold]Configured Profiles:[/bold]\n")
+    
+    if profiles['ssh_servers']:
+        console.print("[cyan]SSH Servers:[/cyan]")
+        for server in profiles['ssh_servers']:
+            console.print(f"  ? {server}")
+    
+    if profiles['docker_hosts']:
+        console.print("\n[cyan]Docker Hosts:[/cyan]")
+        for host in profiles['docker_hosts']:
+            console.print(f"  ? {host}")
+    
+    if profiles['k8s_clusters']:
+        console.print("\n[cyan]Kubernetes Clusters:[/cyan]")
+        for cluster in profiles['k8s_clusters']:
+            console.print(f"  ? {cluster}")
+    
+    if profiles['aliases']:
+        console.print("\n[cyan]Aliases:[/cyan]")
+        for alias in profiles['aliases']:
+            console.print(f"  ? {alias}")
+
+
+@config.command('add-ssh')
+@click.argument('name')
+@click.argument('host')
+@click.argument('user')
+@click.option('--port', default=22, help='SSH port')
+@click.option('--key', help='Path to SSH private key')
+@click.option('--password', help='SSH password (not recommended)')
+@click.pass_context
+def config_add_ssh(ctx, name, host, user, port, key, password):
+    """Add SSH server configuration."""
+    config_mgr = ctx.obj['config']
+    config_mgr.add_ssh_server(name, host, user, key, password, port)
+    console.print(f"[green]Added SSH server: {name}[/green]")
+
+
+@config.command('add-docker')
+@click.argument('name')
+@click.argument('host')
+@click.option('--ssh-server', help='SSH server profile to use for connection')
+@click.pass_context
+def config_add_docker(ctx, name, host, ssh_server):
+    """Add Docker host configuration."""
+    config_mgr = ctx.obj['config']
+    ssh_config = None
+    if ssh_server:
+        ssh_config = config_mgr.get_ssh_server(ssh_server)
+        if not ssh_config:
+            console.print(f"[red]SSH server not found: {ssh_server}[/red]")
+            return
+    
+    config_mgr.add_docker_host(name, host, "ssh", ssh_config)
+    console.print(f"[green]Added Docker host: {name}[/green]")
+
+
+@config.command('add-k8s')
+@click.argument('name')
+@click.argument('kubeconfig')
+@click.option('--context', help='Kubernetes context to use')
+@click.pass_context
+def config_add_k8s(ctx, name, kubeconfig, context):
+    """Add Kubernetes cluster configuration."""
+    config_mgr = ctx.obj['config']
+    config_mgr.add_k8s_cluster(name, kubeconfig, context)
+    console.print(f"[green]Added Kubernetes cluster: {name}[/green]")
+
+
+@config.command('add-alias')
+@click.argument('name')
+@click.argument('command')
+@click.pass_context
+def config_add_alias(ctx, name, command):
+    """Add command alias."""
+    config_mgr = ctx.obj['config']
+    config_mgr.add_alias(name, command)
+    console.print(f"[green]Added alias: {name}[/green]")
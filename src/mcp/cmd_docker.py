@@ -0,0 +1,120 @@
+"""Docker commands."""
+
+import sys
+
+import click
+
+from .cli import console, _print_table, _write_stream
+
+
+@click.group()
+def docker():
+    """Docker operations."""
+    pass
+
+
+@docker.command('ps')
+@click.option('--host', help='Docker host name from config')
+@click.option('--all', '-a', is_flag=True, help='Show all containers')
+@click.pass_context
+def docker_ps(ctx, host, all):
+    """List Docker containers."""
+    docker_mgr = ctx.obj['docker']
+    
+    try:
+        if host:
+            config_mgr = ctx.obj['config']
+            host_config = config_mgr.get_docker_host(host)
+            if not host_config:
+                console.print(f"[red]Docker host not found: {host}[/red]")
+                return
+            # For remote, we'd need to implement SSH tunnel or remote connection
+            client = None
+        else:
+            client = None
+        
+        # Rows are produced as containers are inspected, so piped TSV
+        # output starts before the whole list has been fetched
+        rows = (
+            (container.id, container.name, container.status, container.image)
+            for container in docker_mgr.iter_containers(client, all)
+        )
+        
+        _print_table(
+            "Docker Containers",
+            (("ID", "cyan"), ("Name", "green"), ("Status", "yellow"), ("Image", "blue")),
+            rows
+        )
+        
+    except Exception as e:
+        console.print(f"[red]Error: {e}[/red]")
+        sys.exit(1)
+
+
+@docker.command('logs')
+@click.argument('container')
+@click.option('--tail', '-n', default=100, help='Number of lines to show')
+@click.option('--follow', '-f', is_flag=True, help='Follow log output')
+@click.pass_context
+def docker_logs(ctx, container, tail, follow):
+    """Get Docker container logs."""
+    docker_mgr = ctx.obj['docker']
+    
+    try:
+        console.print(f"[dim]Fetching logs for {container}...[/dim]\n")
+        
+        _write_stream(
+            docker_mgr.stream_container_logs(container, tail=tail, follow=follow),
+            follow
+        )
+        
+    except KeyboardInterrupt:
+        console.print("\n[yellow]Stopped following logs[/yellow]")
+    except Exception as e:
+        console.print(f"[red]Error: {e}[/red]")
+        sys.exit(1)
+
+
+@docker.command('start')
+@click.argument('container')
+@click.pass_context
+def docker_start(ctx, container):
+    """Start Docker container."""
+    docker_mgr = ctx.obj['docker']
+    
+    try:
+        docker_mgr.start_container(container)
+        console.print(f"[green]Started container: {container}[/green]")
+    except Exception as e:
+        console.print(f"[red]Error: {e}[/red]")
+        sys.exit(1)
+
+
+@docker.command('stop')
+@click.argument('container')
+@click.pass_context
+def docker_stop(ctx, container):
+    """Stop Docker container."""
+    docker_mgr = ctx.obj['docker']
+    
+    try:
+        docker_mgr.stop_container(container)
+        console.print(f"[green]Stopped container: {container}[/green]")
+    except Exception as e:
+        console.print(f"[red]Error: {e}[/red]")
+        sys.exit(1)
+
+
+@docker.command('restart')
+@click.argument('container')
+@click.pass_context
+def docker_restart(ctx, container):
+    """Restart Docker container."""
+    docker_mgr = ctx.obj['docker']
+    
+    try:
+        docker_mgr.restart_container(container)
+        console.print(f"[green]Restarted container: {container}[/green]")
+    except Exception as e:
+        console.print(f"[red]Error: {e}[/red]")
+        sys.exit(1)
@@ -0,0 +1,293 @@
+"""Kubernetes commands."""
+
+import asyncio
+import sys
+
+import click
+
+from .cli import console, _print_table, _run, _split_names, _write_stream
+
+_POD_COLUMNS = (
+    ("Name", "cyan"),
+    ("Status", "green"),
+    ("Node", "yellow"),
+    ("IP", "blue"),
+    ("Containers", "magenta"),
+)
+
+
+def _pod_row(pod: dict) -> tuple:
+    """Table row for a pod from KubernetesManager.list_pods."""
+    return (
+        pod['name'],
+        pod['status'],
+        pod['node'] or 'N/A',
+        pod['ip'] or 'N/A',
+        str(pod['containers'])
+    )
+
+
+@click.group()
+def k8s():
+    """Kubernetes operations."""
+    pass
+
+
+@k8s.command('contexts')
+@click.option('--kubeconfig', help='Path to kubeconfig file')
+@click.pass_context
+def k8s_contexts(ctx, kubeconfig):
+    """List Kubernetes contexts."""
+    k8s_mgr = ctx.obj['k8s']
+    
+    try:
+        contexts = k8s_mgr.list_contexts(kubeconfig)
+        console.print("\n[bold]Available Contexts:[/bold]\n")
+        for context in contexts:
+            console.print(f"  ? {context}")
+        console.print()
+    except Exception as e:
+        console.print(f"[red]Error: {e}[/red]")
+        sys.exit(1)
+
+
+@k8s.command('use')
+@click.argument('cluster')
+@click.pass_context
+def k8s_use(ctx, cluster):
+    """Switch to Kubernetes cluster."""
+    config_mgr = ctx.obj['config']
+    k8s_mgr = ctx.obj['k8s']
+    
+    cluster_config = config_mgr.get_k8s_cluster(cluster)
+    if not cluster_config:
+        console.print(f"[red]Cluster not found: {cluster}[/red]")
+        return
+    
+    try:
+        context = k8s_mgr.load_kubeconfig(
+            cluster_config['kubeconfig_path'],
+            cluster_config.get('context')
+        )
+        console.print(f"[green]Switched to cluster: {cluster} (context: {context})[/green]")
+    except Exception as e:
+        console.print(f"[red]Error: {e}[/red]")
+        sys.exit(1)
+
+
+def _list_pods_many(cluster_configs: dict, namespace: str) -> dict:
+    """
+    List pods on several clusters concurrently.
+    
+    Returns:
+        Cluster name -> list of pods, or the exception raised for it
+    """
+    from .k8s_manager import KubernetesManager
+    
+    # Kubeconfigs are loaded up front; each manager gets its own API client
+    managers = {}
+    for name, cluster_config in cluster_configs.items():
+        k8s_mgr = KubernetesManager()
+        k8s_mgr.load_kubeconfig(
+            cluster_config['kubeconfig_path'],
+            cluster_config.get('context')
+        )
+        managers[name] = k8s_mgr
+    
+    async def gather():
+        return await asyncio.gather(
+            *(asyncio.to_thread(k8s_mgr.list_pods, namespace) for k8s_mgr in managers.values()),
+            return_exceptions=True
+        )
+    
+    return dict(zip(managers, _run(gather())))
+
+
+@k8s.command('pods')
+@click.option('--namespace', '-n', default='default', help='Kubernetes namespace')
+@click.option('--cluster', help='Cluster name from config (comma-separated for several)')
+@click.option('--all-namespaces', '-A', is_flag=True, help='List pods in every namespace')
+@click.pass_context
+def k8s_pods(ctx, namespace, cluster, all_namespaces):
+    """List pods in namespace."""
+    if cluster and ',' in cluster:
+        config_mgr = ctx.obj['config']
+        cluster_configs = {}
+        for name in _split_names(cluster):
+            cluster_config = config_mgr.get_k8s_cluster(name)
+            if not cluster_config:
+                console.print(f"[red]Cluster not found: {name}[/red]")
+                return
+            cluster_configs[name] = cluster_config
+        
+        try:
+            results = _list_pods_many(cluster_configs, namespace)
+        except Exception as e:
+            console.print(f"[red]Error: {e}[/red]")
+            sys.exit(1)
+        
+        rows = []
+        failed = False
+        for name, pods in results.items():
+            if isinstance(pods, Exception):
+                console.print(f"[red]Error on {name}: {pods}[/red]")
+                failed = True
+                continue
+            
+            rows.extend((name, *_pod_row(pod)) for pod in pods)
+        
+        _print_table(f"Pods in {namespace}", (("Cluster", "cyan"), *_POD_COLUMNS), rows)
+        if failed:
+            sys.exit(1)
+        return
+    
+    k8s_mgr = ctx.obj['k8s']
+    
+    if cluster:
+        config_mgr = ctx.obj['config']
+        cluster_config = config_mgr.get_k8s_cluster(cluster)
+        if not cluster_config:
+            console.print(f"[red]Cluster not found: {cluster}[/red]")
+            return
+        k8s_mgr.load_kubeconfig(
+            cluster_config['kubeconfig_path'],
+            cluster_config.get('context')
+        )
+    
+    try:
+        if all_namespaces:
+            # One cluster-wide query rather than one per namespace
+            pods = k8s_mgr.list_pods_all_namespaces()
+            _print_table("Pods in all namespaces", (("Namespace", "cyan"), *_POD_COLUMNS),
+                         [(pod['namespace'], *_pod_row(pod)) for pod in pods])
+            return
+        
+        pods = k8s_mgr.list_pods(namespace)
+        
+        _print_table(f"Pods in {namespace}", _POD_COLUMNS, [_pod_row(pod) for pod in pods])
+        
+    except Exception as e:
+        console.print(f"[red]Error: {e}[/red]")
+        sys.exit(1)
+
+
+@k8s.command('logs')
+@click.argument('pod')
+@click.option('--namespace', '-n', default='default', help='Kubernetes namespace')
+@click.option('--container', '-c', help='Container name')
+@click.option('--tail', default=100, help='Number of lines')
+@click.option('--follow', '-f', is_flag=True, help='Follow log output')
+@click.pass_context
+def k8s_logs(ctx, pod, namespace, container, tail, follow):
+    """Get pod logs."""
+    k8s_mgr = ctx.obj['k8s']
+    
+    try:
+        console.print(f"[dim]Fetching logs for {pod}...[/dim]\n")
+        
+        logs = k8s_mgr.get_pod_logs(pod, namespace, container, tail, follow)
+        # Following yields raw byte chunks; otherwise the full log text
+        _write_stream(logs if follow else [logs], follow)
+        
+    except KeyboardInterrupt:
+        console.print("\n[yellow]Stopped following logs[/yellow]")
+    except Exception as e:
+        console.print(f"[red]Error: {e}[/red]")
+        sys.exit(1)
+
+
+@k8s.command('services')
+@click.option('--namespace', '-n', default='default', help='Kubernetes namespace')
+@click.pass_context
+def k8s_services(ctx, namespace):
+    """List services in namespace."""
+    k8s_mgr = ctx.obj['k8s']
+    
+    try:
+        services = k8s_mgr.list_services(namespace)
+        
+        rows = [
+            (
+                svc['name'],
+                svc['type'],
+                svc['cluster_ip'] or 'None',
+                ", ".join(f"{p['port']}/{p['protocol']}" for p in svc['ports'])
+            )
+            for svc in services
+        ]
+        
+        _print_table(
+            f"Services in {namespace}",
+            (("Name", "cyan"), ("Type", "green"), ("Cluster IP", "yellow"), ("Ports", "blue")),
+            rows
+        )
+        
+    except Exception as e:
+        console.print(f"[red]Error: {e}[/red]")
+        sys.exit(1)
+
+
+@k8s.command('deployments')
+@click.option('--namespace', '-n', default='default', help='Kubernetes namespace')
+@click.pass_context
+def k8s_deployments(ctx, namespace):
+    """List deployments in namespace."""
+    k8s_mgr = ctx.obj['k8s']
+    
+    try:
+        deployments = k8s_mgr.list_deployments(namespace)
+        
+        rows = [
+            (
+                deploy['name'],
+                str(deploy['replicas']),
+                str(deploy['ready_replicas']),
+                str(deploy['available_replicas']),
+                str(deploy['updated_replicas'])
+            )
+            for deploy in deployments
+        ]
+        
+        _print_table(
+            f"Deployments in {namespace}",
+            (("Name", "cyan"), ("Desired", "green"), ("Ready", "yellow"),
+             ("Available", "blue"), ("Updated", "magenta")),
+            rows
+        )
+        
+    except Exception as e:
+        console.print(f"[red]Error: {e}[/red]")
+        sys.exit(1)
+
+
+@k8s.command('scale')
+@click.argument('deployment')
+@click.argument('replicas', type=int)
+@click.option('--namespace', '-n', default='default', help='Kubernetes namespace')
+@click.pass_context
+def k8s_scale(ctx, deployment, replicas, namespace):
+    """Scale deployment."""
+    k8s_mgr = ctx.obj['k8s']
+    
+    try:
+        k8s_mgr.scale_deployment(deployment, replicas, namespace)
+        console.print(f"[green]Scaled {deployment} to {replicas} replicas[/green]")
+    except Exception as e:
+        console.print(f"[red]Error: {e}[/red]")
+        sys.exit(1)
+
+
+@k8s.command('restart')
+@click.argument('deployment')
+@click.option('--namespace', '-n', default='default', help='Kubernetes namespace')
+@click.pass_context
+def k8s_restart(ctx, deployment, namespace):
+    """Restart deployment."""
+    k8s_mgr = ctx.obj['k8s']
+    
+    try:
+        k8s_mgr.restart_deployment(deployment, namespace)
+        console.print(f"[green]Restarted deployment: {deployment}[/green]")
+    except Exception as e:
+        console.print(f"[red]Error: {e}[/red]")
+        sys.exit(1)
@@ -0,0 +1,157 @@
+"""SSH commands."""
+
+import sys
+
+import click
+
+from .cli import console, _split_names, _write_stream
+
+
+@click.group()
+@click.option('--no-pool', is_flag=True, help='Open a fresh connection for every command')
+@click.pass_context
+def ssh(ctx, no_pool):
+    """SSH operations."""
+    if no_pool:
+        from .ssh_manager import SSHManager
+        ctx.obj['ssh'] = SSHManager(pool=False)
+
+
+def _ssh_connect(ssh_mgr, server_config: dict):
+    """Connect to a server described by an SSH profile."""
+    return ssh_mgr.connect(
+        server_config['host'],
+        server_config['user'],
+        server_config.get('port', 22),
+        server_config.get('key_path'),
+        server_config.get('password')
+    )
+
+
+def _ssh_exec_many(ssh_mgr, server_configs: dict, command: str) -> bool:
+    """
+    Run a command on several servers concurrently and print a summary table.
+    
+    Returns:
+        True if the command succeeded everywhere
+    """
+    from concurrent.futures import ThreadPoolExecutor
+    from rich.markup import escape
+    from rich.table import Table
+    from rich.text import Text
+    
+    def run(name):
+        try:
+            client = _ssh_connect(ssh_mgr, server_configs[name])
+            return ssh_mgr.execute_command(client, command)
+        except Exception as e:
+            return '', str(e), -1
+    
+    # Wall-clock is the slowest host rather than the sum over hosts
+    with ThreadPoolExecutor(max_workers=min(len(server_configs), 32)) as pool:
+        results = list(pool.map(run, server_configs))
+    
+    table = Table(title=f"Results: {escape(command)}")
+    table.add_column("Server", style="cyan")
+    table.add_column("Exit", style="yellow")
+    table.add_column("Output")
+    
+    for name, (stdout, stderr, exit_code) in zip(server_configs, results):
+        # Text, not markup: remote output may contain [brackets]
+        if exit_code == 0:
+            output = Text(stdout.rstrip())
+        else:
+            output = Text((stderr or stdout).rstrip(), style="red")
+        table.add_row(Text(name), str(exit_code), output)
+    
+    console.print(table)
+    return all(exit_code == 0 for _, _, exit_code in results)
+
+
+@ssh.command('exec')
+@click.argument('server')
+@click.argument('command')
+@click.pass_context
+def ssh_exec(ctx, server, command):
+    """
+    Execute command on remote server.
+    
+    SERVER may be a comma-separated list of profiles to run on all of them
+    concurrently.
+    """
+    config_mgr = ctx.obj['config']
+    ssh_mgr = ctx.obj['ssh']
+    
+    # Get server config
+    server_configs = {}
+    for name in _split_names(server):
+        server_config = config_mgr.get_ssh_server(name)
+        if not server_config:
+            console.print(f"[red]Server not found: {name}[/red]")
+            return
+        server_configs[name] = server_config
+    
+    if not server_configs:
+        console.print(f"[red]Server not found: {server}[/red]")
+        return
+    
+    # Check if command is an alias
+    alias_cmd = config_mgr.get_alias(command)
+    if alias_cmd:
+        command = alias_cmd
+        console.print(f"[dim]Using alias: {command}[/dim]")
+    
+    if len(server_configs) > 1:
+        sys.exit(0 if _ssh_exec_many(ssh_mgr, server_configs, command) else 1)
+    
+    server_config = next(iter(server_configs.values()))
+    
+    try:
+        client = _ssh_connect(ssh_mgr, server_config)
+        
+        stdout, stderr, exit_code = ssh_mgr.execute_command(client, command)
+        
+        if stdout:
+            console.print(stdout)
+        if stderr:
+            console.print(f"[red]{stderr}[/red]", file=sys.stderr)
+        
+        sys.exit(exit_code)
+        
+    except Exception as e:
+        console.print(f"[red]Error: {e}[/red]")
+        sys.exit(1)
+
+
+@ssh.command('logs')
+@click.argument('server')
+@click.argument('log_path')
+@click.option('--lines', '-n', default=50, help='Number of lines to show')
+@click.option('--follow', '-f', is_flag=True, help='Follow log output')
+@click.option('--grep', 'pattern', help='Only show lines matching PATTERN (filtered on the server)')
+@click.pass_context
+def ssh_logs(ctx, server, log_path, lines, follow, pattern):
+    """Tail logs from remote server."""
+    config_mgr = ctx.obj['config']
+    ssh_mgr = ctx.obj['ssh']
+    
+    server_config = config_mgr.get_ssh_server(server)
+    if not server_config:
+        console.print(f"[red]Server not found: {server}[/red]")
+        return
+    
+    try:
+        client = _ssh_connect(ssh_mgr, server_config)
+        
+        console.print(f"[dim]Tailing {log_path} on {server}...[/dim]\n")
+        
+        _write_stream(
+            ssh_mgr.stream_log(client, log_path, lines, follow, pattern=pattern),
+            follow
+        )
+        
+    except KeyboardInterrupt:
+        console.print("\n[yellow]Stopped tailing log[/yellow]")
+    except Exception as e:
+        console.print(f"[red]Error: {e}[/red]")
+        sys.exit(1)
@@ -1,19 +1,165 @@
 """Configuration management for MCP Server."""
 
+import copy
 import json
 import os
+from contextlib import contextmanager
+from functools import partial
 import yaml
 from pathlib import Path
-from typing import Dict, Any, Optional
+from typing import Dict, Any, Iterator, List, Optional, Tuple
 from cryptography.fernet import Fernet
 import logging
 
+try:
+    import orjson
+except ImportError:  # pragma: no cover - optional speedup
+    orjson = None
+
 logger = logging.getLogger(__name__)
 
+# libyaml-backed loader/dumper when PyYAML was built with it
+_YamlLoader = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+_YamlDumper = getattr(yaml, "CSafeDumper", yaml.SafeDumper)
+
+# Bound once at import with the loader/dumper chosen above
+_yaml_load = partial(yaml.load, Loader=_YamlLoader)
+_yaml_parse = partial(yaml.parse, Loader=_YamlLoader)
+_yaml_dump = partial(yaml.dump, Dumper=_YamlDumper)
+
+
+def _json_loads(data: bytes) -> Any:
+    """Decode a JSON config (orjson when installed)."""
+    if orjson is not None:
+        return orjson.loads(data)
+    
+    return json.loads(data)
+
+
+def _json_dumps(payload: Any) -> bytes:
+    """Encode a JSON config, indented for hand editing."""
+    if orjson is not None:
+        return orjson.dumps(payload, option=orjson.OPT_INDENT_2)
+    
+    return json.dumps(payload, indent=2).encode()
+
+
+_NODE_START = (yaml.MappingStartEvent, yaml.SequenceStartEvent)
+_NODE_END = (yaml.MappingEndEvent, yaml.SequenceEndEvent)
+
+
+def _skip_node(events: Iterator[yaml.Event], event: yaml.Event):
+    """Consume the rest of the YAML node that starts with event."""
+    depth = 1 if isinstance(event, _NODE_START) else 0
+    while depth:
+        event = next(events)
+        if isinstance(event, _NODE_START):
+            depth += 1
+        elif isinstance(event, _NODE_END):
+            depth -= 1
+
+
+def _scan_names(events: Iterator[yaml.Event], sections: Dict[str, List[str]]):
+    """
+    Collect profile names from a YAML event stream.
+    
+    Only the `name` of each entry in the listed sections (and the keys of
+    `aliases`) is read; every other node is skipped without being built.
+    """
+    event = next(events)
+    while not isinstance(event, _NODE_START):
+        if isinstance(event, yaml.StreamEndEvent):
+            return  # Empty document
+        event = next(events)
+    
+    if not isinstance(event, yaml.MappingStartEvent):
+        raise yaml.YAMLError("top level of config is not a mapping")
+    
+    while True:
+        key = next(events)
+        if isinstance(key, yaml.MappingEndEvent):
+            return
+        value = next(events)
+        names = sections.get(key.value) if isinstance(key, yaml.ScalarEvent) else None
+        
+        if names is None:
+            _skip_node(events, key)
+            _skip_node(events, value)
+        elif isinstance(value, yaml.AliasEvent):
+            raise yaml.YAMLError(f"{key.value} is a YAML alias")
+        elif isinstance(value, yaml.MappingStartEvent):
+            # Mapping sections (aliases): the keys are the names
+            while True:
+                item_key = next(events)
+                if isinstance(item_key, yaml.MappingEndEvent):
+                    break
+                if isinstance(item_key, yaml.ScalarEvent):
+                    names.append(item_key.value)
+                _skip_node(events, item_key)
+                _skip_node(events, next(events))
+        elif isinstance(value, yaml.SequenceStartEvent):
+            # List sections: the `name` field of each entry
+            while True:
+                item = next(events)
+                if isinstance(item, yaml.SequenceEndEvent):
+                    break
+                if isinstance(item, yaml.AliasEvent):
+                    raise yaml.YAMLError(f"entry in {key.value} is a YAML alias")
+                if not isinstance(item, yaml.MappingStartEvent):
+                    _skip_node(events, item)
+                    continue
+                while True:
+                    field = next(events)
+                    if isinstance(field, yaml.MappingEndEvent):
+                        break
+                    field_value = next(events)
+                    if isinstance(field, yaml.ScalarEvent) and field.value == "name":
+                        if not isinstance(field_value, yaml.ScalarEvent):
+                            raise yaml.YAMLError("profile name is not a plain scalar")
+                        names.append(field_value.value)
+                    _skip_node(events, field)
+                    _skip_node(events, field_value)
+        else:
+            _skip_node(events, value)
+
+
+class _Unnamed:
+    """
+    Key for a profile entry that cannot be looked up by name.
+    
+    Non-mapping entries, entries without a usable name and later entries
+    repeating an earlier name are kept under these (unique) keys, so they
+    survive a save but never shadow a named profile.
+    """
+    
+    __slots__ = ()
+
+
+def _profile_name(entry: Any) -> Any:
+    """An entry's name if it can key a profile section, else None."""
+    if not isinstance(entry, dict):
+        return None
+    
+    name = entry.get("name")
+    try:
+        hash(name)
+    except TypeError:
+        return None
+    return name
+
+
+# Parsed config files: path -> (st_mtime_ns, st_size, config). Shared by
+# all ConfigManager instances; entries are copied out, never handed out.
+_CONFIG_CACHE: Dict[Path, Tuple[int, int, Dict[str, Any]]] = {}
+
 
 class ConfigManager:
     """Manages MCP configuration including credentials and profiles."""
     
+    # Profile sections, kept in memory as name -> entry dicts for
+    # constant-time lookup and update; stored as lists on disk
+    _PROFILE_SECTIONS = ("ssh_servers", "docker_hosts", "kubernetes_clusters")
+    
     def __init__(self, config_path: Optional[str] = None):
         """
         Initialize configuration manager.
@@ -31,6 +177,15 @@ class ConfigManager:
         
         self.config: Dict[str, Any] = {}
         self.encryption_key: Optional[bytes] = None
+        
+        # File mtime when last read/written; a change triggers a reload
+        self._mtime_ns: Optional[int] = None
+        # Why the file could not be loaded; saving would overwrite it
+        self._load_error: Optional[str] = None
+        # Inside batch(): changes are saved once on exit
+        self._batch_depth = 0
+        self._dirty = False
+        
         self._load_config()
     
     def _load_config(self):
@@ -41,24 +196,129 @@ class ConfigManager:
             return
         
         try:
-            with open(self.config_path, 'r') as f:
-                if self.config_path.suffix == '.json':
-                    self.config = json.load(f)
-                else:
-                    self.config = yaml.safe_load(f) or {}
+            st = self.config_path.stat()
+            cached = _CONFIG_CACHE.get(self.config_path)
+            
+            if cached and cached[:2] == (st.st_mtime_ns, st.st_size):
+                # Unchanged since another instance parsed it
+                self.config = copy.deepcopy(cached[2])
+            else:
+                # Binary mode: libyaml and json both decode UTF-8 themselves
+                with open(self.config_path, 'rb') as f:
+                    if self.config_path.suffix == '.json':
+                        self.config = self._from_file(_json_loads(f.read()))
+                    else:
+                        self.config = self._from_file(_yaml_load(f) or {})
+                _CONFIG_CACHE[self.config_path] = (
+                    st.st_mtime_ns, st.st_size, copy.deepcopy(self.config)
+                )
+            self._load_error = None
             logger.info(f"Loaded configuration from {self.config_path}")
         except Exception as e:
             logger.error(f"Failed to load config: {e}")
             self.config = {}
+            self._load_error = str(e)
+        
+        self._record_mtime()
+    
+    def _record_mtime(self):
+        """Remember the config file's mtime as of the last read/write."""
+        try:
+            self._mtime_ns = self.config_path.stat().st_mtime_ns
+        except OSError:
+            self._mtime_ns = None
+    
+    def _refresh(self):
+        """Reload configuration if the file was changed by another process."""
+        if self._batch_depth or self._dirty:
+            # Reloading would drop changes not yet saved
+            return
+        
+        try:
+            mtime_ns = self.config_path.stat().st_mtime_ns
+        except OSError:
+            return
+        
+        if mtime_ns != self._mtime_ns:
+            logger.info(f"Configuration changed on disk, reloading {self.config_path}")
+            self._load_config()
+    
+    @classmethod
+    def _from_file(cls, config: Dict[str, Any]) -> Dict[str, Any]:
+        """Convert profile sections from on-disk lists to name -> entry dicts."""
+        for section in cls._PROFILE_SECTIONS:
+            # Absent sections stay absent, so saving doesn't add them
+            if section not in config:
+                continue
+            
+            entries = config[section]
+            if isinstance(entries, dict):
+                continue
+            
+            if entries is None:
+                entries = []
+            elif not isinstance(entries, list):
+                logger.warning(f"Config section {section} is not a list; keeping it as one entry")
+                entries = [entries]
+            
+            by_name = {}
+            for entry in entries:
+                name = _profile_name(entry)
+                # First entry wins, as with a linear scan
+                if name is None or name in by_name:
+                    if name is None:
+                        logger.warning(f"{section} entry has no usable name, kept as is: {entry!r}")
+                    name = _Unnamed()
+                by_name[name] = entry
+            config[section] = by_name
+        
+        return config
+    
+    @classmethod
+    def _to_file(cls, config: Dict[str, Any]) -> Dict[str, Any]:
+        """Shallow copy of the config with profile sections as lists."""
+        return {
+            key: list(value.values()) if key in cls._PROFILE_SECTIONS else value
+            for key, value in config.items()
+        }
+    
+    def _lookup(self, section: str, name: str) -> Optional[Dict[str, Any]]:
+        """Find a named entry in a profile section."""
+        self._refresh()
+        return self.config.get(section, {}).get(name)
+    
+    def _upsert(self, section: str, entry: Dict[str, Any]) -> bool:
+        """
+        Add or replace a named entry in a profile section.
+        
+        Returns:
+            False if an identical entry was already stored
+        """
+        self._refresh()
+        entries = self.config.setdefault(section, {})
+        
+        # Idempotent re-applies leave the config (and the file) untouched
+        if entries.get(entry["name"]) == entry:
+            return False
+        
+        # Updated entries move to the end, as newly added ones do
+        entries.pop(entry["name"], None)
+        # Stale duplicates of the name would be written before it and win
+        # again on the next load
+        for key in [key for key, value in entries.items()
+                    if isinstance(key, _Unnamed) and _profile_name(value) == entry["name"]]:
+            del entries[key]
+        entries[entry["name"]] = entry
+        return True
     
     def _create_default_config(self):
         """Create a default configuration file."""
         default_config = {
             "version": "1.0",
             "profiles": {},
-            "ssh_servers": [],
-            "docker_hosts": [],
-            "kubernetes_clusters": [],
+            "ssh_servers": {},
+            "docker_hosts": {},
+            "kubernetes_clusters": {},
             "aliases": {},
             "settings": {
                 "log_level": "INFO",
@@ -72,40 +332,86 @@ class ConfigManager:
         logger.info(f"Created default configuration at {self.config_path}")
     
     def save_config(self):
-        """Save configuration to file."""
+        """
+        Save configuration to file.
+        
+        Raises:
+            RuntimeError: If the existing file could not be loaded; saving
+                would replace it with a (near) empty config
+        """
+        if self._load_error is not None:
+            raise RuntimeError(
+                f"Not saving over {self.config_path}: it could not be loaded ({self._load_error})"
+            )
+        
+        # Callers may have replaced a profile section with a list
+        self._from_file(self.config)
+        
+        tmp_path = self.config_path.with_suffix(self.config_path.suffix + '.tmp')
+        
         try:
-            with open(self.config_path, 'w') as f:
-                yaml.dump(self.config, f, default_flow_style=False)
-            # Ensure config file has restricted permissions
-            os.chmod(self.config_path, 0o600)
+            # Created with restricted permissions, then renamed over the
+            # config so a crash mid-write never leaves it truncated
+            fd = os.open(tmp_path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o600)
+            if self.config_path.suffix == '.json':
+                with os.fdopen(fd, 'wb') as f:
+                    f.write(_json_dumps(self._to_file(self.config)))
+            else:
+                with os.fdopen(fd, 'w') as f:
+                    _yaml_dump(self._to_file(self.config), f, default_flow_style=False)
+            os.replace(tmp_path, self.config_path)
+            
+            st = self.config_path.stat()
+            self._mtime_ns = st.st_mtime_ns
+            self._dirty = False
+            _CONFIG_CACHE[self.config_path] = (
+                st.st_mtime_ns, st.st_size, copy.deepcopy(self.config)
+            )
             logger.info("Configuration saved successfully")
         except Exception as e:
             logger.error(f"Failed to save config: {e}")
             raise
     
+    @contextmanager
+    def batch(self):
+        """
+        Group several add_* calls into a single save.
+        
+        Example:
+            with config.batch():
+                for server in servers:
+                    config.add_ssh_server(**server)
+        """
+        self._batch_depth += 1
+        try:
+            yield self
+        finally:
+            self._batch_depth -= 1
+            if self._batch_depth == 0 and self._dirty:
+                self.save_config()
+    
+    def _changed(self):
+        """Save after a change, or defer the save while batching."""
+        if self._batch_depth:
+            self._dirty = True
+        else:
+            self.save_config()
+    
     def get_ssh_server(self, name: str) -> Optional[Dict[str, Any]]:
         """Get SSH server configuration by name."""
-        for server in self.config.get("ssh_servers", []):
-            if server.get("name") == name:
-                return server
-        return None
+        return self._lookup("ssh_servers", name)
     
     def get_docker_host(self, name: str) -> Optional[Dict[str, Any]]:
         """Get Docker host configuration by name."""
-        for host in self.config.get("docker_hosts", []):
-            if host.get("name") == name:
-                return host
-        return None
+        return self._lookup("docker_hosts", name)
     
     def get_k8s_cluster(self, name: str) -> Optional[Dict[str, Any]]:
         """Get Kubernetes cluster configuration by name."""
-        for cluster in self.config.get("kubernetes_clusters", []):
-            if cluster.get("name") == name:
-                return cluster
-        return None
+        return self._lookup("kubernetes_clusters", name)
     
     def get_alias(self, name: str) -> Optional[str]:
         """Get command alias by name."""
+        self._refresh()
         return self.config.get("aliases", {}).get(name)
     
     def add_ssh_server(self, name: str, host: str, user: str, 
@@ -113,11 +419,6 @@ class ConfigManager:
                        password: Optional[str] = None,
                        port: int = 22):
         """Add or update SSH server configuration."""
-        servers = self.config.get("ssh_servers", [])
-        
-        # Remove existing server with same name
-        servers = [s for s in servers if s.get("name") != name]
-        
         server_config = {
             "name": name,
             "host": host,
@@ -132,19 +433,13 @@ class ConfigManager:
             logger.warning("Storing password in plain text. Use key-based auth instead.")
             server_config["password"] = password
         
-        servers.append(server_config)
-        self.config["ssh_servers"] = servers
-        self.save_config()
+        if self._upsert("ssh_servers", server_config):
+            self._changed()
     
     def add_docker_host(self, name: str, host: str, 
                         connection_type: str = "ssh",
                         ssh_config: Optional[Dict[str, Any]] = None):
         """Add or update Docker host configuration."""
-        hosts = self.config.get("docker_hosts", [])
-        
-        # Remove existing host with same name
-        hosts = [h for h in hosts if h.get("name") != name]
-        
         host_config = {
             "name": name,
             "host": host,
@@ -154,18 +449,12 @@ class ConfigManager:
         if ssh_config:
             host_config["ssh_config"] = ssh_config
         
-        hosts.append(host_config)
-        self.config["docker_hosts"] = hosts
-        self.save_config()
+        if self._upsert("docker_hosts", host_config):
+            self._changed()
     
     def add_k8s_cluster(self, name: str, kubeconfig_path: str,
                         context: Optional[str] = None):
         """Add or update Kubernetes cluster configuration."""
-        clusters = self.config.get("kubernetes_clusters", [])
-        
-        # Remove existing cluster with same name
-        clusters = [c for c in clusters if c.get("name") != name]
-        
         cluster_config = {
             "name": name,
             "kubeconfig_path": kubeconfig_path
@@ -174,23 +463,75 @@ class ConfigManager:
         if context:
             cluster_config["context"] = context
         
-        clusters.append(cluster_config)
-        self.config["kubernetes_clusters"] = clusters
-        self.save_config()
+        if self._upsert("kubernetes_clusters", cluster_config):
+            self._changed()
     
     def add_alias(self, name: str, command: str):
         """Add or update command alias."""
-        if "aliases" not in self.config:
-            self.config["aliases"] = {}
+        self._refresh()
+        aliases = self.config.setdefault("aliases", {})
+        if aliases.get(name) == command:
+            return
         
-        self.config["aliases"][name] = command
-        self.save_config()
+        aliases[name] = command
+        self._changed()
     
     def list_profiles(self):
         """List all configured profiles."""
+        self._refresh()
+        return self._profile_names(self.config)
+    
+    @staticmethod
+    def _named(entries: Dict[Any, Any]) -> List[str]:
+        """Names in a profile section, without unnamed/duplicate entries."""
+        return [name for name in entries if not isinstance(name, _Unnamed)]
+    
+    @staticmethod
+    def _profile_names(config: Dict[str, Any]) -> Dict[str, List[str]]:
+        """Profile names in a loaded config."""
         return {
-            "ssh_servers": [s.get("name") for s in self.config.get("ssh_servers", [])],
-            "docker_hosts": [h.get("name") for h in self.config.get("docker_hosts", [])],
-            "k8s_clusters": [c.get("name") for c in self.config.get("kubernetes_clusters", [])],
-            "aliases": list(self.config.get("aliases", {}).keys())
+            "ssh_servers": ConfigManager._named(config.get("ssh_servers", {})),
+            "docker_hosts": ConfigManager._named(config.get("docker_hosts", {})),
+            "k8s_clusters": ConfigManager._named(config.get("kubernetes_clusters", {})),
+            "aliases": list(config.get("aliases", {}).keys())
         }
+    
+    @classmethod
+    def fast_list_profiles(cls, config_path: str) -> Dict[str, List[str]]:
+        """
+        List the profiles defined in a config file without loading it.
+        
+        For probing many config files: YAML files are scanned at the event
+        level, so only the profile names are materialized. Malformed files
+        and JSON configs fall back to a full parse.
+        
+        Args:
+            config_path: Path to configuration file
+            
+        Returns:
+            Same shape as list_profiles()
+        """
+        path = Path(config_path)
+        
+        if path.suffix != '.json':
+            names = {key: [] for key in ("ssh_servers", "docker_hosts", "k8s_clusters", "aliases")}
+            sections = {
+                "ssh_servers": names["ssh_servers"],
+                "docker_hosts": names["docker_hosts"],
+                "kubernetes_clusters": names["k8s_clusters"],
+                "aliases": names["aliases"],
+            }
+            try:
+                with open(path, 'rb') as f:
+                    _scan_names(_yaml_parse(f), sections)
+                # Duplicate names resolve to the first entry, as on load
+                return {key: list(dict.fromkeys(values)) for key, values in names.items()}
+            except (yaml.YAMLError, StopIteration) as e:
+                logger.debug(f"Falling back to full parse of {path}: {e}")
+        
+        with open(path, 'rb') as f:
+            if path.suffix == '.json':
+                config = _json_loads(f.read())
+            else:
+                config = _yaml_load(f) or {}
+        return cls._profile_names(cls._from_file(config))
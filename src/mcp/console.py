@@ -0,0 +1,19 @@
+"""Shared Rich console for CLI output."""
+
+from typing import Optional
+
+from rich.console import Console
+
+_console: Optional[Console] = None
+
+
+def get_console() -> Console:
+    """
+    Get the process-wide console, creating it on first use.
+    
+    Terminal capability detection runs once instead of per command.
+    """
+    global _console
+    if _console is None:
+        _console = Console()
+    return _console
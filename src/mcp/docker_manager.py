@@ -2,11 +2,113 @@
 
 import docker
 import logging
-from typing import List, Dict, Any, Optional
+import sys
+import threading
+from dataclasses import dataclass
+from datetime import datetime, timezone
+from typing import Iterator, List, Dict, Any, Optional, Tuple
 from .ssh_manager import SSHManager
 
 logger = logging.getLogger(__name__)
 
+# dataclass(slots=True) needs Python 3.10+
+_DATACLASS_SLOTS = {'slots': True} if sys.version_info >= (3, 10) else {}
+
+
+@dataclass(frozen=True, **_DATACLASS_SLOTS)
+class ContainerInfo:
+    """Summary of a container, as listed by iter_containers."""
+    id: str
+    name: str
+    status: str
+    image: str
+    created: str
+    ports: Dict[str, Any]
+    
+    def asdict(self) -> Dict[str, Any]:
+        """Plain dict form, for JSON output."""
+        return {
+            "id": self.id,
+            "name": self.name,
+            "status": self.status,
+            "image": self.image,
+            "created": self.created,
+            "ports": self.ports
+        }
+
+
+# Keep-alive connections per Docker client; sized for the concurrent
+# stats/pull batches, which would otherwise discard pooled connections
+CONNECTION_POOL_SIZE = 16
+
+# Docker clients shared by all DockerManager instances in the process, so
+# the daemon connection and API version negotiation happen once
+_LOCAL_CLIENT: Optional[docker.DockerClient] = None
+_REMOTE_CLIENTS: Dict[str, docker.DockerClient] = {}
+_CLIENTS_LOCK = threading.Lock()
+
+
+def close_clients():
+    """Close and forget the shared Docker clients."""
+    global _LOCAL_CLIENT
+    
+    with _CLIENTS_LOCK:
+        clients = list(_REMOTE_CLIENTS.values())
+        if _LOCAL_CLIENT is not None:
+            clients.append(_LOCAL_CLIENT)
+        _LOCAL_CLIENT = None
+        _REMOTE_CLIENTS.clear()
+    
+    for client in clients:
+        try:
+            client.close()
+        except Exception as e:
+            logger.warning(f"Error closing Docker client: {e}")
+
+
+def _isoformat(timestamp: int) -> str:
+    """
+    Container list timestamp (epoch seconds) in inspect's ISO 8601 form.
+    
+    The list endpoint only has whole seconds, so unlike inspect's Created
+    the result carries no fractional part.
+    """
+    return datetime.fromtimestamp(timestamp, timezone.utc).strftime('%Y-%m-%dT%H:%M:%SZ')
+
+
+def _image_short_id(image_id: str) -> str:
+    """Short image id, as docker-py's Image.short_id."""
+    return image_id[:19] if image_id.startswith('sha256:') else image_id[:12]
+
+
+def _image_names(client: docker.DockerClient) -> Dict[str, str]:
+    """
+    Display name of every local image, from one /images/json request.
+    
+    The name is the image's first tag, or its short id when untagged, as
+    Image.tags[0] / Image.short_id give it.
+    """
+    names = {}
+    for image in client.api.images():
+        tags = [tag for tag in image.get('RepoTags') or [] if tag != '<none>:<none>']
+        names[image['Id']] = tags[0] if tags else _image_short_id(image['Id'])
+    return names
+
+
+def _port_bindings(ports: List[Dict[str, Any]]) -> Dict[str, Any]:
+    """Container list port entries in inspect's NetworkSettings.Ports form."""
+    bindings: Dict[str, Any] = {}
+    for port in ports:
+        key = f"{port['PrivatePort']}/{port.get('Type', 'tcp')}"
+        if 'PublicPort' in port:
+            bindings.setdefault(key, []).append({
+                "HostIp": port.get('IP', ''),
+                "HostPort": str(port['PublicPort'])
+            })
+        else:
+            bindings.setdefault(key, None)
+    return bindings
+
 
 class DockerManager:
     """Manages Docker containers on local and remote hosts."""
@@ -22,14 +124,19 @@ class DockerManager:
         self.local_client = None
     
     def get_local_client(self) -> docker.DockerClient:
-        """Get local Docker client."""
+        """Get local Docker client (shared across instances)."""
+        global _LOCAL_CLIENT
+        
         if self.local_client is None:
-            try:
-                self.local_client = docker.from_env()
-                logger.info("Connected to local Docker daemon")
-            except Exception as e:
-                logger.error(f"Failed to connect to local Docker: {e}")
-                raise ConnectionError(f"Cannot connect to local Docker daemon: {e}")
+            with _CLIENTS_LOCK:
+                if _LOCAL_CLIENT is None:
+                    try:
+                        _LOCAL_CLIENT = docker.from_env(max_pool_size=CONNECTION_POOL_SIZE)
+                        logger.info("Connected to local Docker daemon")
+                    except Exception as e:
+                        logger.error(f"Failed to connect to local Docker: {e}")
+                        raise ConnectionError(f"Cannot connect to local Docker daemon: {e}")
+                self.local_client = _LOCAL_CLIENT
         return self.local_client
     
     def get_remote_client(self, host: str, ssh_config: Dict[str, Any]) -> docker.DockerClient:
@@ -41,13 +148,20 @@ class DockerManager:
             ssh_config: SSH configuration dictionary
             
         Returns:
-            Docker client connected via SSH
+            Docker client connected via SSH (shared across instances)
         """
+        ssh_url = f"ssh://{ssh_config['user']}@{host}"
+        
         try:
-            # Connect via SSH tunnel
-            ssh_url = f"ssh://{ssh_config['user']}@{host}"
-            client = docker.DockerClient(base_url=ssh_url)
-            logger.info(f"Connected to Docker on {host}")
+            with _CLIENTS_LOCK:
+                client = _REMOTE_CLIENTS.get(ssh_url)
+                if client is None:
+                    # Connect via SSH tunnel
+                    client = docker.DockerClient(
+                        base_url=ssh_url, max_pool_size=CONNECTION_POOL_SIZE
+                    )
+                    _REMOTE_CLIENTS[ssh_url] = client
+                    logger.info(f"Connected to Docker on {host}")
             return client
         except Exception as e:
             logger.error(f"Failed to connect to remote Docker: {e}")
@@ -66,42 +180,61 @@ class DockerManager:
         """
         return self.ssh_manager.execute_command(ssh_client, f"docker {command}")
     
-    def list_containers(self, client: Optional[docker.DockerClient] = None,
-                       all: bool = False) -> List[Dict[str, Any]]:
+    def iter_containers(self, client: Optional[docker.DockerClient] = None,
+                        all: bool = False) -> Iterator[ContainerInfo]:
         """
-        List Docker containers.
+        Iterate over Docker containers.
         
         Args:
             client: Docker client (uses local if None)
             all: Include stopped containers
             
-        Returns:
-            List of container information dictionaries
+        Yields:
+            Container summaries
         """
         if client is None:
             client = self.get_local_client()
         
         try:
-            containers = client.containers.list(all=all)
-            result = []
-            
-            for container in containers:
-                result.append({
-                    "id": container.short_id,
-                    "name": container.name,
-                    "status": container.status,
-                    "image": container.image.tags[0] if container.image.tags else container.image.short_id,
-                    "created": container.attrs['Created'],
-                    "ports": container.attrs.get('NetworkSettings', {}).get('Ports', {})
-                })
-            
-            logger.info(f"Found {len(result)} containers")
-            return result
+            # One /containers/json request (plus one /images/json for the
+            # image names): the high-level list() inspects every container,
+            # and each container.image is another request
+            image_names = None
+            for summary in client.api.containers(all=all):
+                names = summary.get('Names') or ['']
+                if image_names is None:
+                    image_names = _image_names(client)
+                image_id = summary.get('ImageID', '')
+                
+                yield ContainerInfo(
+                    id=summary['Id'][:12],
+                    name=names[0].lstrip('/'),
+                    status=summary.get('State', ''),
+                    image=image_names.get(image_id) or _image_short_id(image_id),
+                    created=_isoformat(summary.get('Created', 0)),
+                    ports=_port_bindings(summary.get('Ports') or [])
+                )
             
         except Exception as e:
             logger.error(f"Failed to list containers: {e}")
             raise RuntimeError(f"Failed to list containers: {e}")
     
+    def list_containers(self, client: Optional[docker.DockerClient] = None,
+                       all: bool = False) -> List[Dict[str, Any]]:
+        """
+        List Docker containers.
+        
+        Args:
+            client: Docker client (uses local if None)
+            all: Include stopped containers
+            
+        Returns:
+            List of container information dictionaries
+        """
+        result = [info.asdict() for info in self.iter_containers(client, all)]
+        logger.info(f"Found {len(result)} containers")
+        return result
+    
     def get_container(self, container_id: str,
                      client: Optional[docker.DockerClient] = None):
         """
@@ -125,13 +258,23 @@ class DockerManager:
             logger.error(f"Failed to get container: {e}")
             raise
     
+    def _api(self, client: Optional[docker.DockerClient] = None):
+        """Low-level API client (uses local if None)."""
+        if client is None:
+            client = self.get_local_client()
+        return client.api
+    
+    # Lifecycle operations go straight to the low-level API by id or name:
+    # get_container would first inspect the container just to build an object
+    
     def start_container(self, container_id: str,
                        client: Optional[docker.DockerClient] = None):
         """Start a container."""
         try:
-            container = self.get_container(container_id, client)
-            container.start()
+            self._api(client).start(container_id)
             logger.info(f"Started container: {container_id}")
+        except docker.errors.NotFound:
+            raise ValueError(f"Container not found: {container_id}")
         except Exception as e:
             logger.error(f"Failed to start container: {e}")
             raise
@@ -141,9 +284,10 @@ class DockerManager:
                       timeout: int = 10):
         """Stop a container."""
         try:
-            container = self.get_container(container_id, client)
-            container.stop(timeout=timeout)
+            self._api(client).stop(container_id, timeout=timeout)
             logger.info(f"Stopped container: {container_id}")
+        except docker.errors.NotFound:
+            raise ValueError(f"Container not found: {container_id}")
         except Exception as e:
             logger.error(f"Failed to stop container: {e}")
             raise
@@ -153,9 +297,10 @@ class DockerManager:
                          timeout: int = 10):
         """Restart a container."""
         try:
-            container = self.get_container(container_id, client)
-            container.restart(timeout=timeout)
+            self._api(client).restart(container_id, timeout=timeout)
             logger.info(f"Restarted container: {container_id}")
+        except docker.errors.NotFound:
+            raise ValueError(f"Container not found: {container_id}")
         except Exception as e:
             logger.error(f"Failed to restart container: {e}")
             raise
@@ -165,9 +310,10 @@ class DockerManager:
                         force: bool = False):
         """Remove a container."""
         try:
-            container = self.get_container(container_id, client)
-            container.remove(force=force)
+            self._api(client).remove_container(container_id, force=force)
             logger.info(f"Removed container: {container_id}")
+        except docker.errors.NotFound:
+            raise ValueError(f"Container not found: {container_id}")
         except Exception as e:
             logger.error(f"Failed to remove container: {e}")
             raise
@@ -193,10 +339,54 @@ class DockerManager:
         try:
             container = self.get_container(container_id, client)
             
-            for line in container.logs(stream=follow, tail=tail, 
-                                      timestamps=timestamps, 
-                                      follow=follow):
-                yield line.decode('utf-8').rstrip('\n')
+            if not follow:
+                # One bytes payload: decode and split it in a single pass
+                logs = container.logs(stream=False, tail=tail, timestamps=timestamps)
+                yield from logs.decode('utf-8', errors='replace').splitlines()
+                return
+            
+            # Stream chunks don't align with lines; carry the partial tail
+            pending = b''
+            for chunk in container.logs(stream=True, tail=tail,
+                                        timestamps=timestamps, follow=True):
+                *lines, pending = (pending + chunk).split(b'\n')
+                if lines:
+                    yield from b'\n'.join(lines).decode('utf-8', errors='replace').split('\n')
+            
+            if pending:
+                yield pending.decode('utf-8', errors='replace')
+                
+        except Exception as e:
+            logger.error(f"Failed to get container logs: {e}")
+            raise
+    
+    def stream_container_logs(self, container_id: str,
+                              client: Optional[docker.DockerClient] = None,
+                              tail: int = 100,
+                              follow: bool = False,
+                              timestamps: bool = False):
+        """
+        Stream container logs as raw bytes (no per-line decoding).
+        
+        Args:
+            container_id: Container ID or name
+            client: Docker client
+            tail: Number of lines to retrieve
+            follow: Stream logs in real-time
+            timestamps: Include timestamps
+            
+        Yields:
+            Raw log output chunks
+        """
+        try:
+            container = self.get_container(container_id, client)
+            logs = container.logs(stream=follow, tail=tail,
+                                  timestamps=timestamps, follow=follow)
+            
+            if follow:
+                yield from logs
+            else:
+                yield logs
                 
         except Exception as e:
             logger.error(f"Failed to get container logs: {e}")
@@ -239,40 +429,86 @@ class DockerManager:
         """
         try:
             container = self.get_container(container_id, client)
-            stats = container.stats(stream=False)
-            
-            # Parse and simplify stats
-            cpu_stats = stats['cpu_stats']
-            mem_stats = stats['memory_stats']
-            
-            result = {
-                "cpu_percent": self._calculate_cpu_percent(stats),
-                "memory_usage": mem_stats.get('usage', 0),
-                "memory_limit": mem_stats.get('limit', 0),
-                "memory_percent": (mem_stats.get('usage', 0) / mem_stats.get('limit', 1)) * 100,
-                "network_rx": sum([net.get('rx_bytes', 0) for net in stats.get('networks', {}).values()]),
-                "network_tx": sum([net.get('tx_bytes', 0) for net in stats.get('networks', {}).values()])
-            }
-            
-            return result
+            return self._summarize_stats(container.stats(stream=False))
             
         except Exception as e:
             logger.error(f"Failed to get container stats: {e}")
             raise
     
+    def get_container_stats_batch(self, container_ids: List[str],
+                                  client: Optional[docker.DockerClient] = None,
+                                  one_shot: bool = False,
+                                  max_workers: int = 16) -> Dict[str, Any]:
+        """
+        Get resource statistics for several containers at once.
+        
+        The daemon samples CPU over about a second per request; requests are
+        issued concurrently on the shared client so the windows overlap.
+        
+        Args:
+            container_ids: Container IDs or names
+            client: Docker client (uses local if None)
+            one_shot: Skip the CPU sampling window (cpu_percent is then 0)
+            max_workers: Maximum concurrent stats requests
+            
+        Returns:
+            Container ID -> stats dictionary, or the exception raised for it
+        """
+        from concurrent.futures import ThreadPoolExecutor
+        
+        if client is None:
+            client = self.get_local_client()
+        
+        def fetch(container_id):
+            try:
+                # Low-level API: no per-container inspect before the stats call
+                stats = client.api.stats(container_id, stream=False, one_shot=one_shot)
+                return self._summarize_stats(stats)
+            except Exception as e:
+                logger.error(f"Failed to get stats for {container_id}: {e}")
+                return e
+        
+        if not container_ids:
+            return {}
+        
+        with ThreadPoolExecutor(max_workers=min(len(container_ids), max_workers)) as pool:
+            return dict(zip(container_ids, pool.map(fetch, container_ids)))
+    
+    def _summarize_stats(self, stats: Dict[str, Any]) -> Dict[str, Any]:
+        """Simplify a raw stats payload."""
+        mem_stats = stats['memory_stats']
+        usage = mem_stats.get('usage', 0)
+        limit = mem_stats.get('limit', 0)
+        
+        # One pass over the interfaces for both counters
+        rx = tx = 0
+        for net in stats.get('networks', {}).values():
+            rx += net.get('rx_bytes', 0)
+            tx += net.get('tx_bytes', 0)
+        
+        return {
+            "cpu_percent": self._calculate_cpu_percent(stats),
+            "memory_usage": usage,
+            "memory_limit": limit,
+            "memory_percent": (usage / (limit or 1)) * 100,
+            "network_rx": rx,
+            "network_tx": tx
+        }
+    
     def _calculate_cpu_percent(self, stats: Dict[str, Any]) -> float:
         """Calculate CPU percentage from stats."""
         try:
-            cpu_delta = stats['cpu_stats']['cpu_usage']['total_usage'] - \
-                       stats['precpu_stats']['cpu_usage']['total_usage']
-            system_delta = stats['cpu_stats']['system_cpu_usage'] - \
-                          stats['precpu_stats']['system_cpu_usage']
-            cpu_count = stats['cpu_stats'].get('online_cpus', 1)
+            # Each nested section is looked up once
+            cpu = stats['cpu_stats']
+            precpu = stats['precpu_stats']
+            cpu_delta = cpu['cpu_usage']['total_usage'] - precpu['cpu_usage']['total_usage']
+            system_delta = cpu['system_cpu_usage'] - precpu['system_cpu_usage']
             
             if system_delta > 0 and cpu_delta > 0:
-                return (cpu_delta / system_delta) * cpu_count * 100.0
+                return (cpu_delta / system_delta) * cpu.get('online_cpus', 1) * 100.0
             return 0.0
-        except (KeyError, ZeroDivisionError):
+        except (KeyError, TypeError):
+            # one_shot stats omit the precpu sample
             return 0.0
     
     def list_images(self, client: Optional[docker.DockerClient] = None) -> List[Dict[str, Any]]:
@@ -311,3 +547,43 @@ class DockerManager:
         except Exception as e:
             logger.error(f"Failed to pull image: {e}")
             raise
+    
+    def pull_images(self, specs: List[Tuple[str, str]],
+                    client: Optional[docker.DockerClient] = None,
+                    max_workers: int = 4) -> Dict[str, Optional[Exception]]:
+        """
+        Pull several images concurrently.
+        
+        Args:
+            specs: (image, tag) pairs
+            client: Docker client (uses local if None)
+            max_workers: Maximum concurrent pulls
+            
+        Returns:
+            "image:tag" -> None on success, or the exception raised for it
+        """
+        from concurrent.futures import ThreadPoolExecutor
+        
+        if client is None:
+            client = self.get_local_client()
+        
+        def pull(spec):
+            image, tag = spec
+            try:
+                # Drain the low-level progress stream; the high-level pull
+                # also inspects the image afterwards to build an Image object
+                for event in client.api.pull(image, tag=tag, stream=True, decode=True):
+                    if 'error' in event:
+                        raise RuntimeError(event['error'])
+                logger.info(f"Successfully pulled {image}:{tag}")
+                return None
+            except Exception as e:
+                logger.error(f"Failed to pull {image}:{tag}: {e}")
+                return e
+        
+        if not specs:
+            return {}
+        
+        with ThreadPoolExecutor(max_workers=min(len(specs), max_workers)) as pool:
+            results = pool.map(pull, specs)
+            return {f"{image}:{tag}": error for (image, tag), error in zip(specs, results)}
@@ -1,21 +1,327 @@
 """Kubernetes cluster management."""
 
+import asyncio
+import json
 import logging
-from typing import List, Dict, Any, Optional
+import os
+import re
+import threading
+from datetime import datetime
+from typing import Callable, Iterator, List, Dict, Any, Optional, Set, Tuple, Union
 from pathlib import Path
-from kubernetes import client, config
+import yaml
+from kubernetes import client, config, watch
 from kubernetes.client.rest import ApiException
+from kubernetes.config.kube_config import KubeConfigLoader
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - optional speedup
+    orjson = None
 
 logger = logging.getLogger(__name__)
 
+# Objects per LIST request; larger collections are fetched in pages
+DEFAULT_PAGE_SIZE = 500
+
+
+def _read_body(response) -> bytes:
+    """Body of a raw (_preload_content=False) API response, raising on errors."""
+    try:
+        if not 200 <= response.status <= 299:
+            raise ApiException(status=response.status, reason=response.reason)
+        return response.data
+    finally:
+        response.release_conn()
+
+
+def _read_json(response) -> Dict[str, Any]:
+    """Decode a raw (_preload_content=False) API response as plain JSON."""
+    data = _read_body(response)
+    
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def _parse_time(value: Optional[str]) -> Optional[datetime]:
+    """RFC 3339 timestamp from the API as a timezone-aware datetime."""
+    if not value:
+        return None
+    return datetime.fromisoformat(value.replace('Z', '+00:00'))
+
+
+def _paginate(list_call: Callable, *args, page_size: int = DEFAULT_PAGE_SIZE,
+              **kwargs) -> Iterator[Dict[str, Any]]:
+    """
+    Iterate over a Kubernetes LIST call one page at a time.
+    
+    Pages are read as plain JSON: building the generated client's model
+    objects for every listed item costs far more than decoding the JSON.
+    
+    Args:
+        list_call: Generated client list method (e.g. list_namespaced_pod)
+        page_size: Objects per request (limit)
+        
+    Yields:
+        Listed objects as API-shaped dicts, as each page arrives
+    """
+    _continue = None
+    while True:
+        page = _read_json(list_call(*args, limit=page_size, _continue=_continue,
+                                    _preload_content=False, **kwargs))
+        yield from page.get('items') or []
+        
+        _continue = (page.get('metadata') or {}).get('continue')
+        if not _continue:
+            break
+
+
+def _pod_summary(pod: Dict[str, Any]) -> Dict[str, Any]:
+    """list_pods entry for an API-shaped pod dict."""
+    metadata, spec, status = pod['metadata'], pod['spec'], pod.get('status') or {}
+    return {
+        "name": metadata['name'],
+        "namespace": metadata.get('namespace'),
+        "status": status.get('phase'),
+        "node": spec.get('nodeName'),
+        "ip": status.get('podIP'),
+        "containers": len(spec.get('containers') or []),
+        "created": _parse_time(metadata.get('creationTimestamp'))
+    }
+
+
+# One label selector requirement: "key", "!key", "key=v", "key==v",
+# "key!=v", "key in (a,b)" or "key notin (a,b)"
+_REQUIREMENT_RE = re.compile(
+    r'\s*(?P<not>!)?\s*(?P<key>[\w./-]+)\s*'
+    r'(?:(?P<op>==|=|!=)\s*(?P<value>[\w./-]*)'
+    r'|\s(?P<set_op>in|notin)\s*\((?P<values>[^)]*)\))?'
+    r'\s*(?:,|$)'
+)
+
+
+def _parse_selector(selector: str) -> List[Tuple[str, str, Set[str]]]:
+    """
+    Parse a label selector into (key, operator, values) requirements.
+    
+    Operators are "exists", "!exists", "in" and "notin"; equality
+    requirements become single-value in/notin.
+    """
+    requirements = []
+    pos = 0
+    selector = selector.strip()
+    while pos < len(selector):
+        match = _REQUIREMENT_RE.match(selector, pos)
+        if not match or match.end() == pos:
+            raise ValueError(f"Invalid label selector: {selector}")
+        pos = match.end()
+        
+        key = match.group('key')
+        if match.group('op'):
+            op = 'notin' if match.group('op') == '!=' else 'in'
+            values = {match.group('value')}
+        elif match.group('set_op'):
+            op = match.group('set_op')
+            values = {v.strip() for v in match.group('values').split(',') if v.strip()}
+        else:
+            op = '!exists' if match.group('not') else 'exists'
+            values = set()
+        requirements.append((key, op, values))
+    
+    return requirements
+
+
+def _selector_matches(requirements: List[Tuple[str, str, Set[str]]],
+                      labels: Optional[Dict[str, str]]) -> bool:
+    """Whether labels satisfy every parsed selector requirement."""
+    labels = labels or {}
+    for key, op, values in requirements:
+        if op == 'exists':
+            ok = key in labels
+        elif op == '!exists':
+            ok = key not in labels
+        elif op == 'in':
+            ok = key in labels and labels[key] in values
+        else:
+            ok = labels.get(key) not in values
+        if not ok:
+            return False
+    return True
+
+
+class PodInformer:
+    """
+    Local cache of the pods in a namespace.
+    
+    The pods are listed once, then kept current from a WATCH stream in a
+    background thread, so reads don't go to the API server. The cache is
+    re-listed when the watch's resource version has expired (410 Gone).
+    """
+    
+    # Seconds per watch request before it is re-established
+    WATCH_TIMEOUT = 300
+    
+    # Seconds to wait before retrying a failed watch
+    RETRY_DELAY = 5
+    
+    def __init__(self, api_client: Optional[client.ApiClient], namespace: str,
+                 page_size: int = DEFAULT_PAGE_SIZE):
+        """
+        Initialize informer.
+        
+        Args:
+            api_client: API client (None uses the default configuration)
+            namespace: Kubernetes namespace to cache
+            page_size: Pods per request when (re-)listing
+        """
+        self.namespace = namespace
+        self.page_size = page_size
+        self._v1 = client.CoreV1Api(api_client)
+        self._pods: Dict[str, client.V1Pod] = {}
+        self._rv: Optional[str] = None
+        self._lock = threading.Lock()
+        self._stopped = threading.Event()
+        self._watch: Optional[watch.Watch] = None
+        self._thread: Optional[threading.Thread] = None
+    
+    def start(self):
+        """List the namespace, then keep the cache current in the background."""
+        self._relist()
+        self._thread = threading.Thread(
+            target=self._run, name=f"pod-informer-{self.namespace}", daemon=True
+        )
+        self._thread.start()
+    
+    def stop(self):
+        """Stop watching (the last snapshot stays readable)."""
+        self._stopped.set()
+        if self._watch is not None:
+            self._watch.stop()
+    
+    def pods(self, label_selector: Optional[str] = None) -> List[client.V1Pod]:
+        """Snapshot of the cached pods, optionally filtered by label selector."""
+        requirements = _parse_selector(label_selector) if label_selector else []
+        
+        with self._lock:
+            pods = list(self._pods.values())
+        
+        if not requirements:
+            return pods
+        return [pod for pod in pods if _selector_matches(requirements, pod.metadata.labels)]
+    
+    def get(self, name: str) -> Optional[client.V1Pod]:
+        """Cached pod by name."""
+        with self._lock:
+            return self._pods.get(name)
+    
+    def _relist(self):
+        """Replace the cache with a fresh LIST and record its resource version."""
+        pods = {}
+        _continue = None
+        while True:
+            page = self._v1.list_namespaced_pod(
+                self.namespace, limit=self.page_size, _continue=_continue
+            )
+            for pod in page.items:
+                pods[pod.metadata.name] = pod
+            
+            _continue = page.metadata._continue
+            if not _continue:
+                break
+        
+        with self._lock:
+            self._pods = pods
+            self._rv = page.metadata.resource_version
+        logger.debug(f"Listed {len(pods)} pods in {self.namespace} at {self._rv}")
+    
+    def _apply(self, event_type: str, pod: client.V1Pod):
+        """Apply one watch event to the cache."""
+        if event_type in ('ADDED', 'MODIFIED'):
+            with self._lock:
+                self._pods[pod.metadata.name] = pod
+        elif event_type == 'DELETED':
+            with self._lock:
+                self._pods.pop(pod.metadata.name, None)
+    
+    def _run(self):
+        """Watch loop: apply deltas, re-list after 410 Gone, retry on errors."""
+        while not self._stopped.is_set():
+            try:
+                if self._rv is None:
+                    self._relist()
+                
+                self._watch = watch.Watch()
+                for event in self._watch.stream(
+                    self._v1.list_namespaced_pod, self.namespace,
+                    resource_version=self._rv,
+                    allow_watch_bookmarks=True,
+                    timeout_seconds=self.WATCH_TIMEOUT
+                ):
+                    # Bookmarks only advance the resource version
+                    if event['type'] != 'BOOKMARK':
+                        self._apply(event['type'], event['object'])
+                    self._rv = self._watch.resource_version or self._rv
+                
+            except ApiException as e:
+                if e.status == 410:
+                    logger.info(f"Pod watch on {self.namespace} expired, re-listing")
+                    self._rv = None
+                    continue
+                logger.warning(f"Pod watch on {self.namespace} failed: {e}")
+                self._stopped.wait(self.RETRY_DELAY)
+            
+            except Exception as e:
+                if self._stopped.is_set():
+                    break
+                logger.warning(f"Pod watch on {self.namespace} failed: {e}")
+                self._stopped.wait(self.RETRY_DELAY)
+
 
 class KubernetesManager:
     """Manages Kubernetes cluster operations."""
     
+    # Pooled HTTP connections per API client
+    CONNECTION_POOL_SIZE = 32
+    
     def __init__(self):
         """Initialize Kubernetes manager."""
         self.contexts = {}
         self.current_context = None
+        # Per-manager API client so several clusters can be queried at once
+        # (created on first use from the global default configuration if no
+        # kubeconfig is loaded)
+        self.api_client = None
+        # Namespace -> PodInformer serving list_pods/get_pod from a local cache
+        self.informers: Dict[str, PodInformer] = {}
+        # Last parsed kubeconfig, reused until the file's mtime changes
+        self._kubeconfig_path: Optional[str] = None
+        self._kubeconfig_mtime: Optional[int] = None
+        self._kubeconfig_doc: Dict[str, Any] = {}
+        self._contexts_cache: List[str] = []
+    
+    def _read_kubeconfig(self, kubeconfig_path: str) -> Dict[str, Any]:
+        """
+        Parsed kubeconfig, re-read only when the file has changed.
+        
+        Args:
+            kubeconfig_path: Expanded path to the kubeconfig file
+            
+        Returns:
+            The kubeconfig document
+        """
+        mtime = os.stat(kubeconfig_path).st_mtime_ns
+        if kubeconfig_path == self._kubeconfig_path and mtime == self._kubeconfig_mtime:
+            return self._kubeconfig_doc
+        
+        with open(kubeconfig_path) as f:
+            doc = yaml.safe_load(f) or {}
+        
+        self._kubeconfig_path = kubeconfig_path
+        self._kubeconfig_mtime = mtime
+        self._kubeconfig_doc = doc
+        self._contexts_cache = [ctx['name'] for ctx in doc.get('contexts') or []]
+        return doc
     
     def load_kubeconfig(self, kubeconfig_path: Optional[str] = None,
                        context: Optional[str] = None) -> str:
@@ -35,11 +341,25 @@ class KubernetesManager:
             else:
                 kubeconfig_path = str(Path.home() / ".kube" / "config")
             
-            config.load_kube_config(config_file=kubeconfig_path, context=context)
+            # Build the REST config from the cached document instead of
+            # letting load_kube_config re-read and re-parse the file
+            loader = KubeConfigLoader(
+                config_dict=self._read_kubeconfig(kubeconfig_path),
+                active_context=context,
+                config_base_path=os.path.dirname(kubeconfig_path)
+            )
+            client_config = client.Configuration()
+            loader.load_and_set(client_config)
+            client.Configuration.set_default(client_config)
+            # Keep enough pooled connections for concurrent calls to the API server
+            client_config.connection_pool_maxsize = self.CONNECTION_POOL_SIZE
+            
+            # Informers and the old client belong to the previous cluster
+            self.close()
+            # One thread at most, and only if a legacy async_req call needs it
+            self.api_client = client.ApiClient(client_config, pool_threads=1)
             
-            # Get active context
-            contexts, active_context = config.list_kube_config_contexts(config_file=kubeconfig_path)
-            self.current_context = context or active_context['name']
+            self.current_context = context or loader.current_context['name']
             
             logger.info(f"Loaded kubeconfig from {kubeconfig_path}, context: {self.current_context}")
             return self.current_context
@@ -48,14 +368,68 @@ class KubernetesManager:
             logger.error(f"Failed to load kubeconfig: {e}")
             raise RuntimeError(f"Failed to load kubeconfig: {e}")
     
+    def start_pod_informer(self, namespace: str = "default") -> PodInformer:
+        """
+        Cache a namespace's pods locally, kept current by a watch.
+        
+        list_pods and get_pod for the namespace are then answered from the
+        cache instead of a LIST/GET per call. Worth it for long-running
+        processes that query the same namespace repeatedly.
+        
+        Args:
+            namespace: Kubernetes namespace
+            
+        Returns:
+            The running informer
+        """
+        informer = self.informers.get(namespace)
+        if informer is None:
+            informer = PodInformer(self._get_api_client(), namespace)
+            informer.start()
+            self.informers[namespace] = informer
+        return informer
+    
+    def stop_informers(self):
+        """Stop all pod informers; later calls go to the API server again."""
+        for informer in self.informers.values():
+            informer.stop()
+        self.informers.clear()
+    
+    def _get_api_client(self) -> client.ApiClient:
+        """
+        API client shared by every API handle of this manager.
+        
+        Without a loaded kubeconfig, each CoreV1Api()/AppsV1Api() would
+        build its own ApiClient, and with it a fresh connection pool.
+        """
+        if self.api_client is None:
+            self.api_client = client.ApiClient(pool_threads=1)
+        return self.api_client
+    
+    def close(self):
+        """Stop informers and release the API client's connections."""
+        self.stop_informers()
+        
+        if self.api_client is not None:
+            api_client, self.api_client = self.api_client, None
+            api_client.close()
+            api_client.rest_client.pool_manager.clear()
+    
     def list_contexts(self, kubeconfig_path: Optional[str] = None) -> List[str]:
         """List available contexts."""
         try:
             if kubeconfig_path:
                 kubeconfig_path = str(Path(kubeconfig_path).expanduser())
+            else:
+                kubeconfig_path = os.path.expanduser(config.KUBE_CONFIG_DEFAULT_LOCATION)
+            
+            if os.pathsep in kubeconfig_path:
+                # KUBECONFIG lists several files; let the client merge them
+                contexts, _ = config.list_kube_config_contexts(config_file=kubeconfig_path)
+                return [ctx['name'] for ctx in contexts]
             
-            contexts, _ = config.list_kube_config_contexts(config_file=kubeconfig_path)
-            return [ctx['name'] for ctx in contexts]
+            self._read_kubeconfig(kubeconfig_path)
+            return list(self._contexts_cache)
             
         except Exception as e:
             logger.error(f"Failed to list contexts: {e}")
@@ -68,75 +442,190 @@ class KubernetesManager:
     def list_namespaces(self) -> List[str]:
         """List all namespaces."""
         try:
-            v1 = client.CoreV1Api()
-            namespaces = v1.list_namespace()
-            return [ns.metadata.name for ns in namespaces.items]
+            v1 = client.CoreV1Api(self._get_api_client())
+            return [ns['metadata']['name'] for ns in _paginate(v1.list_namespace)]
         except ApiException as e:
             logger.error(f"Failed to list namespaces: {e}")
             raise
     
+    def iter_pods(self, namespace: str = "default",
+                  label_selector: Optional[str] = None,
+                  page_size: int = DEFAULT_PAGE_SIZE) -> Iterator[Dict[str, Any]]:
+        """
+        Iterate over pods in namespace, fetching them in pages.
+        
+        Args:
+            namespace: Kubernetes namespace
+            label_selector: Label selector filter
+            page_size: Pods per API request
+            
+        Yields:
+            Pod information dictionaries
+        """
+        try:
+            informer = self.informers.get(namespace)
+            if informer is not None:
+                for pod in informer.pods(label_selector):
+                    # Model attributes are properties; read each object once
+                    metadata, spec, status = pod.metadata, pod.spec, pod.status
+                    yield {
+                        "name": metadata.name,
+                        "namespace": metadata.namespace,
+                        "status": status.phase,
+                        "node": spec.node_name,
+                        "ip": status.pod_ip,
+                        "containers": len(spec.containers),
+                        "created": metadata.creation_timestamp
+                    }
+                return
+            
+            v1 = client.CoreV1Api(self._get_api_client())
+            for pod in _paginate(v1.list_namespaced_pod, namespace,
+                                 page_size=page_size, label_selector=label_selector):
+                yield _pod_summary(pod)
+            
+        except ApiException as e:
+            logger.error(f"Failed to list pods: {e}")
+            raise
+    
     def list_pods(self, namespace: str = "default",
-                  label_selector: Optional[str] = None) -> List[Dict[str, Any]]:
+                  label_selector: Optional[str] = None,
+                  page_size: int = DEFAULT_PAGE_SIZE) -> List[Dict[str, Any]]:
         """
         List pods in namespace.
         
         Args:
             namespace: Kubernetes namespace
             label_selector: Label selector filter
+            page_size: Pods per API request
             
         Returns:
             List of pod information dictionaries
         """
-        try:
-            v1 = client.CoreV1Api()
-            pods = v1.list_namespaced_pod(namespace, label_selector=label_selector)
-            
-            result = []
-            for pod in pods.items:
-                result.append({
-                    "name": pod.metadata.name,
-                    "namespace": pod.metadata.namespace,
-                    "status": pod.status.phase,
-                    "node": pod.spec.node_name,
-                    "ip": pod.status.pod_ip,
-                    "containers": len(pod.spec.containers),
-                    "created": pod.metadata.creation_timestamp
-                })
+        result = list(self.iter_pods(namespace, label_selector, page_size))
+        logger.info(f"Found {len(result)} pods in namespace {namespace}")
+        return result
+    
+    def list_pods_all_namespaces(self, label_selector: Optional[str] = None,
+                                 page_size: int = DEFAULT_PAGE_SIZE) -> List[Dict[str, Any]]:
+        """
+        List pods in every namespace with one paginated cluster-wide query.
+        
+        Args:
+            label_selector: Label selector filter
+            page_size: Pods per API request
             
-            logger.info(f"Found {len(result)} pods in namespace {namespace}")
+        Returns:
+            List of pod information dictionaries
+        """
+        try:
+            v1 = client.CoreV1Api(self._get_api_client())
+            result = [
+                _pod_summary(pod)
+                for pod in _paginate(v1.list_pod_for_all_namespaces,
+                                     page_size=page_size, label_selector=label_selector)
+            ]
+            
+            logger.info(f"Found {len(result)} pods in all namespaces")
             return result
             
         except ApiException as e:
             logger.error(f"Failed to list pods: {e}")
             raise
     
+    async def list_pods_multi(self, namespaces: List[str],
+                              label_selector: Optional[str] = None
+                              ) -> Dict[str, Union[List[Dict[str, Any]], Exception]]:
+        """
+        List pods in several namespaces concurrently.
+        
+        The requests share this manager's pooled API client, so they run in
+        about the time of the slowest namespace rather than the sum.
+        
+        Args:
+            namespaces: Kubernetes namespaces
+            label_selector: Label selector filter
+            
+        Returns:
+            Namespace -> list of pods, or the exception raised for it
+        """
+        results = await asyncio.gather(
+            *(asyncio.to_thread(self.list_pods, namespace, label_selector)
+              for namespace in namespaces),
+            return_exceptions=True
+        )
+        return dict(zip(namespaces, results))
+    
     def get_pod(self, name: str, namespace: str = "default") -> Dict[str, Any]:
         """Get detailed pod information."""
         try:
-            v1 = client.CoreV1Api()
-            pod = v1.read_namespaced_pod(name, namespace)
+            informer = self.informers.get(namespace)
+            pod = informer.get(name) if informer is not None else None
+            if pod is None:
+                v1 = client.CoreV1Api(self._get_api_client())
+                pod = v1.read_namespaced_pod(name, namespace)
             
+            metadata, spec, status = pod.metadata, pod.spec, pod.status
             return {
-                "name": pod.metadata.name,
-                "namespace": pod.metadata.namespace,
-                "status": pod.status.phase,
-                "node": pod.spec.node_name,
-                "ip": pod.status.pod_ip,
-                "labels": pod.metadata.labels,
-                "containers": [c.name for c in pod.spec.containers],
+                "name": metadata.name,
+                "namespace": metadata.namespace,
+                "status": status.phase,
+                "node": spec.node_name,
+                "ip": status.pod_ip,
+                "labels": metadata.labels,
+                "containers": [c.name for c in spec.containers],
                 "conditions": [{"type": c.type, "status": c.status} 
-                             for c in (pod.status.conditions or [])],
-                "created": pod.metadata.creation_timestamp
+                             for c in (status.conditions or [])],
+                "created": metadata.creation_timestamp
             }
             
         except ApiException as e:
             logger.error(f"Failed to get pod: {e}")
             raise
     
+    def watch_pod(self, name: str, namespace: str = "default",
+                  timeout: Optional[int] = None) -> Iterator[str]:
+        """
+        Follow a pod's phase from a single-pod watch instead of polling get_pod.
+        
+        Args:
+            name: Pod name
+            namespace: Namespace
+            timeout: Seconds before the server ends the watch (None: no limit)
+            
+        Yields:
+            The pod's phase, first as it is now and then on each change;
+            stops when the pod is deleted or the watch times out
+        """
+        v1 = client.CoreV1Api(self._get_api_client())
+        pod_watch = watch.Watch()
+        kwargs = {'timeout_seconds': timeout} if timeout is not None else {}
+        phase = None
+        
+        try:
+            for event in pod_watch.stream(
+                v1.list_namespaced_pod, namespace,
+                field_selector=f"metadata.name={name}", **kwargs
+            ):
+                if event['type'] == 'DELETED':
+                    return
+                
+                # MODIFIED also fires for label, condition and status changes
+                current = event['object'].status.phase
+                if current != phase:
+                    phase = current
+                    yield phase
+                    
+        except ApiException as e:
+            logger.error(f"Failed to watch pod: {e}")
+            raise
+        finally:
+            pod_watch.stop()
+    
     def delete_pod(self, name: str, namespace: str = "default"):
         """Delete a pod."""
         try:
-            v1 = client.CoreV1Api()
+            v1 = client.CoreV1Api(self._get_api_client())
             v1.delete_namespaced_pod(name, namespace)
             logger.info(f"Deleted pod {name} in namespace {namespace}")
         except ApiException as e:
@@ -161,7 +650,7 @@ class KubernetesManager:
             Log content
         """
         try:
-            v1 = client.CoreV1Api()
+            v1 = client.CoreV1Api(self._get_api_client())
             
             if follow:
                 # For streaming, return a generator
@@ -174,35 +663,84 @@ class KubernetesManager:
                 )
                 return logs.stream()
             else:
+                # Raw body: skips the client's response deserialization (older
+                # clients try json.loads on the whole log first)
                 logs = v1.read_namespaced_pod_log(
                     name, namespace,
                     container=container,
-                    tail_lines=tail_lines
+                    tail_lines=tail_lines,
+                    _preload_content=False
                 )
-                return logs
+                return _read_body(logs).decode('utf-8', errors='replace')
                 
         except ApiException as e:
             logger.error(f"Failed to get pod logs: {e}")
             raise
     
-    def list_services(self, namespace: str = "default") -> List[Dict[str, Any]]:
+    def iter_pod_log_lines(self, name: str, namespace: str = "default",
+                           container: Optional[str] = None,
+                           tail_lines: Optional[int] = 100) -> Iterator[str]:
+        """
+        Iterate over pod log lines as the response body streams in.
+        
+        Unlike get_pod_logs, the log is never held in memory as one string.
+        
+        Args:
+            name: Pod name
+            namespace: Namespace
+            container: Container name (if pod has multiple containers)
+            tail_lines: Number of lines to retrieve
+            
+        Yields:
+            Log lines, without line endings
+        """
+        try:
+            v1 = client.CoreV1Api(self._get_api_client())
+            resp = v1.read_namespaced_pod_log(
+                name, namespace,
+                container=container,
+                tail_lines=tail_lines,
+                _preload_content=False
+            )
+        except ApiException as e:
+            logger.error(f"Failed to get pod logs: {e}")
+            raise
+        
+        try:
+            if not 200 <= resp.status <= 299:
+                raise ApiException(status=resp.status, reason=resp.reason)
+            
+            # Chunks don't align with lines; carry the partial tail
+            pending = b''
+            for chunk in resp.stream(decode_content=True):
+                *lines, pending = (pending + chunk).split(b'\n')
+                if lines:
+                    yield from b'\n'.join(lines).decode('utf-8', errors='replace').split('\n')
+            
+            if pending:
+                yield pending.decode('utf-8', errors='replace')
+        finally:
+            resp.release_conn()
+    
+    def list_services(self, namespace: str = "default",
+                      page_size: int = DEFAULT_PAGE_SIZE) -> List[Dict[str, Any]]:
         """List services in namespace."""
         try:
-            v1 = client.CoreV1Api()
-            services = v1.list_namespaced_service(namespace)
+            v1 = client.CoreV1Api(self._get_api_client())
             
             result = []
-            for svc in services.items:
+            for svc in _paginate(v1.list_namespaced_service, namespace, page_size=page_size):
+                metadata, spec = svc['metadata'], svc.get('spec') or {}
                 result.append({
-                    "name": svc.metadata.name,
-                    "namespace": svc.metadata.namespace,
-                    "type": svc.spec.type,
-                    "cluster_ip": svc.spec.cluster_ip,
-                    "external_ips": svc.spec.external_i_ps or [],
-                    "ports": [{"port": p.port, "protocol": p.protocol, 
-                              "target_port": str(p.target_port)} 
-                             for p in (svc.spec.ports or [])],
-                    "selector": svc.spec.selector
+                    "name": metadata['name'],
+                    "namespace": metadata.get('namespace'),
+                    "type": spec.get('type'),
+                    "cluster_ip": spec.get('clusterIP'),
+                    "external_ips": spec.get('externalIPs') or [],
+                    "ports": [{"port": p.get('port'), "protocol": p.get('protocol'),
+                              "target_port": str(p.get('targetPort'))}
+                             for p in (spec.get('ports') or [])],
+                    "selector": spec.get('selector')
                 })
             
             return result
@@ -211,24 +749,27 @@ class KubernetesManager:
             logger.error(f"Failed to list services: {e}")
             raise
     
-    def list_deployments(self, namespace: str = "default") -> List[Dict[str, Any]]:
+    def list_deployments(self, namespace: str = "default",
+                         page_size: int = DEFAULT_PAGE_SIZE) -> List[Dict[str, Any]]:
         """List deployments in namespace."""
         try:
-            apps_v1 = client.AppsV1Api()
-            deployments = apps_v1.list_namespaced_deployment(namespace)
+            apps_v1 = client.AppsV1Api(self._get_api_client())
             
             result = []
-            for deploy in deployments.items:
+            for deploy in _paginate(apps_v1.list_namespaced_deployment, namespace,
+                                    page_size=page_size):
+                metadata, spec = deploy['metadata'], deploy['spec']
+                status = deploy.get('status') or {}
                 result.append({
-                    "name": deploy.metadata.name,
-                    "namespace": deploy.metadata.namespace,
-                    "replicas": deploy.spec.replicas,
-                    "ready_replicas": deploy.status.ready_replicas or 0,
-                    "available_replicas": deploy.status.available_replicas or 0,
-                    "updated_replicas": deploy.status.updated_replicas or 0,
-                    "labels": deploy.metadata.labels,
-                    "selector": deploy.spec.selector.match_labels,
-                    "created": deploy.metadata.creation_timestamp
+                    "name": metadata['name'],
+                    "namespace": metadata.get('namespace'),
+                    "replicas": spec.get('replicas'),
+                    "ready_replicas": status.get('readyReplicas') or 0,
+                    "available_replicas": status.get('availableReplicas') or 0,
+                    "updated_replicas": status.get('updatedReplicas') or 0,
+                    "labels": metadata.get('labels'),
+                    "selector": spec['selector'].get('matchLabels'),
+                    "created": _parse_time(metadata.get('creationTimestamp'))
                 })
             
             return result
@@ -241,7 +782,7 @@ class KubernetesManager:
                         namespace: str = "default"):
         """Scale deployment to specified replica count."""
         try:
-            apps_v1 = client.AppsV1Api()
+            apps_v1 = client.AppsV1Api(self._get_api_client())
             
             # Get current deployment
             deployment = apps_v1.read_namespaced_deployment(name, namespace)
@@ -261,7 +802,7 @@ class KubernetesManager:
     def restart_deployment(self, name: str, namespace: str = "default"):
         """Restart deployment by updating restart annotation."""
         try:
-            apps_v1 = client.AppsV1Api()
+            apps_v1 = client.AppsV1Api(self._get_api_client())
             
             # Get current deployment
             deployment = apps_v1.read_namespaced_deployment(name, namespace)
@@ -283,22 +824,24 @@ class KubernetesManager:
             logger.error(f"Failed to restart deployment: {e}")
             raise
     
-    def get_node_info(self) -> List[Dict[str, Any]]:
+    def get_node_info(self, page_size: int = DEFAULT_PAGE_SIZE) -> List[Dict[str, Any]]:
         """Get information about cluster nodes."""
         try:
-            v1 = client.CoreV1Api()
-            nodes = v1.list_node()
+            v1 = client.CoreV1Api(self._get_api_client())
             
             result = []
-            for node in nodes.items:
+            for node in _paginate(v1.list_node, page_size=page_size):
+                status = node['status']
+                node_info = status.get('nodeInfo') or {}
                 result.append({
-                    "name": node.metadata.name,
-                    "status": [c.type for c in node.status.conditions if c.status == "True"],
-                    "capacity": node.status.capacity,
-                    "allocatable": node.status.allocatable,
-                    "os": node.status.node_info.os_image,
-                    "kernel": node.status.node_info.kernel_version,
-                    "container_runtime": node.status.node_info.container_runtime_version
+                    "name": node['metadata']['name'],
+                    "status": [c['type'] for c in status.get('conditions') or []
+                               if c.get('status') == "True"],
+                    "capacity": status.get('capacity'),
+                    "allocatable": status.get('allocatable'),
+                    "os": node_info.get('osImage'),
+                    "kernel": node_info.get('kernelVersion'),
+                    "container_runtime": node_info.get('containerRuntimeVersion')
                 })
             
             return result
@@ -307,25 +850,30 @@ class KubernetesManager:
             logger.error(f"Failed to get node info: {e}")
             raise
     
-    def execute_in_pod(self, name: str, command: List[str],
-                      namespace: str = "default",
-                      container: Optional[str] = None) -> str:
+    def exec_stream(self, name: str, command: List[str],
+                    namespace: str = "default",
+                    container: Optional[str] = None,
+                    timeout: float = 1) -> Iterator[str]:
         """
-        Execute command in a pod.
+        Execute command in a pod, yielding output as it arrives.
+        
+        stdout and stderr chunks are yielded in the order they are received,
+        so large outputs never have to be held in memory as one string.
         
         Args:
             name: Pod name
             command: Command to execute (as list)
             namespace: Namespace
             container: Container name (if multiple containers)
+            timeout: Seconds to wait for output before checking the connection
             
-        Returns:
-            Command output
+        Yields:
+            Output chunks
         """
         try:
             from kubernetes.stream import stream
             
-            v1 = client.CoreV1Api()
+            v1 = client.CoreV1Api(self._get_api_client())
             
             resp = stream(
                 v1.connect_get_namespaced_pod_exec,
@@ -336,11 +884,41 @@ class KubernetesManager:
                 stderr=True,
                 stdin=False,
                 stdout=True,
-                tty=False
+                tty=False,
+                _preload_content=False
             )
-            
-            return resp
-            
         except ApiException as e:
             logger.error(f"Failed to execute command in pod: {e}")
             raise
+        
+        try:
+            while True:
+                is_open = resp.is_open()
+                if is_open:
+                    resp.update(timeout=timeout)
+                if resp.peek_stdout():
+                    yield resp.read_stdout()
+                if resp.peek_stderr():
+                    yield resp.read_stderr()
+                # Frames received before the close are drained above
+                if not is_open:
+                    break
+        finally:
+            resp.close()
+    
+    def execute_in_pod(self, name: str, command: List[str],
+                      namespace: str = "default",
+                      container: Optional[str] = None) -> str:
+        """
+        Execute command in a pod.
+        
+        Args:
+            name: Pod name
+            command: Command to execute (as list)
+            namespace: Namespace
+            container: Container name (if multiple containers)
+            
+        Returns:
+            Command output
+        """
+        return "".join(self.exec_stream(name, command, namespace, container))
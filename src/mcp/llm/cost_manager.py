@@ -1,14 +1,49 @@
 """Cost management and token optimization for LLM usage."""
 
+import atexit
 import logging
-from typing import Dict, Any, Optional
-from datetime import datetime, timedelta
+import sqlite3
+import threading
+import time
+from collections import deque
+from functools import lru_cache
+from itertools import chain, islice
+from typing import Dict, Any, Iterable, List, Optional, Tuple, Union
+from datetime import datetime, time as dt_time, timedelta
 from pathlib import Path
 import json
 
+try:
+    import orjson
+except ImportError:  # pragma: no cover - optional speedup
+    orjson = None
+
+try:
+    import tiktoken
+except ImportError:  # pragma: no cover - optional exact token counts
+    tiktoken = None
+
 logger = logging.getLogger(__name__)
 
 
+@lru_cache(maxsize=None)
+def _get_encoding():
+    """
+    Shared cl100k_base tokenizer, or None to fall back to estimates.
+    
+    tiktoken downloads the encoding on first use, so it can be unavailable
+    even when the package is installed (e.g. offline).
+    """
+    if tiktoken is None:
+        return None
+    
+    try:
+        return tiktoken.get_encoding("cl100k_base")
+    except Exception as e:
+        logger.warning(f"tiktoken encoding unavailable, estimating tokens: {e}")
+        return None
+
+
 class CostManager:
     """Manages LLM API costs and budget limits."""
     
@@ -23,52 +58,172 @@ class CostManager:
         self.daily_limit = config.get('daily_budget', 10.0)
         self.monthly_limit = config.get('monthly_budget', 200.0)
         self.alert_threshold = config.get('alert_at', 0.8)
-        
-        # Track usage
-        self.usage_file = Path.home() / '.orbit' / 'usage.json'
-        self.usage_file.parent.mkdir(parents=True, exist_ok=True)
+        # Reciprocals so the per-request alert check multiplies
+        self._inv_daily = 1.0 / self.daily_limit if self.daily_limit else 0.0
+        self._inv_monthly = 1.0 / self.monthly_limit if self.monthly_limit else 0.0
+        # Spend below these bounds is within budget and raises no alert
+        self._daily_alert_bound = min(self.alert_threshold, 1.0) * self.daily_limit
+        self._monthly_alert_bound = min(self.alert_threshold, 1.0) * self.monthly_limit
+        
+        # Track usage: one row per LLM call, aggregated per day/month
+        self.usage_db = Path.home() / '.orbit' / 'usage.db'
+        self.usage_db.parent.mkdir(parents=True, exist_ok=True)
+        self._db = self._open_db()
+        
+        # Write-behind buffer: recorded calls are inserted in batches
+        self._pending: List[Tuple[str, float, int, float]] = []
+        self._last_flush = time.monotonic()
+        self._lock = threading.Lock()
+        atexit.register(self._flush)
         
         self.usage = self._load_usage()
+        
+        # Summary built from the running counters; rebuilt after they change
+        self._summary: Optional[Dict[str, Any]] = None
+    
+    def _open_db(self) -> sqlite3.Connection:
+        """Open the usage database, creating (and migrating into) it if needed."""
+        # Autocommit outside the explicit batch transactions in _flush
+        db = sqlite3.connect(str(self.usage_db), isolation_level=None,
+                             check_same_thread=False)
+        # WAL lets several orbit processes record usage concurrently
+        db.execute("PRAGMA journal_mode=WAL")
+        db.execute("PRAGMA synchronous=NORMAL")
+        
+        created = db.execute(
+            "SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = 'usage'"
+        ).fetchone() is None
+        db.execute(
+            "CREATE TABLE IF NOT EXISTS usage "
+            "(provider TEXT NOT NULL, ts REAL NOT NULL, tokens INTEGER NOT NULL, cost REAL NOT NULL)"
+        )
+        db.execute("CREATE INDEX IF NOT EXISTS usage_ts ON usage (ts)")
+        
+        if created:
+            self._import_legacy_usage(db)
+        
+        return db
+    
+    def _import_legacy_usage(self, db: sqlite3.Connection):
+        """Carry the counters of the old usage.json over as aggregate rows."""
+        legacy_file = self.usage_db.with_name('usage.json')
+        if not legacy_file.exists():
+            return
+        
+        try:
+            raw = legacy_file.read_bytes()
+            legacy = orjson.loads(raw) if orjson is not None else json.loads(raw)
+            
+            day_start, month_start = self._period_starts()
+            daily = legacy['daily'] if legacy['daily']['date'] == datetime.now().date().isoformat() \
+                else {'cost': 0.0, 'tokens': 0}
+            monthly = legacy['monthly'] if legacy['monthly']['month'] == datetime.now().strftime('%Y-%m') \
+                else {'cost': 0.0, 'tokens': 0}
+            total = legacy['total']
+            
+            # Nested periods: each row holds what the enclosing period adds
+            rows = [
+                (day_start, daily['tokens'], daily['cost']),
+                (month_start, monthly['tokens'] - daily['tokens'], monthly['cost'] - daily['cost']),
+                (0.0, total['tokens'] - monthly['tokens'], total['cost'] - monthly['cost']),
+            ]
+            db.executemany(
+                "INSERT INTO usage (provider, ts, tokens, cost) VALUES ('legacy', ?, ?, ?)",
+                [row for row in rows if row[1] or row[2]]
+            )
+            logger.info(f"Imported usage totals from {legacy_file}")
+        except Exception as e:
+            logger.warning(f"Failed to import legacy usage data: {e}")
+    
+    @staticmethod
+    def _period_starts() -> Tuple[float, float]:
+        """Epoch timestamps of the start of the current local day and month."""
+        today = datetime.combine(datetime.now().date(), dt_time.min)
+        return today.timestamp(), today.replace(day=1).timestamp()
     
     def _load_usage(self) -> Dict[str, Any]:
-        """Load usage tracking data."""
-        if self.usage_file.exists():
-            try:
-                with open(self.usage_file, 'r') as f:
-                    return json.load(f)
-            except Exception as e:
-                logger.warning(f"Failed to load usage data: {e}")
+        """Aggregate the day, month and all-time totals in the database."""
+        self._flush()
+        now = datetime.now()
+        day_start, month_start = self._period_starts()
+        
+        # Day ends never fall after month ends, so this bounds both periods
+        self._day_end = datetime.combine(now.date() + timedelta(days=1), dt_time.min).timestamp()
+        
+        try:
+            row = self._db.execute(
+                "SELECT "
+                "COALESCE(SUM(CASE WHEN ts >= ? THEN cost END), 0.0), "
+                "COALESCE(SUM(CASE WHEN ts >= ? THEN tokens END), 0), "
+                "COALESCE(SUM(CASE WHEN ts >= ? THEN cost END), 0.0), "
+                "COALESCE(SUM(CASE WHEN ts >= ? THEN tokens END), 0), "
+                "COALESCE(SUM(cost), 0.0), COALESCE(SUM(tokens), 0) "
+                "FROM usage",
+                (day_start, day_start, month_start, month_start)
+            ).fetchone()
+        except sqlite3.Error as e:
+            logger.warning(f"Failed to load usage data: {e}")
+            row = (0.0, 0, 0.0, 0, 0.0, 0)
         
         return {
-            'daily': {'date': datetime.now().date().isoformat(), 'cost': 0.0, 'tokens': 0},
-            'monthly': {'month': datetime.now().strftime('%Y-%m'), 'cost': 0.0, 'tokens': 0},
-            'total': {'cost': 0.0, 'tokens': 0}
+            'daily': {'date': now.date().isoformat(), 'cost': row[0], 'tokens': row[1]},
+            'monthly': {'month': now.strftime('%Y-%m'), 'cost': row[2], 'tokens': row[3]},
+            'total': {'cost': row[4], 'tokens': row[5]}
         }
     
-    def _save_usage(self):
-        """Save usage tracking data."""
-        try:
-            with open(self.usage_file, 'w') as f:
-                json.dump(self.usage, f, indent=2)
-        except Exception as e:
-            logger.error(f"Failed to save usage data: {e}")
+    def _reset_if_needed(self) -> bool:
+        """
+        Start new daily/monthly counters if the day or month changed.
+        
+        Returns:
+            True if the counters were re-aggregated
+        """
+        # One float comparison on the common path
+        if time.time() < self._day_end:
+            return False
+        
+        logger.info(f"New day - resetting daily usage (was ${self.usage['daily']['cost']:.2f})")
+        # Range queries over the recorded calls give the new periods' totals
+        self.usage = self._load_usage()
+        self._summary = None
+        return True
+    
+    # Buffered calls are written once this many accumulate, or once the
+    # oldest has waited this long (checked when the next call is recorded)
+    FLUSH_BATCH_SIZE = 32
+    FLUSH_INTERVAL = 0.5
+    
+    def _maybe_flush(self):
+        """Write the buffered calls if the batch is full or old enough."""
+        if (len(self._pending) >= self.FLUSH_BATCH_SIZE
+                or time.monotonic() - self._last_flush > self.FLUSH_INTERVAL):
+            self._flush()
+    
+    def _flush(self):
+        """Write all buffered calls in one transaction."""
+        # Held while writing too: the connection is shared between threads
+        with self._lock:
+            pending, self._pending = self._pending, []
+            self._last_flush = time.monotonic()
+            
+            if not pending:
+                return
+            
+            try:
+                with self._db:
+                    self._db.execute("BEGIN")
+                    self._db.executemany(
+                        "INSERT INTO usage (provider, ts, tokens, cost) VALUES (?, ?, ?, ?)",
+                        pending
+                    )
+            except sqlite3.Error as e:
+                logger.error(f"Failed to save usage data: {e}")
     
-    def _reset_if_needed(self):
-        """Reset counters if day/month changed."""
-        today = datetime.now().date().isoformat()
-        this_month = datetime.now().strftime('%Y-%m')
-        
-        # Reset daily if new day
-        if self.usage['daily']['date'] != today:
-            logger.info(f"New day - resetting daily usage (was ${self.usage['daily']['cost']:.2f})")
-            self.usage['daily'] = {'date': today, 'cost': 0.0, 'tokens': 0}
-        
-        # Reset monthly if new month
-        if self.usage['monthly']['month'] != this_month:
-            logger.info(f"New month - resetting monthly usage (was ${self.usage['monthly']['cost']:.2f})")
-            self.usage['monthly'] = {'month': this_month, 'cost': 0.0, 'tokens': 0}
-        
-        self._save_usage()
+    def close(self):
+        """Write any buffered calls and close the usage database."""
+        self._flush()
+        atexit.unregister(self._flush)
+        self._db.close()
     
     def can_make_request(self, estimated_cost: float) -> bool:
         """
@@ -80,27 +235,34 @@ class CostManager:
         Returns:
             True if within budget
         """
+        # Fast path: same day, and well clear of both limits
+        if (time.time() < self._day_end
+                and self.usage['daily']['cost'] + estimated_cost < self._daily_alert_bound
+                and self.usage['monthly']['cost'] + estimated_cost < self._monthly_alert_bound):
+            return True
+        
         self._reset_if_needed()
         
         daily_remaining = self.daily_limit - self.usage['daily']['cost']
         monthly_remaining = self.monthly_limit - self.usage['monthly']['cost']
         
         if estimated_cost > daily_remaining:
-            logger.warning(f"Request would exceed daily budget: ${estimated_cost:.4f} > ${daily_remaining:.2f}")
+            logger.warning("Request would exceed daily budget: $%.4f > $%.2f", estimated_cost, daily_remaining)
             return False
         
         if estimated_cost > monthly_remaining:
-            logger.warning(f"Request would exceed monthly budget: ${estimated_cost:.4f} > ${monthly_remaining:.2f}")
+            logger.warning("Request would exceed monthly budget: $%.4f > $%.2f", estimated_cost, monthly_remaining)
             return False
         
         # Alert if approaching limits
-        daily_usage_pct = self.usage['daily']['cost'] / self.daily_limit
-        if daily_usage_pct >= self.alert_threshold:
-            logger.warning(f"??  {daily_usage_pct*100:.0f}% of daily budget used")
-        
-        monthly_usage_pct = self.usage['monthly']['cost'] / self.monthly_limit
-        if monthly_usage_pct >= self.alert_threshold:
-            logger.warning(f"??  {monthly_usage_pct*100:.0f}% of monthly budget used")
+        if logger.isEnabledFor(logging.WARNING):
+            daily_usage_pct = self.usage['daily']['cost'] * self._inv_daily
+            if daily_usage_pct >= self.alert_threshold:
+                logger.warning("??  %.0f%% of daily budget used", daily_usage_pct * 100)
+            
+            monthly_usage_pct = self.usage['monthly']['cost'] * self._inv_monthly
+            if monthly_usage_pct >= self.alert_threshold:
+                logger.warning("??  %.0f%% of monthly budget used", monthly_usage_pct * 100)
         
         return True
     
@@ -121,16 +283,31 @@ class CostManager:
         self.usage['monthly']['tokens'] += tokens
         self.usage['total']['cost'] += cost
         self.usage['total']['tokens'] += tokens
+        self._summary = None
         
-        self._save_usage()
+        with self._lock:
+            self._pending.append((provider, time.time(), tokens, cost))
+        self._maybe_flush()
         
         logger.info(f"Usage recorded: {provider} - {tokens} tokens, ${cost:.4f}")
         logger.debug(f"Daily: ${self.usage['daily']['cost']:.2f} / ${self.daily_limit:.2f}")
     
     def get_usage_summary(self) -> Dict[str, Any]:
-        """Get usage summary."""
+        """
+        Get usage summary.
+        
+        Totals are kept incrementally by record_usage, so this queries the
+        database only when the day or month rolled over.
+        """
         self._reset_if_needed()
         
+        if self._summary is None:
+            self._summary = self._build_summary()
+        
+        return self._summary
+    
+    def _build_summary(self) -> Dict[str, Any]:
+        """Build the usage summary from the running counters."""
         return {
             'daily': {
                 **self.usage['daily'],
@@ -207,50 +384,72 @@ class TokenOptimizer:
         """
         self.max_context_tokens = max_context_tokens
     
-    def optimize_log_content(self, log_content: str, max_lines: int = 500) -> str:
+    # Trailing lines always kept from long logs
+    _RECENT_LINES = 100
+    
+    def optimize_log_content(self, log_content: Union[str, Iterable[str]],
+                             max_lines: int = 500) -> str:
         """
         Optimize log content to reduce tokens.
         
+        Long logs are reduced in one pass to their error lines, warning
+        lines and most recent lines, so an iterable of lines (e.g. a log
+        stream) is never held in memory in full.
+        
         Args:
-            log_content: Raw log content
+            log_content: Raw log content, or an iterable of lines
             max_lines: Maximum lines to keep
             
         Returns:
             Optimized log content
         """
-        lines = log_content.split('\n')
-        
-        if len(lines) <= max_lines:
-            return log_content
-        
-        # Extract relevant lines (errors, warnings)
-        error_lines = [l for l in lines if any(
-            keyword in l.lower() 
-            for keyword in ['error', 'exception', 'fail', 'critical']
-        )]
-        
-        warning_lines = [l for l in lines if 'warning' in l.lower() or 'warn' in l.lower()]
-        
-        # Take recent lines
-        recent_lines = lines[-100:]
-        
-        # Combine
-        relevant = error_lines + warning_lines + recent_lines
-        
-        # Deduplicate while preserving order
-        seen = set()
-        optimized = []
-        for line in relevant:
-            if line not in seen:
-                seen.add(line)
-                optimized.append(line)
-            if len(optimized) >= max_lines:
-                break
-        
+        if isinstance(log_content, str):
+            lines = log_content.split('\n')
+            if len(lines) <= max_lines:
+                return log_content
+        else:
+            lines = log_content
+        
+        # Dicts as insertion-ordered sets; no more than max_lines of each can
+        # make it into the result
+        head = []
+        errors = {}
+        warnings = {}
+        recent = deque(maxlen=self._RECENT_LINES)
+        total_lines = total_chars = 0
+        
+        for line in lines:
+            total_lines += 1
+            total_chars += len(line) + 1
+            
+            # Short logs are returned whole
+            if head is not None:
+                head.append(line)
+                if len(head) > max_lines:
+                    head = None
+            
+            # Chained substring tests: several times faster per line than a
+            # generator over a keyword list or a case-insensitive regex.
+            # Lines that are both are listed with the errors.
+            lower = line.lower()
+            if ('error' in lower or 'exception' in lower
+                    or 'fail' in lower or 'critical' in lower):
+                if len(errors) < max_lines:
+                    errors[line] = None
+            elif len(warnings) < max_lines and 'warn' in lower:
+                warnings[line] = None
+            recent.append(line)
+        
+        if head is not None:
+            return '\n'.join(head)
+        
+        # Errors first, then warnings, then recent lines, deduplicated; only
+        # the kept lines are copied out of the ordered dict
+        optimized = list(islice(dict.fromkeys(chain(errors, warnings, recent)), max_lines))
         result = '\n'.join(optimized)
         
-        logger.info(f"Optimized log: {len(lines)} ? {len(optimized)} lines "
-                   f"({len(log_content)} ? {len(result)} chars)")
+        logger.info(f"Optimized log: {total_lines} ? {len(optimized)} lines "
+                   f"({total_chars - 1} ? {len(result)} chars)")
         
         return result
     
@@ -264,24 +463,40 @@ class TokenOptimizer:
         Returns:
             Optimized context
         """
-        # Rough estimate: 1 token ? 4 characters
-        estimated_tokens = len(context) // 4
-        
-        if estimated_tokens <= self.max_context_tokens:
-            return context
-        
-        # Need to truncate
-        target_chars = self.max_context_tokens * 4
-        
-        # Keep first and last parts
-        keep_start = target_chars // 2
-        keep_end = target_chars // 2
-        
-        truncated = (
-            context[:keep_start] +
-            f"\n\n... [TRUNCATED {estimated_tokens - self.max_context_tokens} tokens] ...\n\n" +
-            context[-keep_end:]
-        )
+        encoding = _get_encoding()
+        if encoding is not None:
+            tokens = encoding.encode(context, disallowed_special=())
+            estimated_tokens = len(tokens)
+            if estimated_tokens <= self.max_context_tokens:
+                return context
+            
+            # Keep the first and last halves of the budget, cut on token boundaries
+            keep = self.max_context_tokens // 2
+            head = encoding.decode(tokens[:keep])
+            tail = encoding.decode(tokens[-keep:]) if keep else ''
+        else:
+            # Rough estimate: 1 token ? 4 characters
+            estimated_tokens = len(context) // 4
+            if estimated_tokens <= self.max_context_tokens:
+                return context
+            
+            keep = self.max_context_tokens * 4 // 2
+            head = context[:keep]
+            tail = context[-keep:] if keep else ''
+        
+        # Snap both cuts to line boundaries so no partial line survives
+        head_end = len(head)
+        tail_start = len(context) - len(tail)
+        newline = context.rfind('\n', 0, head_end)
+        if newline > 0:
+            head_end = newline
+        newline = context.find('\n', tail_start - 1) if tail_start else -1
+        if newline != -1 and newline + 1 < len(context):
+            tail_start = newline + 1
+        tail_start = max(tail_start, head_end)
+        
+        banner = f"\n\n... [TRUNCATED {estimated_tokens - self.max_context_tokens} tokens] ...\n\n"
+        truncated = context[:head_end] + banner + context[tail_start:]
         
         logger.warning(f"Context truncated: {estimated_tokens} ? {self.max_context_tokens} tokens")
         
@@ -318,14 +533,20 @@ Provide a brief summary (max 200 words) of the key issues."""
         """
         Estimate token count for text.
         
+        Exact cl100k_base counts when tiktoken is available (OpenAI's
+        tokenizer; a close approximation for other providers).
+        
         Args:
             text: Text to estimate
             
         Returns:
             Estimated token count
         """
+        encoding = _get_encoding()
+        if encoding is not None:
+            return len(encoding.encode(text, disallowed_special=()))
+        
         # Rough estimate: 1 token ? 4 characters
-        # More accurate would use tiktoken for OpenAI
         return len(text) // 4
     
     def should_use_streaming(self, estimated_response_tokens: int) -> bool:
@@ -340,3 +561,19 @@ Provide a brief summary (max 200 words) of the key issues."""
         """
         # Stream for responses > 500 tokens (better UX)
         return estimated_response_tokens > 500
+
+
+def reduce_log_content(log_content: str, max_lines: int = 500) -> str:
+    """
+    Reduce a log with TokenOptimizer.optimize_log_content.
+    
+    Module-level so it can be pickled and run in a worker process.
+    
+    Args:
+        log_content: Raw log content
+        max_lines: Maximum lines to keep
+        
+    Returns:
+        Optimized log content
+    """
+    return TokenOptimizer().optimize_log_content(log_content, max_lines)
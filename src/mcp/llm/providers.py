@@ -2,19 +2,33 @@
 
 import logging
 import asyncio
-from typing import Dict, Any, List, Optional, AsyncIterator
+from typing import Dict, Any, List, Optional, Tuple, AsyncIterator, Union
 from abc import ABC, abstractmethod
 from dataclasses import dataclass
+import importlib.util
+import json
 import os
 
+try:
+    import orjson
+except ImportError:  # pragma: no cover - optional speedup
+    orjson = None
+
 logger = logging.getLogger(__name__)
 
+# JSON decoder for provider response bodies and NDJSON streams
+_json_loads = orjson.loads if orjson is not None else json.loads
+
+# HTTP/2 (one multiplexed connection per API host) needs the optional h2 package
+_HTTP2_AVAILABLE = importlib.util.find_spec('h2') is not None
+
 
 @dataclass
 class LLMMessage:
     """LLM message structure."""
     role: str  # system, user, assistant
     content: str
+    cache: bool = False  # Prompt-cache breakpoint (providers that support it)
 
 
 @dataclass
@@ -27,12 +41,40 @@ class LLMResponse:
     finish_reason: Optional[str] = None
 
 
+def _require_package(name: str, provider: str):
+    """
+    Fail at provider setup, not on the first request, if its SDK is missing.
+    
+    Only checks the package can be found; the (slow) SDK import itself is
+    deferred until the provider's client is first needed.
+    """
+    if importlib.util.find_spec(name) is None:
+        raise ImportError(f"{provider} provider requires the '{name}' package (pip install {name})")
+
+
+# Connection pool settings accepted per provider and under llm.http
+_POOL_SETTINGS = ('http2', 'max_connections', 'max_keepalive', 'keepalive', 'timeout')
+
+
+def _pool_settings(cfg: Dict[str, Any]) -> Dict[str, Any]:
+    """Connection pool settings present in a provider's config."""
+    return {key: cfg[key] for key in _POOL_SETTINGS if key in cfg}
+
+
+async def _log_http_version(response):
+    """httpx response hook: log the negotiated protocol (e.g. HTTP/2)."""
+    logger.debug("%s %s -> %s %s", response.request.method, response.request.url.host,
+                 response.http_version, response.status_code)
+
+
 class LLMProvider(ABC):
     """Base class for LLM providers."""
     
     def __init__(self, model: str, api_key: Optional[str] = None, **kwargs):
         self.model = model
         self.api_key = api_key
+        # HTTP client pool shared with the other providers (see LLMClient)
+        self.shared_http = kwargs.pop('shared_http', None)
         self.config = kwargs
     
     @abstractmethod
@@ -53,29 +95,203 @@ class LLMProvider(ABC):
         temperature: float = 0.7,
         max_tokens: Optional[int] = None
     ) -> AsyncIterator[str]:
-        """Generate streaming LLM response."""
+        """
+        Generate streaming LLM response.
+        
+        Implementations yield each chunk as soon as it is read, without
+        buffering ahead, so a slow consumer holds back the HTTP read; and
+        read inside a context manager, so closing the generator early
+        releases the response.
+        """
         pass
     
     @abstractmethod
-    def estimate_cost(self, tokens: int) -> float:
-        """Estimate cost for token count."""
+    def estimate_cost(self, input_tokens: int, output_tokens: int) -> float:
+        """Cost of a request from its prompt and completion token counts."""
         pass
+    
+    # Per-1K-token prices by model name, and the fallback for unknown models
+    PRICING: Dict[str, Dict[str, float]] = {}
+    DEFAULT_PRICING = {'input': 0.0, 'output': 0.0}
+    
+    def _pricing(self) -> Dict[str, float]:
+        """Prices for the model; dated ids (e.g. gpt-4o-2024-08-06) use their base name."""
+        pricing = self.PRICING.get(self.model)
+        if pricing is None:
+            names = [name for name in self.PRICING if self.model.startswith(name)]
+            pricing = self.PRICING[max(names, key=len)] if names else self.DEFAULT_PRICING
+        return pricing
+    
+    async def generate_batch(
+        self,
+        conversations: List[List[LLMMessage]],
+        temperature: float = 0.7,
+        max_tokens: Optional[int] = None
+    ) -> List[LLMResponse]:
+        """
+        Generate responses for several independent conversations.
+        
+        Providers with a batch API override this; the default runs the
+        requests concurrently.
+        
+        Args:
+            conversations: Message lists, one per request
+            temperature: Sampling temperature
+            max_tokens: Maximum tokens to generate per request
+            
+        Returns:
+            Responses, in the order of the conversations
+        """
+        return list(await asyncio.gather(*(
+            self.generate(messages, temperature=temperature, max_tokens=max_tokens)
+            for messages in conversations
+        )))
+    
+    async def aclose(self):
+        """Release pooled HTTP connections (if the provider keeps any)."""
+        pass
+    
+    def _http_client(self, sdk):
+        """
+        Async HTTP client for an SDK, sized by the provider config.
+        
+        A provider with its own pool settings gets its own client; otherwise
+        it uses the client shared through LLMClient, if there is one.
+        
+        Args:
+            sdk: The imported openai/anthropic module
+            
+        Returns:
+            Client honouring http2, max_connections, max_keepalive and
+            timeout, or None to keep the SDK's defaults when none applies
+        """
+        if self.shared_http is not None and not _pool_settings(self.config):
+            return self.shared_http.get(sdk)
+        
+        overrides = _http_client_options(self.config)
+        if not overrides:
+            return None
+        return sdk.DefaultAsyncHttpxClient(**overrides)
+    
+    def _owns_http_client(self) -> bool:
+        """Whether closing the SDK client may close its HTTP client too."""
+        return self.shared_http is None or bool(_pool_settings(self.config))
+
+
+def _http_client_options(settings: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    Keyword arguments for an SDK's DefaultAsyncHttpxClient.
+    
+    Args:
+        settings: Connection pool settings (see _POOL_SETTINGS)
+        
+    Returns:
+        Overrides for http2, limits and timeout; empty when none applies
+    """
+    overrides = {}
+    # On by default whenever h2 is installed
+    if settings.get('http2', _HTTP2_AVAILABLE):
+        overrides['http2'] = True
+    if 'max_connections' in settings or 'max_keepalive' in settings:
+        import httpx
+        overrides['limits'] = httpx.Limits(
+            max_connections=settings.get('max_connections', 100),
+            max_keepalive_connections=settings.get('max_keepalive', 20)
+        )
+    if 'timeout' in settings:
+        overrides['timeout'] = settings['timeout']
+    
+    if overrides and logger.isEnabledFor(logging.DEBUG):
+        overrides['event_hooks'] = {'response': [_log_http_version]}
+    return overrides
+
+
+class SharedHTTPClient:
+    """
+    One async HTTP client shared by the OpenAI and Anthropic providers.
+    
+    Both SDKs accept an httpx client, so they can share a single pool,
+    DNS cache and connection limit. The client is built on first use, by
+    whichever SDK asks first, so neither SDK is imported before it's needed.
+    """
+    
+    def __init__(self, settings: Optional[Dict[str, Any]] = None):
+        """
+        Initialize the shared client holder.
+        
+        Args:
+            settings: Connection pool settings (see _POOL_SETTINGS)
+        """
+        self.settings = settings or {}
+        self._client = None
+    
+    def get(self, sdk):
+        """
+        Get the shared client, creating it on first use.
+        
+        Args:
+            sdk: The imported openai/anthropic module
+            
+        Returns:
+            The shared async HTTP client
+        """
+        if self._client is None:
+            self._client = sdk.DefaultAsyncHttpxClient(**_http_client_options(self.settings))
+        return self._client
+    
+    async def aclose(self):
+        """Close the shared client's connections."""
+        if self._client is not None:
+            await self._client.aclose()
+            self._client = None
 
 
 class OpenAIProvider(LLMProvider):
     """OpenAI (ChatGPT) provider."""
     
     PRICING = {
-        'gpt-4-turbo': {'input': 0.01, 'output': 0.03},  # per 1K tokens
+        'gpt-4.1': {'input': 0.002, 'output': 0.008},  # per 1K tokens
+        'gpt-4.1-mini': {'input': 0.0004, 'output': 0.0016},
+        'gpt-4.1-nano': {'input': 0.0001, 'output': 0.0004},
+        'gpt-4o': {'input': 0.0025, 'output': 0.01},
+        'gpt-4o-mini': {'input': 0.00015, 'output': 0.0006},
+        'gpt-4-turbo': {'input': 0.01, 'output': 0.03},
         'gpt-4': {'input': 0.03, 'output': 0.06},
-        'gpt-3.5-turbo': {'input': 0.0015, 'output': 0.002},
+        'gpt-3.5-turbo': {'input': 0.0005, 'output': 0.0015},
     }
+    DEFAULT_PRICING = {'input': 0.01, 'output': 0.03}
+    
+    # Batch API requests are billed at half price
+    BATCH_DISCOUNT = 0.5
+    BATCH_POLL_INTERVAL = 30.0
     
-    def __init__(self, model: str = 'gpt-3.5-turbo', api_key: Optional[str] = None):
-        super().__init__(model, api_key or os.getenv('OPENAI_API_KEY'))
+    def __init__(self, model: str = 'gpt-3.5-turbo', api_key: Optional[str] = None, **kwargs):
+        super().__init__(model, api_key or os.getenv('OPENAI_API_KEY'), **kwargs)
         
         if not self.api_key:
             raise ValueError("OpenAI API key required (OPENAI_API_KEY)")
+        _require_package('openai', 'OpenAI')
+        
+        # Created on first request; keeps its connection pool across calls
+        self._client = None
+    
+    def _get_client(self):
+        """Shared async client: no worker thread per call, pooled connections."""
+        if self._client is None:
+            import openai
+            self._client = openai.AsyncOpenAI(
+                api_key=self.api_key,
+                http_client=self._http_client(openai)
+            )
+        return self._client
+    
+    async def aclose(self):
+        """Close the pooled client."""
+        if self._client is not None:
+            # A shared HTTP client is closed by its owner, not per provider
+            if self._owns_http_client():
+                await self._client.close()
+            self._client = None
     
     async def generate(
         self,
@@ -86,16 +302,14 @@ class OpenAIProvider(LLMProvider):
     ) -> LLMResponse:
         """Generate response using OpenAI API."""
         try:
-            import openai
-            openai.api_key = self.api_key
+            client = self._get_client()
             
             formatted_messages = [
                 {"role": msg.role, "content": msg.content}
                 for msg in messages
             ]
             
-            response = await asyncio.to_thread(
-                openai.ChatCompletion.create,
+            response = await client.chat.completions.create(
                 model=self.model,
                 messages=formatted_messages,
                 temperature=temperature,
@@ -103,8 +317,9 @@ class OpenAIProvider(LLMProvider):
             )
             
             content = response.choices[0].message.content
-            tokens_used = response.usage.total_tokens
-            cost = self.estimate_cost(tokens_used)
+            usage = response.usage
+            tokens_used = usage.total_tokens
+            cost = self.estimate_cost(usage.prompt_tokens, usage.completion_tokens)
             
             return LLMResponse(
                 content=content,
@@ -126,16 +341,14 @@ class OpenAIProvider(LLMProvider):
     ) -> AsyncIterator[str]:
         """Stream response from OpenAI."""
         try:
-            import openai
-            openai.api_key = self.api_key
+            client = self._get_client()
             
             formatted_messages = [
                 {"role": msg.role, "content": msg.content}
                 for msg in messages
             ]
             
-            response = await asyncio.to_thread(
-                openai.ChatCompletion.create,
+            stream = await client.chat.completions.create(
                 model=self.model,
                 messages=formatted_messages,
                 temperature=temperature,
@@ -143,41 +356,156 @@ class OpenAIProvider(LLMProvider):
                 stream=True
             )
             
-            for chunk in response:
-                if chunk.choices[0].delta.get('content'):
-                    yield chunk.choices[0].delta.content
+            async with stream:
+                async for chunk in stream:
+                    if chunk.choices and chunk.choices[0].delta.content:
+                        yield chunk.choices[0].delta.content
         
         except Exception as e:
             logger.error(f"OpenAI streaming error: {e}")
             raise
     
-    def estimate_cost(self, tokens: int) -> float:
-        """Estimate cost based on token usage."""
-        pricing = self.PRICING.get(self.model, {'input': 0.01, 'output': 0.03})
-        # Approximate: assume 75% input, 25% output
-        input_tokens = int(tokens * 0.75)
-        output_tokens = int(tokens * 0.25)
+    async def generate_batch(
+        self,
+        conversations: List[List[LLMMessage]],
+        temperature: float = 0.7,
+        max_tokens: Optional[int] = None
+    ) -> List[LLMResponse]:
+        """
+        Generate responses through the OpenAI Batch API.
+        
+        Latency-tolerant: results arrive once the whole batch completes
+        (within 24 hours), at half the per-token price.
         
-        cost = (input_tokens / 1000 * pricing['input'] + 
-                output_tokens / 1000 * pricing['output'])
-        return cost
+        Args:
+            conversations: Message lists, one per request
+            temperature: Sampling temperature
+            max_tokens: Maximum tokens to generate per request
+            
+        Returns:
+            Responses, in the order of the conversations
+        """
+        try:
+            client = self._get_client()
+            
+            requests = []
+            for i, messages in enumerate(conversations):
+                body = {
+                    "model": self.model,
+                    "messages": [{"role": msg.role, "content": msg.content} for msg in messages],
+                    "temperature": temperature
+                }
+                if max_tokens:
+                    body["max_tokens"] = max_tokens
+                requests.append(json.dumps({
+                    "custom_id": str(i),
+                    "method": "POST",
+                    "url": "/v1/chat/completions",
+                    "body": body
+                }))
+            
+            input_file = await client.files.create(
+                file=("batch.jsonl", "\n".join(requests).encode()),
+                purpose="batch"
+            )
+            batch = await client.batches.create(
+                input_file_id=input_file.id,
+                endpoint="/v1/chat/completions",
+                completion_window="24h"
+            )
+            logger.info(f"Submitted OpenAI batch {batch.id} ({len(requests)} requests)")
+            
+            while batch.status not in ('completed', 'failed', 'expired', 'cancelled'):
+                await asyncio.sleep(self.BATCH_POLL_INTERVAL)
+                batch = await client.batches.retrieve(batch.id)
+            
+            if batch.status != 'completed' or not batch.output_file_id:
+                raise RuntimeError(f"OpenAI batch {batch.id} {batch.status}")
+            
+            output = await client.files.content(batch.output_file_id)
+            results: Dict[int, LLMResponse] = {}
+            for line in output.text.splitlines():
+                if not line:
+                    continue
+                item = _json_loads(line)
+                response = item.get('response') or {}
+                if item.get('error') or response.get('status_code') != 200:
+                    continue
+                completion = response['body']
+                usage = completion['usage']
+                cost = self.estimate_cost(usage['prompt_tokens'], usage['completion_tokens'])
+                results[int(item['custom_id'])] = LLMResponse(
+                    content=completion['choices'][0]['message']['content'],
+                    model=self.model,
+                    tokens_used=usage['total_tokens'],
+                    cost=cost * self.BATCH_DISCOUNT,
+                    finish_reason=completion['choices'][0]['finish_reason']
+                )
+            
+            missing = [i for i in range(len(conversations)) if i not in results]
+            if missing:
+                raise RuntimeError(f"OpenAI batch {batch.id}: requests {missing} failed")
+            
+            return [results[i] for i in range(len(conversations))]
+        
+        except Exception as e:
+            logger.error(f"OpenAI batch error: {e}")
+            raise
+    
+    def estimate_cost(self, input_tokens: int, output_tokens: int) -> float:
+        """Cost based on the prompt and completion token counts."""
+        pricing = self._pricing()
+        return (input_tokens * pricing['input'] +
+                output_tokens * pricing['output']) / 1000
 
 
 class AnthropicProvider(LLMProvider):
     """Anthropic (Claude) provider."""
     
     PRICING = {
+        'claude-opus-4': {'input': 0.015, 'output': 0.075},  # per 1K tokens
+        'claude-sonnet-4': {'input': 0.003, 'output': 0.015},
+        'claude-3-7-sonnet': {'input': 0.003, 'output': 0.015},
+        'claude-3-5-sonnet': {'input': 0.003, 'output': 0.015},
+        'claude-3-5-haiku': {'input': 0.0008, 'output': 0.004},
         'claude-3-opus': {'input': 0.015, 'output': 0.075},
         'claude-3-sonnet': {'input': 0.003, 'output': 0.015},
         'claude-3-haiku': {'input': 0.00025, 'output': 0.00125},
         'claude-2.1': {'input': 0.008, 'output': 0.024},
     }
+    DEFAULT_PRICING = {'input': 0.003, 'output': 0.015}
+    
+    # Message Batches requests are billed at half price
+    BATCH_DISCOUNT = 0.5
+    BATCH_POLL_INTERVAL = 30.0
     
-    def __init__(self, model: str = 'claude-3-sonnet', api_key: Optional[str] = None):
-        super().__init__(model, api_key or os.getenv('ANTHROPIC_API_KEY'))
+    def __init__(self, model: str = 'claude-3-sonnet', api_key: Optional[str] = None, **kwargs):
+        super().__init__(model, api_key or os.getenv('ANTHROPIC_API_KEY'), **kwargs)
         
         if not self.api_key:
             raise ValueError("Anthropic API key required (ANTHROPIC_API_KEY)")
+        _require_package('anthropic', 'Anthropic')
+        
+        # Created on first request; keeps its connection pool across calls
+        self._client = None
+    
+    def _get_client(self):
+        """Shared async client, so turns reuse warm TLS connections."""
+        if self._client is None:
+            import anthropic
+            self._client = anthropic.AsyncAnthropic(
+                api_key=self.api_key,
+                http_client=self._http_client(anthropic)
+            )
+        return self._client
+    
+    async def aclose(self):
+        """Close the pooled client."""
+        if self._client is not None:
+            # A shared HTTP client is closed by its owner, not per provider
+            if self._owns_http_client():
+                await self._client.close()
+            self._client = None
     
     async def generate(
         self,
@@ -188,24 +516,11 @@ class AnthropicProvider(LLMProvider):
     ) -> LLMResponse:
         """Generate response using Anthropic API."""
         try:
-            import anthropic
+            client = self._get_client()
             
-            client = anthropic.Anthropic(api_key=self.api_key)
-            
-            # Extract system message if present
-            system_msg = None
-            user_messages = []
-            for msg in messages:
-                if msg.role == 'system':
-                    system_msg = msg.content
-                else:
-                    user_messages.append({
-                        "role": msg.role,
-                        "content": msg.content
-                    })
-            
-            response = await asyncio.to_thread(
-                client.messages.create,
+            system_msg, user_messages = self._format_messages(messages)
+            
+            response = await client.messages.create(
                 model=self.model,
                 max_tokens=max_tokens or 4096,
                 system=system_msg,
@@ -214,8 +529,9 @@ class AnthropicProvider(LLMProvider):
             )
             
             content = response.content[0].text
-            tokens_used = response.usage.input_tokens + response.usage.output_tokens
-            cost = self.estimate_cost(tokens_used)
+            usage = response.usage
+            tokens_used = usage.input_tokens + usage.output_tokens
+            cost = self.estimate_cost(usage.input_tokens, usage.output_tokens)
             
             return LLMResponse(
                 content=content,
@@ -237,20 +553,9 @@ class AnthropicProvider(LLMProvider):
     ) -> AsyncIterator[str]:
         """Stream response from Anthropic."""
         try:
-            import anthropic
-            
-            client = anthropic.Anthropic(api_key=self.api_key)
+            client = self._get_client()
             
-            system_msg = None
-            user_messages = []
-            for msg in messages:
-                if msg.role == 'system':
-                    system_msg = msg.content
-                else:
-                    user_messages.append({
-                        "role": msg.role,
-                        "content": msg.content
-                    })
+            system_msg, user_messages = self._format_messages(messages)
             
             async with client.messages.stream(
                 model=self.model,
@@ -266,27 +571,159 @@ class AnthropicProvider(LLMProvider):
             logger.error(f"Anthropic streaming error: {e}")
             raise
     
-    def estimate_cost(self, tokens: int) -> float:
-        """Estimate cost based on token usage."""
-        pricing = self.PRICING.get(self.model, {'input': 0.003, 'output': 0.015})
-        input_tokens = int(tokens * 0.75)
-        output_tokens = int(tokens * 0.25)
+    async def generate_batch(
+        self,
+        conversations: List[List[LLMMessage]],
+        temperature: float = 0.7,
+        max_tokens: Optional[int] = None
+    ) -> List[LLMResponse]:
+        """
+        Generate responses through the Anthropic Message Batches API.
         
-        cost = (input_tokens / 1000 * pricing['input'] + 
-                output_tokens / 1000 * pricing['output'])
-        return cost
+        Latency-tolerant: results arrive once the whole batch has ended
+        (within 24 hours), at half the per-token price.
+        
+        Args:
+            conversations: Message lists, one per request
+            temperature: Sampling temperature
+            max_tokens: Maximum tokens to generate per request
+            
+        Returns:
+            Responses, in the order of the conversations
+        """
+        try:
+            client = self._get_client()
+            
+            requests = []
+            for i, messages in enumerate(conversations):
+                system_msg, user_messages = self._format_messages(messages)
+                params = {
+                    "model": self.model,
+                    "max_tokens": max_tokens or 4096,
+                    "messages": user_messages,
+                    "temperature": temperature
+                }
+                if system_msg is not None:
+                    params["system"] = system_msg
+                requests.append({"custom_id": str(i), "params": params})
+            
+            batch = await client.messages.batches.create(requests=requests)
+            logger.info(f"Submitted Anthropic batch {batch.id} ({len(requests)} requests)")
+            
+            while batch.processing_status != 'ended':
+                await asyncio.sleep(self.BATCH_POLL_INTERVAL)
+                batch = await client.messages.batches.retrieve(batch.id)
+            
+            results: Dict[int, LLMResponse] = {}
+            async for entry in await client.messages.batches.results(batch.id):
+                if entry.result.type != 'succeeded':
+                    continue
+                message = entry.result.message
+                usage = message.usage
+                cost = self.estimate_cost(usage.input_tokens, usage.output_tokens)
+                results[int(entry.custom_id)] = LLMResponse(
+                    content=message.content[0].text,
+                    model=self.model,
+                    tokens_used=usage.input_tokens + usage.output_tokens,
+                    cost=cost * self.BATCH_DISCOUNT,
+                    finish_reason=message.stop_reason
+                )
+            
+            missing = [i for i in range(len(conversations)) if i not in results]
+            if missing:
+                raise RuntimeError(f"Anthropic batch {batch.id}: requests {missing} failed")
+            
+            return [results[i] for i in range(len(conversations))]
+        
+        except Exception as e:
+            logger.error(f"Anthropic batch error: {e}")
+            raise
+    
+    @staticmethod
+    def _content(msg: LLMMessage) -> Any:
+        """Message content, as a cache-marked block when requested."""
+        if msg.cache:
+            return [{
+                "type": "text",
+                "text": msg.content,
+                "cache_control": {"type": "ephemeral"}
+            }]
+        return msg.content
+    
+    def _format_messages(
+        self,
+        messages: List[LLMMessage]
+    ) -> Tuple[Any, List[Dict[str, Any]]]:
+        """Split out the system prompt and format messages for Anthropic."""
+        system_msg = None
+        user_messages = []
+        for msg in messages:
+            if msg.role == 'system':
+                system_msg = self._content(msg)
+            else:
+                user_messages.append({
+                    "role": msg.role,
+                    "content": self._content(msg)
+                })
+        
+        return system_msg, user_messages
+    
+    def estimate_cost(self, input_tokens: int, output_tokens: int) -> float:
+        """Cost based on the prompt and completion token counts."""
+        pricing = self._pricing()
+        return (input_tokens * pricing['input'] +
+                output_tokens * pricing['output']) / 1000
 
 
 class OllamaProvider(LLMProvider):
     """Ollama (local models) provider."""
     
+    # Pooled connections to the Ollama server, and how long idle ones are
+    # kept open (local generations are often minutes apart)
+    MAX_CONNECTIONS = 100
+    KEEPALIVE_TIMEOUT = 75
+    
+    # Distinct system prompts whose formatted prefix is kept
+    SYSTEM_PREFIX_CACHE_SIZE = 64
+    
     def __init__(
         self,
         model: str = 'llama2',
-        base_url: str = 'http://localhost:11434'
+        base_url: str = 'http://localhost:11434',
+        **kwargs
     ):
-        super().__init__(model, None)
+        super().__init__(model, None, **kwargs)
         self.base_url = base_url
+        _require_package('aiohttp', 'Ollama')
+        
+        # Created on first request; keeps connections to Ollama alive
+        self._session = None
+        # Leading system prompts -> formatted prompt prefix
+        self._system_prefixes: Dict[Tuple[str, ...], str] = {}
+    
+    def _get_session(self):
+        """Shared aiohttp session, so requests reuse pooled connections."""
+        if self._session is None or self._session.closed:
+            import aiohttp
+            limit = self.config.get('max_connections', self.MAX_CONNECTIONS)
+            options = {}
+            if 'timeout' in self.config:
+                options['timeout'] = aiohttp.ClientTimeout(total=self.config['timeout'])
+            self._session = aiohttp.ClientSession(
+                connector=aiohttp.TCPConnector(
+                    limit=limit,
+                    limit_per_host=limit,
+                    keepalive_timeout=self.config.get('keepalive', self.KEEPALIVE_TIMEOUT)
+                ),
+                **options
+            )
+        return self._session
+    
+    async def aclose(self):
+        """Close the pooled session."""
+        if self._session is not None:
+            await self._session.close()
+            self._session = None
     
     async def generate(
         self,
@@ -297,35 +734,33 @@ class OllamaProvider(LLMProvider):
     ) -> LLMResponse:
         """Generate response using Ollama."""
         try:
-            import aiohttp
-            
             # Convert messages to Ollama format
             prompt = self._format_messages(messages)
             
-            async with aiohttp.ClientSession() as session:
-                async with session.post(
-                    f"{self.base_url}/api/generate",
-                    json={
-                        "model": self.model,
-                        "prompt": prompt,
-                        "temperature": temperature,
-                        "stream": False
-                    }
-                ) as response:
-                    result = await response.json()
-                    
-                    content = result.get('response', '')
-                    
-                    # Ollama doesn't track tokens precisely, estimate
-                    tokens_used = len(prompt.split()) + len(content.split())
-                    
-                    return LLMResponse(
-                        content=content,
-                        model=self.model,
-                        tokens_used=tokens_used,
-                        cost=0.0,  # Local model, no API cost
-                        finish_reason='stop'
-                    )
+            session = self._get_session()
+            async with session.post(
+                f"{self.base_url}/api/generate",
+                json={
+                    "model": self.model,
+                    "prompt": prompt,
+                    "temperature": temperature,
+                    "stream": False
+                }
+            ) as response:
+                result = _json_loads(await response.read())
+                
+                content = result.get('response', '')
+                
+                # Ollama doesn't track tokens precisely, estimate
+                tokens_used = len(prompt.split()) + len(content.split())
+                
+                return LLMResponse(
+                    content=content,
+                    model=self.model,
+                    tokens_used=tokens_used,
+                    cost=0.0,  # Local model, no API cost
+                    finish_reason='stop'
+                )
         
         except Exception as e:
             logger.error(f"Ollama error: {e}")
@@ -339,38 +774,62 @@ class OllamaProvider(LLMProvider):
     ) -> AsyncIterator[str]:
         """Stream response from Ollama."""
         try:
-            import aiohttp
-            
             prompt = self._format_messages(messages)
             
-            async with aiohttp.ClientSession() as session:
-                async with session.post(
-                    f"{self.base_url}/api/generate",
-                    json={
-                        "model": self.model,
-                        "prompt": prompt,
-                        "temperature": temperature,
-                        "stream": True
-                    }
-                ) as response:
-                    async for line in response.content:
-                        if line:
-                            import json
-                            try:
-                                data = json.loads(line)
-                                if data.get('response'):
-                                    yield data['response']
-                            except json.JSONDecodeError:
-                                continue
+            session = self._get_session()
+            async with session.post(
+                f"{self.base_url}/api/generate",
+                json={
+                    "model": self.model,
+                    "prompt": prompt,
+                    "temperature": temperature,
+                    "stream": True
+                }
+            ) as response:
+                # NDJSON: one object per line; chunks may hold several
+                # lines or end mid-line
+                pending = b''
+                async for chunk in response.content.iter_chunked(8192):
+                    *lines, pending = (pending + chunk).split(b'\n')
+                    for line in lines:
+                        text = self._stream_text(line)
+                        if text:
+                            yield text
+                
+                text = self._stream_text(pending)
+                if text:
+                    yield text
         
         except Exception as e:
             logger.error(f"Ollama streaming error: {e}")
             raise
     
+    @staticmethod
+    def _stream_text(line: bytes) -> Optional[str]:
+        """Response text of one streamed NDJSON line, if any."""
+        if not line.strip():
+            return None
+        try:
+            return _json_loads(line).get('response')
+        except ValueError:
+            return None
+    
     def _format_messages(self, messages: List[LLMMessage]) -> str:
         """Format messages for Ollama."""
+        # Leading system messages are usually the same across calls; their
+        # formatted prefix is built once
+        split = 0
+        while split < len(messages) and messages[split].role == 'system':
+            split += 1
+        key = tuple(msg.content for msg in messages[:split])
+        prefix = self._system_prefixes.get(key)
+        if prefix is None:
+            if len(self._system_prefixes) >= self.SYSTEM_PREFIX_CACHE_SIZE:
+                self._system_prefixes.clear()
+            prefix = self._system_prefixes[key] = "".join(f"System: {content}\n\n" for content in key)
+        
         formatted = []
-        for msg in messages:
+        for msg in messages[split:]:
             if msg.role == 'system':
                 formatted.append(f"System: {msg.content}")
             elif msg.role == 'user':
@@ -379,9 +838,9 @@ class OllamaProvider(LLMProvider):
                 formatted.append(f"Assistant: {msg.content}")
         
         formatted.append("Assistant:")
-        return "\n\n".join(formatted)
+        return prefix + "\n\n".join(formatted)
     
-    def estimate_cost(self, tokens: int) -> float:
+    def estimate_cost(self, input_tokens: int, output_tokens: int) -> float:
         """Local model - no API cost."""
         return 0.0
 
@@ -399,6 +858,8 @@ class LLMClient:
         self.config = config
         self.providers: Dict[str, LLMProvider] = {}
         self.default_provider = config.get('default_provider', 'ollama')
+        # One HTTP pool for the OpenAI and Anthropic providers, sized by llm.http
+        self._http = SharedHTTPClient(_pool_settings(config.get('http', {})))
         
         self._initialize_providers()
     
@@ -412,7 +873,9 @@ class LLMClient:
             try:
                 self.providers['openai'] = OpenAIProvider(
                     model=cfg.get('model', 'gpt-3.5-turbo'),
-                    api_key=cfg.get('api_key')
+                    api_key=cfg.get('api_key'),
+                    shared_http=self._http,
+                    **_pool_settings(cfg)
                 )
                 logger.info(f"Initialized OpenAI provider: {cfg.get('model')}")
             except Exception as e:
@@ -424,7 +887,9 @@ class LLMClient:
             try:
                 self.providers['anthropic'] = AnthropicProvider(
                     model=cfg.get('model', 'claude-3-sonnet'),
-                    api_key=cfg.get('api_key')
+                    api_key=cfg.get('api_key'),
+                    shared_http=self._http,
+                    **_pool_settings(cfg)
                 )
                 logger.info(f"Initialized Anthropic provider: {cfg.get('model')}")
             except Exception as e:
@@ -437,7 +902,8 @@ class LLMClient:
                 try:
                     self.providers['ollama'] = OllamaProvider(
                         model=cfg.get('model', 'llama2'),
-                        base_url=cfg.get('base_url', 'http://localhost:11434')
+                        base_url=cfg.get('base_url', 'http://localhost:11434'),
+                        **_pool_settings(cfg)
                     )
                     logger.info(f"Initialized Ollama provider: {cfg.get('model')}")
                 except Exception as e:
@@ -491,6 +957,163 @@ class LLMClient:
             stream=stream
         )
     
+    async def generate_many(
+        self,
+        prompts: List[str],
+        system: Optional[str] = None,
+        provider: Optional[str] = None,
+        temperature: float = 0.7,
+        max_tokens: Optional[int] = None,
+        max_concurrency: int = 32,
+        rate_limit_per_min: Optional[float] = None
+    ) -> List[Union[LLMResponse, BaseException]]:
+        """
+        Generate responses for many prompts with bounded concurrency.
+        
+        Unlike generate_batch, responses come back as fast as the provider
+        answers; requests are spread out to stay under a rate limit.
+        
+        Args:
+            prompts: User prompts
+            system: System prompt shared by every request
+            provider: Provider name (uses default if None)
+            temperature: Sampling temperature
+            max_tokens: Maximum tokens to generate per request
+            max_concurrency: Maximum requests in flight at once
+            rate_limit_per_min: Maximum requests started per minute
+            
+        Returns:
+            Response or raised exception per prompt, in prompt order
+        """
+        semaphore = asyncio.Semaphore(max_concurrency)
+        interval = 60.0 / rate_limit_per_min if rate_limit_per_min else 0.0
+        loop = asyncio.get_running_loop()
+        next_start = loop.time()
+        
+        async def one(prompt: str) -> LLMResponse:
+            nonlocal next_start
+            async with semaphore:
+                if interval:
+                    # Reserve the next free start slot (no await in between,
+                    # so slots are never handed out twice)
+                    now = loop.time()
+                    start = max(now, next_start)
+                    next_start = start + interval
+                    if start > now:
+                        await asyncio.sleep(start - now)
+                return await self.generate(
+                    prompt,
+                    system=system,
+                    provider=provider,
+                    temperature=temperature,
+                    max_tokens=max_tokens
+                )
+        
+        return await asyncio.gather(*(one(prompt) for prompt in prompts),
+                                    return_exceptions=True)
+    
+    async def generate_batch(
+        self,
+        prompts: List[str],
+        system: Optional[str] = None,
+        provider: Optional[str] = None,
+        temperature: float = 0.7,
+        max_tokens: Optional[int] = None
+    ) -> List[LLMResponse]:
+        """
+        Generate responses for many independent prompts in one batch.
+        
+        OpenAI and Anthropic use their batch APIs (half price, results
+        within 24 hours); other providers run the prompts concurrently.
+        
+        Args:
+            prompts: User prompts
+            system: System prompt shared by every request
+            provider: Provider name (uses default if None)
+            temperature: Sampling temperature
+            max_tokens: Maximum tokens to generate per request
+            
+        Returns:
+            Responses, in the order of the prompts
+        """
+        conversations = []
+        for prompt in prompts:
+            messages = []
+            if system:
+                messages.append(LLMMessage(role='system', content=system))
+            messages.append(LLMMessage(role='user', content=prompt))
+            conversations.append(messages)
+        
+        provider_obj = self.get_provider(provider)
+        
+        return await provider_obj.generate_batch(
+            conversations,
+            temperature=temperature,
+            max_tokens=max_tokens
+        )
+    
+    async def chat(
+        self,
+        messages: List[LLMMessage],
+        system: Optional[str] = None,
+        provider: Optional[str] = None,
+        temperature: float = 0.7,
+        max_tokens: Optional[int] = None
+    ) -> LLMResponse:
+        """
+        Generate LLM response for a multi-turn conversation.
+        
+        The system prompt is sent first and marked as a cache breakpoint so
+        providers with prefix caching can reuse it across turns.
+        
+        Args:
+            messages: Conversation so far, oldest first
+            system: System prompt
+            provider: Provider name (uses default if None)
+            temperature: Sampling temperature
+            max_tokens: Maximum tokens to generate
+            
+        Returns:
+            LLM response
+        """
+        if system:
+            messages = [LLMMessage(role='system', content=system, cache=True), *messages]
+        
+        provider_obj = self.get_provider(provider)
+        
+        return await provider_obj.generate(
+            messages,
+            temperature=temperature,
+            max_tokens=max_tokens
+        )
+    
+    async def chat_stream(
+        self,
+        messages: List[LLMMessage],
+        system: Optional[str] = None,
+        provider: Optional[str] = None,
+        temperature: float = 0.7,
+        max_tokens: Optional[int] = None
+    ) -> AsyncIterator[str]:
+        """Streaming variant of chat(): yields response text as generated."""
+        if system:
+            messages = [LLMMessage(role='system', content=system, cache=True), *messages]
+        
+        provider_obj = self.get_provider(provider)
+        
+        stream = provider_obj.generate_stream(
+            messages,
+            temperature=temperature,
+            max_tokens=max_tokens
+        )
+        try:
+            async for chunk in stream:
+                yield chunk
+        finally:
+            # Release the provider's response as soon as the caller stops,
+            # not when the abandoned generator is garbage-collected
+            await stream.aclose()
+    
     async def generate_stream(
         self,
         prompt: str,
@@ -509,12 +1132,31 @@ class LLMClient:
         
         provider_obj = self.get_provider(provider)
         
-        async for chunk in provider_obj.generate_stream(
+        stream = provider_obj.generate_stream(
             messages,
             temperature=temperature,
             max_tokens=max_tokens
-        ):
-            yield chunk
+        )
+        try:
+            async for chunk in stream:
+                yield chunk
+        finally:
+            # Release the provider's response as soon as the caller stops,
+            # not when the abandoned generator is garbage-collected
+            await stream.aclose()
+    
+    async def aclose(self):
+        """Close every provider's pooled connections and the shared HTTP client."""
+        # One provider failing to close must not leak the others' connections
+        results = await asyncio.gather(
+            *(provider_obj.aclose() for provider_obj in self.providers.values()),
+            return_exceptions=True
+        )
+        for name, result in zip(self.providers, results):
+            if isinstance(result, Exception):
+                logger.warning(f"Failed to close {name} provider: {result}")
+        
+        await self._http.aclose()
     
     def list_providers(self) -> List[str]:
         """List available providers."""
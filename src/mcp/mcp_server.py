@@ -2,6 +2,10 @@
 
 import logging
 import asyncio
+import multiprocessing
+import os
+import threading
+from concurrent.futures import ProcessPoolExecutor
 from typing import Dict, Any, List, Optional
 import json
 
@@ -11,8 +15,9 @@ from .protocol import (
 )
 from .config import ConfigManager
 from .ssh_manager import SSHManager
-from .docker_manager import DockerManager
+from .docker_manager import DockerManager, close_clients
 from .k8s_manager import KubernetesManager
+from .llm.cost_manager import reduce_log_content
 
 logger = logging.getLogger(__name__)
 
@@ -20,6 +25,10 @@ logger = logging.getLogger(__name__)
 class MCPDevOpsServer:
     """MCP Server for DevOps operations."""
     
+    # Logs shorter than this are reduced inline; shipping them to a worker
+    # process would cost more than the pass itself
+    LOG_OFFLOAD_MIN_CHARS = 1 << 20
+    
     def __init__(self, config_path: Optional[str] = None):
         """
         Initialize MCP DevOps Server.
@@ -33,6 +42,10 @@ class MCPDevOpsServer:
         self.docker_manager = DockerManager(self.ssh_manager)
         self.k8s_manager = KubernetesManager()
         
+        # Worker processes for large log reductions, created on first use
+        self._log_pool: Optional[ProcessPoolExecutor] = None
+        self._log_pool_lock = threading.Lock()
+        
         # Server info
         server_info = ServerInfo(
             name="mcp-devops-server",
@@ -57,6 +70,42 @@ class MCPDevOpsServer:
         
         logger.info("MCP DevOps Server initialized")
     
+    def close(self):
+        """Release pooled connections and stop the log worker processes."""
+        self.ssh_manager.close_all()
+        self.k8s_manager.close()
+        close_clients()
+        
+        with self._log_pool_lock:
+            pool, self._log_pool = self._log_pool, None
+        if pool is not None:
+            pool.shutdown(wait=True)
+    
+    async def aclose(self):
+        """Release pooled connections without blocking the event loop."""
+        await asyncio.to_thread(self.close)
+    
+    def _reduce_logs(self, logs: str) -> str:
+        """
+        Reduce a log, in a worker process if it is large.
+        
+        Called from handler threads (see aprocess_message), so several
+        large logs are reduced in parallel on separate cores.
+        """
+        if len(logs) < self.LOG_OFFLOAD_MIN_CHARS:
+            return reduce_log_content(logs)
+        
+        with self._log_pool_lock:
+            if self._log_pool is None:
+                # spawn: forking a process with live connection pools and
+                # handler threads is unsafe
+                self._log_pool = ProcessPoolExecutor(
+                    max_workers=os.cpu_count(),
+                    mp_context=multiprocessing.get_context('spawn')
+                )
+            pool = self._log_pool
+        return pool.submit(reduce_log_content, logs).result()
+    
     def _register_methods(self):
         """Register MCP protocol method handlers."""
         self.protocol.register_method("tools/list", self._handle_tools_list)
@@ -287,6 +336,13 @@ class MCPDevOpsServer:
                             "type": "boolean",
                             "description": "Stream logs in real-time",
                             "default": False
+                        },
+                        "optimize": {
+                            "type": "boolean",
+                            "description": "Reduce logs over 500 lines to their error, warning "
+                                           "and most recent lines (deduplicated, grouped in "
+                                           "that order) to save tokens",
+                            "default": False
                         }
                     },
                     "required": ["pod"]
@@ -714,9 +770,9 @@ class MCPDevOpsServer:
             )
         
         try:
-            logs = self.k8s_manager.get_pod_logs(
-                pod, namespace, container, tail, follow=False
-            )
+            logs = self.k8s_manager.get_pod_logs(pod, namespace, container, tail)
+            if args.get("optimize", False):
+                logs = self._reduce_logs(logs)
             
             return create_tool_result(
                 f"Logs for pod {pod}:\n\n{logs}"
@@ -910,3 +966,18 @@ class MCPDevOpsServer:
             Response message (or None for notifications)
         """
         return self.protocol.process_message(message)
+    
+    async def aprocess_message(self, message: str) -> Optional[str]:
+        """
+        Process incoming MCP message without blocking the event loop.
+        
+        Tool handlers are synchronous (SSH, Docker and Kubernetes calls,
+        log reduction), so they run in a worker thread.
+        
+        Args:
+            message: JSON-RPC message
+            
+        Returns:
+            Response message (or None for notifications)
+        """
+        return await asyncio.to_thread(self.process_message, message)
@@ -6,9 +6,30 @@ from typing import Dict, Any, Optional, List, Callable
 from dataclasses import dataclass, asdict
 from enum import Enum
 
+try:
+    import orjson
+except ImportError:  # pragma: no cover - optional speedup
+    orjson = None
+
 logger = logging.getLogger(__name__)
 
 
+def _loads_frame(message: str) -> Any:
+    """Decode a JSON-RPC frame (orjson when installed)."""
+    if orjson is not None:
+        return orjson.loads(message)
+    
+    return json.loads(message)
+
+
+def _dumps_frame(payload: Any) -> str:
+    """Encode a JSON-RPC frame as a compact single-line string."""
+    if orjson is not None:
+        return orjson.dumps(payload, option=orjson.OPT_NON_STR_KEYS).decode()
+    
+    return json.dumps(payload)
+
+
 class MCPVersion(str, Enum):
     """MCP Protocol versions."""
     V1 = "2024-11-05"
@@ -299,13 +320,13 @@ class MCPProtocol:
         try:
             # Parse request
             try:
-                request = json.loads(message)
+                request = _loads_frame(message)
             except json.JSONDecodeError as e:
                 error = JSONRPCError(
                     JSONRPCError.PARSE_ERROR,
                     f"Parse error: {str(e)}"
                 )
-                return json.dumps(self.create_error_response(error))
+                return _dumps_frame(self.create_error_response(error))
             
             # Handle batch requests
             if isinstance(request, list):
@@ -322,17 +343,17 @@ class MCPProtocol:
                 
                 # Return batch response (empty if all notifications)
                 if responses:
-                    return json.dumps(responses)
+                    return _dumps_frame(responses)
                 return None
             
             # Handle single request
             try:
                 response = self.handle_request(request)
                 if response is not None:
-                    return json.dumps(response)
+                    return _dumps_frame(response)
                 return None
             except JSONRPCError as e:
-                return json.dumps(
+                return _dumps_frame(
                     self.create_error_response(e, request.get("id"))
                 )
         
@@ -342,7 +363,7 @@ class MCPProtocol:
                 JSONRPCError.INTERNAL_ERROR,
                 f"Internal error: {str(e)}"
             )
-            return json.dumps(self.create_error_response(error))
+            return _dumps_frame(self.create_error_response(error))
     
     def send_notification(self, method: str, params: Dict[str, Any]) -> str:
         """
@@ -360,7 +381,7 @@ class MCPProtocol:
             "method": method,
             "params": params
         }
-        return json.dumps(notification)
+        return _dumps_frame(notification)
 
 
 def create_text_content(text: str) -> Dict[str, Any]:
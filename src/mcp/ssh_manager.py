@@ -1,20 +1,147 @@
 """SSH connection and command execution manager."""
 
 import paramiko
+import shlex
 import socket
 import logging
-from typing import Optional, Tuple, List
+import atexit
+import threading
+import weakref
+from collections import OrderedDict
+from contextlib import contextmanager
+from typing import Dict, Optional, Tuple, List
 from pathlib import Path
 
 logger = logging.getLogger(__name__)
 
+# Live managers, closed at exit without keeping them alive until then
+_MANAGERS: "weakref.WeakSet[SSHManager]" = weakref.WeakSet()
+
+
+def _close_all_managers():
+    """Close every live manager's pooled connections."""
+    for manager in list(_MANAGERS):
+        manager.close_all()
+
+
+atexit.register(_close_all_managers)
+
+
+def _is_alive(client: paramiko.SSHClient) -> bool:
+    """Whether a client's transport is still connected."""
+    try:
+        transport = client.get_transport()
+        return bool(transport and transport.is_active())
+    except Exception:
+        return False
+
 
 class SSHManager:
     """Manages SSH connections and remote command execution."""
     
-    def __init__(self):
-        """Initialize SSH manager."""
-        self.connections = {}
+    # Seconds between transport keepalives on pooled connections
+    KEEPALIVE_INTERVAL = 30
+    
+    def __init__(self, pool: bool = True, max_connections: int = 32):
+        """
+        Initialize SSH manager.
+        
+        Args:
+            pool: Reuse live connections to the same user@host:port
+            max_connections: Pooled connections kept open (least recently
+                used are closed first)
+        """
+        self.connections: "OrderedDict[str, paramiko.SSHClient]" = OrderedDict()
+        self.pool = pool
+        self.max_connections = max_connections
+        # Guards self.connections, _leases and _retired; dialing happens
+        # outside the lock
+        self._lock = threading.Lock()
+        # Operations currently running on each client, keyed by id(client)
+        self._leases: Dict[int, int] = {}
+        # Clients evicted while in use; closed when their last operation ends
+        self._retired: Dict[int, paramiko.SSHClient] = {}
+        
+        _MANAGERS.add(self)
+    
+    def _get_pooled(self, connection_key: str) -> Optional[paramiko.SSHClient]:
+        """Return a live pooled connection, dropping it if it has died."""
+        with self._lock:
+            client = self.connections.get(connection_key)
+            if client is None:
+                return None
+            
+            if _is_alive(client):
+                self.connections.move_to_end(connection_key)
+                return client
+            
+            # Connection is dead, remove it
+            del self.connections[connection_key]
+            return None
+    
+    def _add_pooled(self, connection_key: str, client: paramiko.SSHClient) -> paramiko.SSHClient:
+        """
+        Pool a new connection, closing the least recently used if full.
+        
+        Args:
+            connection_key: user@host:port of the connection
+            client: Newly connected client
+            
+        Returns:
+            The pooled client: an existing live connection to the same
+            key wins over the new one, which is then closed
+        """
+        evicted = []
+        
+        with self._lock:
+            existing = self.connections.get(connection_key)
+            if existing is not None and _is_alive(existing):
+                # Another thread dialed the same host first
+                self.connections.move_to_end(connection_key)
+                duplicate, client = client, existing
+            else:
+                duplicate = None
+                self.connections[connection_key] = client
+                self.connections.move_to_end(connection_key)
+                while len(self.connections) > self.max_connections:
+                    key, old_client = self.connections.popitem(last=False)
+                    if id(old_client) in self._leases:
+                        # Still running a command; close when it finishes
+                        self._retired[id(old_client)] = old_client
+                    else:
+                        evicted.append((key, old_client))
+        
+        if duplicate is not None:
+            logger.debug(f"Closing duplicate connection to {connection_key}")
+            duplicate.close()
+        
+        for key, old_client in evicted:
+            logger.debug(f"Closing idle connection to {key}")
+            old_client.close()
+        
+        return client
+    
+    @contextmanager
+    def _in_use(self, client: paramiko.SSHClient):
+        """Keep a client from being closed by pool eviction while in use."""
+        client_id = id(client)
+        with self._lock:
+            self._leases[client_id] = self._leases.get(client_id, 0) + 1
+        
+        try:
+            yield client
+        finally:
+            retired = None
+            with self._lock:
+                remaining = self._leases[client_id] - 1
+                if remaining:
+                    self._leases[client_id] = remaining
+                else:
+                    del self._leases[client_id]
+                    retired = self._retired.pop(client_id, None)
+            
+            if retired is not None:
+                retired.close()
     
     def connect(self, host: str, user: str, port: int = 22,
                 key_path: Optional[str] = None,
@@ -40,20 +167,11 @@ class SSHManager:
         connection_key = f"{user}@{host}:{port}"
         
         # Return existing connection if available
-        if connection_key in self.connections:
-            client = self.connections[connection_key]
-            try:
-                # Test if connection is still alive
-                transport = client.get_transport()
-                if transport and transport.is_active():
-                    logger.info(f"Reusing existing connection to {connection_key}")
-                    return client
-                else:
-                    # Connection is dead, remove it
-                    del self.connections[connection_key]
-            except Exception:
-                # Connection check failed, remove it
-                del self.connections[connection_key]
+        if self.pool:
+            client = self._get_pooled(connection_key)
+            if client is not None:
+                logger.info(f"Reusing existing connection to {connection_key}")
+                return client
         
         # Create new connection
         try:
@@ -91,9 +209,15 @@ class SSHManager:
                 connect_kwargs["password"] = password
             
             client.connect(**connect_kwargs)
-            self.connections[connection_key] = client
             logger.info(f"Successfully connected to {connection_key}")
             
+            if self.pool:
+                # Keep idle pooled connections from being dropped by NAT/firewalls
+                transport = client.get_transport()
+                if transport:
+                    transport.set_keepalive(self.KEEPALIVE_INTERVAL)
+                client = self._add_pooled(connection_key, client)
+            
             return client
             
         except paramiko.AuthenticationException as e:
@@ -124,11 +248,12 @@ class SSHManager:
         """
         try:
             logger.debug(f"Executing command: {command}")
-            stdin, stdout, stderr = client.exec_command(command, timeout=timeout)
-            
-            exit_code = stdout.channel.recv_exit_status()
-            stdout_data = stdout.read().decode('utf-8')
-            stderr_data = stderr.read().decode('utf-8')
+            with self._in_use(client):
+                stdin, stdout, stderr = client.exec_command(command, timeout=timeout)
+                
+                exit_code = stdout.channel.recv_exit_status()
+                stdout_data = stdout.read().decode('utf-8')
+                stderr_data = stderr.read().decode('utf-8')
             
             logger.debug(f"Command exit code: {exit_code}")
             
@@ -176,9 +301,10 @@ class SSHManager:
             local_path: Local path to save file
         """
         try:
-            sftp = client.open_sftp()
-            sftp.get(remote_path, local_path)
-            sftp.close()
+            with self._in_use(client):
+                sftp = client.open_sftp()
+                sftp.get(remote_path, local_path)
+                sftp.close()
             logger.info(f"Downloaded {remote_path} to {local_path}")
         except Exception as e:
             logger.error(f"Failed to download file: {e}")
@@ -195,9 +321,10 @@ class SSHManager:
             remote_path: Path on remote host
         """
         try:
-            sftp = client.open_sftp()
-            sftp.put(local_path, remote_path)
-            sftp.close()
+            with self._in_use(client):
+                sftp = client.open_sftp()
+                sftp.put(local_path, remote_path)
+                sftp.close()
             logger.info(f"Uploaded {local_path} to {remote_path}")
         except Exception as e:
             logger.error(f"Failed to upload file: {e}")
@@ -220,11 +347,12 @@ class SSHManager:
         if follow:
             command = f"tail -f -n {lines} {log_path}"
             try:
-                stdin, stdout, stderr = client.exec_command(command)
-                
-                # Read lines as they come
-                for line in iter(stdout.readline, ""):
-                    yield line.rstrip('\n')
+                with self._in_use(client):
+                    stdin, stdout, stderr = client.exec_command(command)
+                    
+                    # Read lines as they come
+                    for line in iter(stdout.readline, ""):
+                        yield line.rstrip('\n')
                     
             except KeyboardInterrupt:
                 logger.info("Stopped tailing log")
@@ -241,24 +369,70 @@ class SSHManager:
             for line in stdout.splitlines():
                 yield line
     
+    def stream_log(self, client: paramiko.SSHClient, log_path: str,
+                   lines: int = 50, follow: bool = False,
+                   chunk_size: int = 65536, pattern: Optional[str] = None):
+        """
+        Stream a remote log file as raw bytes.
+        
+        Unlike tail_log, output is yielded in channel-sized chunks rather
+        than decoded line by line, for high-volume logs.
+        
+        Args:
+            client: SSH client instance
+            log_path: Path to log file on remote host
+            lines: Number of lines to retrieve
+            follow: If True, continuously tail the file across rotations
+                (like tail -F)
+            chunk_size: Maximum bytes per chunk
+            pattern: Only stream lines matching this grep pattern; filtering
+                happens on the server so unmatched lines never cross the wire
+            
+        Yields:
+            Raw log output chunks
+        """
+        command = f"tail {'-F ' if follow else ''}-n {int(lines)} {shlex.quote(log_path)}"
+        if pattern:
+            command += f" | grep --line-buffered -e {shlex.quote(pattern)}"
+        
+        with self._in_use(client):
+            stdin, stdout, stderr = client.exec_command(command)
+            channel = stdout.channel
+            
+            for chunk in iter(lambda: channel.recv(chunk_size), b""):
+                yield chunk
+            
+            exit_code = channel.recv_exit_status()
+            if exit_code != 0:
+                error = stderr.read().decode('utf-8')
+                # grep exits 1 when nothing matched; that is not a failure
+                if not (pattern and exit_code == 1 and not error):
+                    raise RuntimeError(f"Failed to tail log: {error}")
+    
     def close(self, host: str, user: str, port: int = 22):
         """Close SSH connection."""
         connection_key = f"{user}@{host}:{port}"
-        if connection_key in self.connections:
+        with self._lock:
+            client = self.connections.pop(connection_key, None)
+        
+        if client is not None:
             try:
-                self.connections[connection_key].close()
+                client.close()
                 logger.info(f"Closed connection to {connection_key}")
             except Exception as e:
                 logger.warning(f"Error closing connection: {e}")
-            finally:
-                del self.connections[connection_key]
     
     def close_all(self):
         """Close all SSH connections."""
-        for connection_key in list(self.connections.keys()):
+        with self._lock:
+            connections = list(self.connections.items())
+            connections.extend(('retired', client) for client in self._retired.values())
+            self.connections.clear()
+            self._retired.clear()
+        
+        for connection_key, client in connections:
             try:
-                self.connections[connection_key].close()
+                client.close()
             except Exception as e:
                 logger.warning(f"Error closing connection {connection_key}: {e}")
-        self.connections.clear()
         logger.info("Closed all connections")
@@ -60,7 +60,7 @@ class StdioTransport(MCPTransport):
                     logger.debug(f"Received: {line}")
                     
                     # Process message
-                    response = self.server.process_message(line)
+                    response = await self.server.aprocess_message(line)
                     
                     if response:
                         # Write response to stdout
@@ -142,7 +142,7 @@ class HTTPSSETransport(MCPTransport):
             logger.debug(f"HTTP request: {body}")
             
             # Process message
-            response = self.server.process_message(body)
+            response = await self.server.aprocess_message(body)
             
             if response:
                 return web.Response(
@@ -0,0 +1,343 @@
+"""Tests for the AI agent plan-execute-reflect loop."""
+
+import asyncio
+import json
+import pytest
+
+from src.mcp.ai.agent import AIAgent, AgentPlan, TaskComplexity
+from src.mcp.llm.providers import LLMResponse
+
+
+class ScriptedLLM:
+    """LLM stub answering by system prompt and counting calls."""
+    
+    def __init__(self, intent, plan=()):
+        self.intent = intent
+        self.plan = list(plan)
+        self.calls = 0
+    
+    async def generate(self, prompt, system=None, **kwargs):
+        self.calls += 1
+        
+        if system and 'intent parser' in system:
+            # None stands for a reply that is not valid JSON
+            content = json.dumps(self.intent) if self.intent is not None else 'not json'
+        elif system and 'planning' in system:
+            content = json.dumps(self.plan)
+        else:
+            content = 'final answer'
+        
+        return LLMResponse(content=content, model='mock-model', tokens_used=10)
+    
+    async def chat(self, messages, system=None, **kwargs):
+        self.calls += 1
+        self.last_messages = messages
+        return LLMResponse(content='chat answer', model='mock-model', tokens_used=10)
+    
+    async def chat_stream(self, messages, system=None, **kwargs):
+        self.calls += 1
+        self.last_messages = messages
+        for chunk in ('chat ', 'answer'):
+            yield chunk
+
+
+def _plan(steps):
+    return AgentPlan(goal='test', steps=steps, complexity=TaskComplexity.SIMPLE, estimated_time=0)
+
+
+class TestAgentExecution:
+    """Tests for plan execution."""
+    
+    @pytest.mark.asyncio
+    async def test_independent_steps_run_concurrently(self):
+        """Steps without dependencies share a wave; dependants wait."""
+        events = []
+        
+        async def record(name):
+            events.append(('start', name))
+            await asyncio.sleep(0.01)
+            events.append(('end', name))
+            return name
+        
+        agent = AIAgent(ScriptedLLM({}), {'test.record': {'handler': record}})
+        plan = _plan([
+            {'tool': 'test.record', 'args': {'name': 'a'}},
+            {'tool': 'test.record', 'args': {'name': 'b'}},
+            {'tool': 'test.record', 'args': {'name': 'c'}, 'depends_on': [1, 2]},
+        ])
+        
+        results = await agent._execute_plan(plan)
+        
+        assert [step.result for step in results] == ['a', 'b', 'c']
+        assert events[:2] == [('start', 'a'), ('start', 'b')]
+        assert events.index(('start', 'c')) > events.index(('end', 'b'))
+    
+    @pytest.mark.asyncio
+    async def test_critical_failure_aborts_plan(self):
+        """A critical error stops later waves from running."""
+        def fail():
+            raise ConnectionError("Connection refused")
+        
+        agent = AIAgent(ScriptedLLM({}), {
+            'test.fail': {'handler': fail},
+            'test.ok': {'handler': lambda: 'ok'},
+        })
+        plan = _plan([
+            {'tool': 'test.fail'},
+            {'tool': 'test.ok', 'depends_on': [1]},
+        ])
+        
+        results = await agent._execute_plan(plan)
+        
+        assert len(results) == 1
+        assert 'Connection refused' in results[0].error
+
+
+class TestAgentResponseCache:
+    """Tests for repeated-prompt response caching."""
+    
+    @pytest.mark.asyncio
+    async def test_repeated_prompt_is_cached(self):
+        """Identical prompts within the TTL skip the LLM entirely."""
+        llm = ScriptedLLM({'intent_type': 'check_status'})
+        agent = AIAgent(llm, {})
+        
+        first = await agent.process_prompt('check web-01', {'env': 'prod'})
+        calls = llm.calls
+        second = await agent.process_prompt('check web-01', {'env': 'prod'})
+        
+        assert first == second == 'final answer'
+        assert llm.calls == calls
+    
+    @pytest.mark.asyncio
+    async def test_confirmation_required_is_not_cached(self):
+        """Potentially destructive requests are always re-run."""
+        llm = ScriptedLLM({'intent_type': 'restart', 'requires_confirmation': True})
+        agent = AIAgent(llm, {})
+        
+        await agent.process_prompt('restart web-01')
+        calls = llm.calls
+        await agent.process_prompt('restart web-01')
+        
+        assert llm.calls == 2 * calls
+    
+    @pytest.mark.asyncio
+    async def test_read_only_plan_is_cached(self):
+        """Plans that only use read-only tools are replayed."""
+        llm = ScriptedLLM(
+            {'intent_type': 'check_status'},
+            plan=[{'tool': 'docker.list', 'args': {}}, {'tool': 'k8s.get_pods', 'args': {}}]
+        )
+        agent = AIAgent(llm, {
+            'docker.list': {'handler': lambda: []},
+            'k8s.get_pods': {'handler': lambda: []},
+        })
+        
+        await agent.process_prompt('what is running')
+        calls = llm.calls
+        await agent.process_prompt('what is running')
+        
+        assert llm.calls == calls
+        assert agent.last_response_cacheable
+    
+    @pytest.mark.asyncio
+    async def test_mutating_plan_is_not_cached(self):
+        """A plan that ran a non read-only tool is re-run, whatever the model claimed."""
+        executed = []
+        llm = ScriptedLLM(
+            {'intent_type': 'check_status', 'requires_confirmation': False},
+            plan=[{'tool': 'ssh.execute', 'args': {'command': 'systemctl restart nginx'}}]
+        )
+        agent = AIAgent(llm, {'ssh.execute': {'handler': lambda command: executed.append(command)}})
+        
+        await agent.process_prompt('restart nginx on prod-web-01')
+        assert not agent.last_response_cacheable
+        await agent.process_prompt('restart nginx on prod-web-01')
+        
+        assert len(executed) == 2
+    
+    @pytest.mark.asyncio
+    async def test_unparsed_intent_is_never_cached(self, tmp_path):
+        """A fallback intent is not replayed, in session or from the persistent cache."""
+        from src.mcp.ai.cli_agent import process_one_shot
+        from src.mcp.ai.response_cache import ResponseCache
+        
+        llm = ScriptedLLM(None)
+        agent = AIAgent(llm, {})
+        cache = ResponseCache(tmp_path / 'cache.db')
+        
+        try:
+            await process_one_shot(agent, 'restart nginx on prod-web-01', cache)
+            calls = llm.calls
+            await process_one_shot(agent, 'restart nginx on prod-web-01', cache)
+            
+            assert llm.calls == 2 * calls
+            assert cache.get('restart nginx on prod-web-01') is None
+        finally:
+            cache.close()
+
+
+class TestAgentConversation:
+    """Tests for REPL conversation history."""
+    
+    @pytest.mark.asyncio
+    async def test_history_prefix_is_stable(self):
+        """Earlier turns are resent unchanged; only the newest is cache-marked."""
+        llm = ScriptedLLM({})
+        agent = AIAgent(llm, {})
+        
+        await agent.chat_turn('what is a pod?')
+        first = list(llm.last_messages)
+        await agent.chat_turn('what is a namespace?')
+        
+        assert llm.last_messages[0].content == first[0].content
+        assert [m.cache for m in llm.last_messages] == [False, False, True]
+    
+    @pytest.mark.asyncio
+    async def test_history_trimmed_in_batches(self):
+        """History grows to window + buffer, then drops back to the window."""
+        agent = AIAgent(ScriptedLLM({}), {})
+        agent.HISTORY_WINDOW = 4
+        agent.HISTORY_BUFFER = 2
+        
+        lengths = []
+        for _ in range(5):
+            await agent.chat_turn('what is a pod?')
+            lengths.append(len(agent.conversation_history))
+        
+        assert lengths == [2, 4, 6, 4, 6]
+    
+    @pytest.mark.asyncio
+    async def test_stream_records_full_answer(self):
+        """Streamed chunks are yielded in order and stored as one turn."""
+        agent = AIAgent(ScriptedLLM({}), {})
+        
+        chunks = [chunk async for chunk in agent.chat_turn_stream('what is a pod?')]
+        
+        assert chunks == ['chat ', 'answer']
+        assert agent.conversation_history[-1].content == 'chat answer'
+    
+    @pytest.mark.asyncio
+    async def test_failed_stream_leaves_no_empty_turn(self):
+        """A provider error before any chunk drops the turn; a partial answer is kept."""
+        class FailingLLM(ScriptedLLM):
+            def __init__(self, chunks_before_error):
+                super().__init__({})
+                self.chunks_before_error = chunks_before_error
+            
+            async def chat_stream(self, messages, system=None, **kwargs):
+                for chunk in self.chunks_before_error:
+                    yield chunk
+                raise RuntimeError('429 Too Many Requests')
+        
+        agent = AIAgent(FailingLLM([]), {})
+        with pytest.raises(RuntimeError):
+            async for _ in agent.chat_turn_stream('what is a pod?'):
+                pass
+        assert agent.conversation_history == []
+        
+        agent.llm = FailingLLM(['A pod is'])
+        with pytest.raises(RuntimeError):
+            async for _ in agent.chat_turn_stream('what is a pod?'):
+                pass
+        assert [(m.role, m.content) for m in agent.conversation_history] == [
+            ('user', 'what is a pod?'), ('assistant', 'A pod is')
+        ]
+    
+    @pytest.mark.asyncio
+    async def test_export_import_round_trip(self):
+        """An exported conversation restores into a fresh agent."""
+        agent = AIAgent(ScriptedLLM({}), {})
+        await agent.chat_turn('what is a pod?')
+        
+        restored = AIAgent(ScriptedLLM({}), {})
+        restored.import_conversation(agent.export_conversation())
+        
+        assert restored.export_conversation() == agent.export_conversation()
+        assert len(restored.conversation_history) == 2
+
+
+class TestAIBatch:
+    """Tests for `ai batch` input loading and resume."""
+    
+    def test_resume_skips_succeeded_and_retries_failed(self, tmp_path):
+        """Only ids without a success record in the output are loaded."""
+        from src.mcp.ai.cli_agent import _load_batch
+        
+        in_path = tmp_path / 'prompts.jsonl'
+        in_path.write_text(
+            json.dumps({'id': 'a', 'prompt': 'list pods'}) + '\n'
+            + json.dumps({'id': 'b', 'prompt': 'docker ps'}) + '\n'
+            + json.dumps({'id': 'c', 'prompt': 'disk usage'}) + '\n'
+        )
+        out_path = tmp_path / 'results.jsonl'
+        out_path.write_text(
+            json.dumps({'id': 'a', 'status': 'success', 'response': 'ok'}) + '\n'
+            + json.dumps({'id': 'b', 'status': 'error', 'error': 'timeout'}) + '\n'
+            # Interrupted mid-write
+            + '{"id": "c", "status": "succ'
+        )
+        
+        items = _load_batch(in_path, out_path)
+        
+        assert [item['id'] for item in items] == ['b', 'c']
+    
+    def test_bare_string_lines_use_line_number_ids(self, tmp_path):
+        """A JSON string line is a prompt whose id is its line number."""
+        from src.mcp.ai.cli_agent import _load_batch
+        
+        in_path = tmp_path / 'prompts.jsonl'
+        in_path.write_text('"list pods"\n\n"docker ps"\n')
+        
+        items = _load_batch(in_path, tmp_path / 'results.jsonl')
+        
+        assert items == [{'prompt': 'list pods', 'id': 1}, {'prompt': 'docker ps', 'id': 3}]
+    
+    def test_malformed_line_reports_line_number(self, tmp_path):
+        """Invalid input lines are reported by line number, not a traceback."""
+        from src.mcp.ai.cli_agent import _load_batch
+        
+        in_path = tmp_path / 'prompts.jsonl'
+        in_path.write_text('"list pods"\n{"prompt": \n')
+        
+        with pytest.raises(ValueError, match=r'prompts\.jsonl:2: invalid JSON'):
+            _load_batch(in_path, tmp_path / 'results.jsonl')
+    
+    @pytest.mark.asyncio
+    async def test_run_appends_one_record_per_prompt(self, tmp_path):
+        """Each prompt gets one result line, appended after earlier runs."""
+        from src.mcp.ai.cli_agent import run_ai_batch
+        
+        in_path = tmp_path / 'prompts.jsonl'
+        in_path.write_text('"first"\n"second"\n"third"\n')
+        out_path = tmp_path / 'results.jsonl'
+        out_path.write_text(json.dumps({'id': 1, 'status': 'success', 'response': 'earlier'}) + '\n')
+        
+        agent = AIAgent(ScriptedLLM({'intent_type': 'check_status'}), {})
+        await run_ai_batch(agent, str(in_path), str(out_path), max_concurrency=2)
+        
+        records = [json.loads(line) for line in out_path.read_text().splitlines()]
+        assert len(records) == 3
+        assert records[0]['response'] == 'earlier'
+        assert sorted(record['id'] for record in records[1:]) == [2, 3]
+        assert all(record['status'] == 'success' for record in records)
+    
+    @pytest.mark.asyncio
+    async def test_failed_prompt_is_recorded_as_error(self, tmp_path):
+        """A prompt whose LLM call fails is an error record, retried on resume."""
+        from src.mcp.ai.cli_agent import _load_batch, run_ai_batch
+        
+        class FailingLLM(ScriptedLLM):
+            async def generate(self, prompt, system=None, **kwargs):
+                raise RuntimeError('429 Too Many Requests')
+        
+        in_path = tmp_path / 'prompts.jsonl'
+        in_path.write_text('"list pods"\n')
+        out_path = tmp_path / 'results.jsonl'
+        
+        agent = AIAgent(FailingLLM({}), {})
+        await run_ai_batch(agent, str(in_path), str(out_path))
+        
+        records = [json.loads(line) for line in out_path.read_text().splitlines()]
+        assert records == [{'id': 1, 'prompt': 'list pods', 'error': '429 Too Many Requests', 'status': 'error'}]
+        assert [item['id'] for item in _load_batch(in_path, out_path)] == [1]
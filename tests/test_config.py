@@ -145,3 +145,209 @@ def test_update_server(temp_config_dir):
     assert server['host'] == 'host2'
     assert server['user'] == 'user2'
     assert server['port'] == 2222
+
+
+def test_external_edit_is_reloaded(temp_config_dir):
+    """Test lookups pick up changes written by another process."""
+    config = ConfigManager(str(temp_config_dir))
+    config.add_ssh_server(name='web-01', host='old.example.com', user='deploy')
+    assert config.get_ssh_server('web-01')['host'] == 'old.example.com'
+    
+    other = ConfigManager(str(temp_config_dir))
+    other.add_ssh_server(name='web-01', host='new.example.com', user='deploy')
+    # Ensure a distinct mtime even on coarse-grained filesystems
+    stat = temp_config_dir.stat()
+    os.utime(temp_config_dir, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000))
+    
+    assert config.get_ssh_server('web-01')['host'] == 'new.example.com'
+
+
+def test_unchanged_file_is_not_reparsed(temp_config_dir, monkeypatch):
+    """Test a second instance reuses the parsed config as an independent copy."""
+    config = ConfigManager(str(temp_config_dir))
+    config.add_alias('pods', 'k8s pods')
+    
+    def fail(*args, **kwargs):
+        raise AssertionError("config was parsed again")
+    monkeypatch.setattr(yaml, 'load', fail)
+    
+    other = ConfigManager(str(temp_config_dir))
+    other.config['aliases']['pods'] = 'changed'
+    
+    assert config.get_alias('pods') == 'k8s pods'
+    assert ConfigManager(str(temp_config_dir)).get_alias('pods') == 'k8s pods'
+
+
+def test_profiles_stored_as_lists_on_disk(temp_config_dir):
+    """Test profile sections keep the list layout in the config file."""
+    temp_config_dir.write_text(
+        "ssh_servers:\n"
+        "- {name: web-01, host: a.example.com, user: deploy}\n"
+        "- {name: web-02, host: b.example.com, user: deploy}\n"
+    )
+    config = ConfigManager(str(temp_config_dir))
+    config.add_ssh_server('web-01', 'c.example.com', 'deploy')
+    
+    on_disk = yaml.safe_load(temp_config_dir.read_text())
+    
+    assert [s['name'] for s in on_disk['ssh_servers']] == ['web-02', 'web-01']
+    assert on_disk['ssh_servers'][1]['host'] == 'c.example.com'
+    assert config.list_profiles()['ssh_servers'] == ['web-02', 'web-01']
+
+
+def test_malformed_profile_entries_are_kept(temp_config_dir):
+    """Test unnamed and non-mapping entries neither break loading nor get lost."""
+    temp_config_dir.write_text(
+        "settings: {timeout: 99}\n"
+        "ssh_servers:\n"
+        "- oops\n"
+        "- {host: nameless.example.com}\n"
+        "- {host: other-nameless.example.com}\n"
+        "- {name: web-01, host: a.example.com, user: deploy}\n"
+    )
+    config = ConfigManager(str(temp_config_dir))
+    assert config.get_ssh_server('web-01')['host'] == 'a.example.com'
+    assert config.list_profiles()['ssh_servers'] == ['web-01']
+    
+    config.add_ssh_server('web-02', 'b.example.com', 'deploy')
+    
+    on_disk = yaml.safe_load(temp_config_dir.read_text())
+    assert on_disk['settings'] == {'timeout': 99}
+    assert on_disk['ssh_servers'][:3] == [
+        'oops', {'host': 'nameless.example.com'}, {'host': 'other-nameless.example.com'}
+    ]
+    assert [s['name'] for s in on_disk['ssh_servers'][3:]] == ['web-01', 'web-02']
+
+
+def test_update_drops_duplicate_entries(temp_config_dir):
+    """Test updating a name repeated in the file replaces every copy."""
+    temp_config_dir.write_text(
+        "ssh_servers:\n"
+        "- {name: web, host: old1, user: deploy}\n"
+        "- {name: web, host: old2, user: deploy}\n"
+    )
+    config = ConfigManager(str(temp_config_dir))
+    config.add_ssh_server('web', 'new', 'deploy')
+    
+    on_disk = yaml.safe_load(temp_config_dir.read_text())
+    
+    assert [s['host'] for s in on_disk['ssh_servers']] == ['new']
+    assert ConfigManager(str(temp_config_dir)).get_ssh_server('web')['host'] == 'new'
+
+
+def test_absent_sections_are_not_added(temp_config_dir):
+    """Test saving does not write empty profile sections the file never had."""
+    temp_config_dir.write_text("settings: {timeout: 99}\n")
+    config = ConfigManager(str(temp_config_dir))
+    config.add_ssh_server('web-01', 'a.example.com', 'deploy')
+    
+    on_disk = yaml.safe_load(temp_config_dir.read_text())
+    
+    assert set(on_disk) == {'settings', 'ssh_servers'}
+    assert config.list_profiles()['docker_hosts'] == []
+
+
+def test_unloadable_config_is_never_overwritten(temp_config_dir):
+    """Test a config that failed to load is not replaced by a save."""
+    original = "settings: {timeout: 99}\nssh_servers: [\n"
+    temp_config_dir.write_text(original)
+    config = ConfigManager(str(temp_config_dir))
+    
+    with pytest.raises(RuntimeError, match='could not be loaded'):
+        config.add_ssh_server('web-01', 'a.example.com', 'deploy')
+    
+    assert temp_config_dir.read_text() == original
+
+
+def test_batch_saves_once(temp_config_dir, monkeypatch):
+    """Test add_* calls inside batch() are written in a single save."""
+    config = ConfigManager(str(temp_config_dir))
+    saves = []
+    original_save = config.save_config
+    monkeypatch.setattr(config, 'save_config', lambda: saves.append(1) or original_save())
+    
+    with config.batch():
+        for i in range(5):
+            config.add_ssh_server(f'server{i}', f'host{i}', 'deploy')
+        config.add_alias('pods', 'k8s pods')
+        assert saves == []
+    
+    assert saves == [1]
+    assert len(ConfigManager(str(temp_config_dir)).list_profiles()['ssh_servers']) == 5
+
+
+def test_batch_keeps_unsaved_changes_over_external_edit(temp_config_dir):
+    """Test an external write during batch() does not discard earlier batch changes."""
+    config = ConfigManager(str(temp_config_dir))
+    
+    with config.batch():
+        config.add_ssh_server('a', 'host-a', 'deploy')
+        
+        ConfigManager(str(temp_config_dir)).add_alias('pods', 'k8s pods')
+        stat = temp_config_dir.stat()
+        os.utime(temp_config_dir, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000))
+        
+        config.add_ssh_server('b', 'host-b', 'deploy')
+    
+    on_disk = ConfigManager(str(temp_config_dir)).list_profiles()
+    assert on_disk['ssh_servers'] == ['a', 'b']
+
+
+def test_unchanged_update_is_not_saved(temp_config_dir, monkeypatch):
+    """Test re-applying identical profiles skips the save."""
+    config = ConfigManager(str(temp_config_dir))
+    config.add_ssh_server('web-01', 'host1', 'deploy', key_path='~/.ssh/id')
+    config.add_alias('pods', 'k8s pods')
+    
+    saves = []
+    monkeypatch.setattr(config, 'save_config', lambda: saves.append(1))
+    
+    config.add_ssh_server('web-01', 'host1', 'deploy', key_path='~/.ssh/id')
+    config.add_alias('pods', 'k8s pods')
+    assert saves == []
+    
+    config.add_ssh_server('web-01', 'host1', 'deploy', port=2222)
+    config.add_alias('pods', 'kubectl get pods')
+    assert saves == [1, 1]
+
+
+def test_json_config_round_trip(tmp_path):
+    """Test .json config files are read and written as JSON."""
+    import json
+    
+    config_path = tmp_path / "config.json"
+    config_path.write_text(json.dumps({"ssh_servers": [], "aliases": {}}))
+    
+    config = ConfigManager(str(config_path))
+    config.add_ssh_server('web-01', 'host1', 'deploy')
+    
+    on_disk = json.loads(config_path.read_text())
+    assert on_disk['ssh_servers'][0]['name'] == 'web-01'
+
+
+def test_fast_list_profiles_matches_full_load(temp_config_dir):
+    """Test the event-level profile scan agrees with a full load."""
+    config = ConfigManager(str(temp_config_dir))
+    with config.batch():
+        config.add_ssh_server('web-01', 'host1', 'deploy', key_path='~/.ssh/id')
+        config.add_ssh_server('web-02', 'host2', 'deploy')
+        config.add_docker_host('docker1', 'host1', ssh_config={'name': 'nested'})
+        config.add_k8s_cluster('prod', '~/.kube/config', context='prod')
+        config.add_alias('pods', 'k8s pods')
+    
+    assert ConfigManager.fast_list_profiles(str(temp_config_dir)) == config.list_profiles()
+
+
+
+def test_fast_list_profiles_falls_back_on_yaml_aliases(tmp_path):
+    """Test sections the scanner can't resolve are listed via a full parse."""
+    config_path = tmp_path / "config.yaml"
+    config_path.write_text(
+        "defaults: &servers\n"
+        "- {name: web-01, host: host1, user: deploy}\n"
+        "ssh_servers: *servers\n"
+    )
+    
+    profiles = ConfigManager.fast_list_profiles(str(config_path))
+    
+    assert profiles['ssh_servers'] == ['web-01']
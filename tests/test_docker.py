@@ -69,6 +69,96 @@ class TestDockerToolUnit:
         
         with pytest.raises(docker.errors.DockerException):
             mock_docker_manager.list_containers()
+    
+    def test_iter_containers_uses_single_list_request(self):
+        """Containers are listed from one API call, without per-container inspects."""
+        from src.mcp.docker_manager import DockerManager
+        
+        client = MagicMock()
+        client.api.containers.return_value = [{
+            'Id': 'abc123def456789',
+            'Names': ['/web'],
+            'Image': 'nginx',
+            'ImageID': 'sha256:1111aaaa2222bbbb3333',
+            'State': 'running',
+            'Created': 1700000000,
+            'Ports': [
+                {'IP': '0.0.0.0', 'PrivatePort': 80, 'PublicPort': 8080, 'Type': 'tcp'},
+                {'PrivatePort': 443, 'Type': 'tcp'}
+            ]
+        }, {
+            'Id': 'fedcba987654321',
+            'Names': ['/worker'],
+            # Created from a tag that has since moved to another image
+            'Image': 'sha256:4444cccc5555dddd6666',
+            'ImageID': 'sha256:4444cccc5555dddd6666',
+            'State': 'exited',
+            'Created': 0,
+            'Ports': []
+        }]
+        client.api.images.return_value = [
+            {'Id': 'sha256:1111aaaa2222bbbb3333', 'RepoTags': ['nginx:latest', 'nginx:1.25']},
+            {'Id': 'sha256:4444cccc5555dddd6666', 'RepoTags': ['<none>:<none>']},
+        ]
+        
+        containers = DockerManager(ssh_manager=MagicMock()).list_containers(client)
+        
+        # image is the first tag (or short id when untagged), as before;
+        # created has whole-second precision from the list endpoint
+        assert containers == [{
+            'id': 'abc123def456',
+            'name': 'web',
+            'status': 'running',
+            'image': 'nginx:latest',
+            'created': '2023-11-14T22:13:20Z',
+            'ports': {
+                '80/tcp': [{'HostIp': '0.0.0.0', 'HostPort': '8080'}],
+                '443/tcp': None
+            }
+        }, {
+            'id': 'fedcba987654',
+            'name': 'worker',
+            'status': 'exited',
+            'image': 'sha256:4444cccc5555',
+            'created': '1970-01-01T00:00:00Z',
+            'ports': {}
+        }]
+        client.api.images.assert_called_once()
+        client.containers.list.assert_not_called()
+        client.containers.get.assert_not_called()
+    
+    def test_lifecycle_ops_skip_inspect(self):
+        """Lifecycle operations are one API call, with NotFound as ValueError."""
+        from src.mcp.docker_manager import DockerManager
+        
+        client = MagicMock()
+        manager = DockerManager(ssh_manager=MagicMock())
+        
+        manager.stop_container('web', client, timeout=5)
+        manager.remove_container('web', client, force=True)
+        
+        client.api.stop.assert_called_once_with('web', timeout=5)
+        client.api.remove_container.assert_called_once_with('web', force=True)
+        client.containers.get.assert_not_called()
+        
+        client.api.start.side_effect = docker.errors.NotFound("No such container")
+        with pytest.raises(ValueError, match="Container not found: gone"):
+            manager.start_container('gone', client)
+    
+    def test_local_client_shared_across_managers(self):
+        """docker.from_env runs once per process, not per manager."""
+        from src.mcp.docker_manager import DockerManager, close_clients
+        
+        close_clients()
+        try:
+            with patch('src.mcp.docker_manager.docker.from_env') as from_env:
+                first = DockerManager(ssh_manager=MagicMock()).get_local_client()
+                second = DockerManager(ssh_manager=MagicMock()).get_local_client()
+            
+            assert first is second
+            assert from_env.call_count == 1
+        finally:
+            close_clients()
 
 
 @pytest.mark.integration
@@ -175,6 +265,20 @@ class TestDockerLogStreaming:
         ))
         
         assert len(logs) >= 2
+    
+    def test_container_logs_split_across_chunks(self):
+        """Lines split across stream chunks are reassembled."""
+        from src.mcp.docker_manager import DockerManager
+        
+        manager = DockerManager(ssh_manager=MagicMock())
+        container = MagicMock()
+        container.logs.side_effect = lambda stream, **kwargs: (
+            iter([b'line 1\nli', b'ne 2\n', b'line 3']) if stream else b'old 1\nold 2\n'
+        )
+        manager.get_container = lambda *args: container
+        
+        assert list(manager.get_container_logs('web', follow=True)) == ['line 1', 'line 2', 'line 3']
+        assert list(manager.get_container_logs('web')) == ['old 1', 'old 2']
 
 
 class TestDockerStats:
@@ -194,6 +298,32 @@ class TestDockerStats:
         assert 'cpu_percent' in stats
         assert 'memory_usage' in stats
         assert stats['cpu_percent'] > 0
+    
+    def test_docker_stats_batch(self):
+        """Stats for several containers come back keyed by ID; failures are isolated."""
+        from src.mcp.docker_manager import DockerManager
+        
+        def stats(container_id, stream, one_shot):
+            if container_id == 'gone':
+                raise docker.errors.NotFound('No such container')
+            return {
+                'cpu_stats': {'cpu_usage': {'total_usage': 200}, 'system_cpu_usage': 1000, 'online_cpus': 2},
+                'precpu_stats': {'cpu_usage': {'total_usage': 100}, 'system_cpu_usage': 500},
+                'memory_stats': {'usage': 256, 'limit': 1024},
+                'networks': {'eth0': {'rx_bytes': 10, 'tx_bytes': 5}}
+            }
+        
+        client = MagicMock()
+        client.api.stats.side_effect = stats
+        
+        results = DockerManager(ssh_manager=MagicMock()).get_container_stats_batch(
+            ['web', 'gone'], client
+        )
+        
+        assert results['web']['cpu_percent'] == 40.0
+        assert results['web']['memory_percent'] == 25.0
+        assert results['web']['network_rx'] == 10
+        assert isinstance(results['gone'], docker.errors.NotFound)
 
 
 class TestDockerImageManagement:
@@ -225,6 +355,26 @@ class TestDockerImageManagement:
         result = mock_docker_manager.pull_image('alpine:latest')
         
         assert result['status'] == 'success'
+    
+    def test_docker_pull_images_concurrently(self):
+        """Each image is pulled through the low-level API; errors are per image."""
+        from src.mcp.docker_manager import DockerManager
+        
+        def pull(image, tag, stream, decode):
+            if image == 'missing':
+                return iter([{'status': 'Pulling'}, {'error': 'manifest unknown'}])
+            return iter([{'status': 'Pulling'}, {'status': 'Downloaded newer image'}])
+        
+        client = MagicMock()
+        client.api.pull.side_effect = pull
+        
+        results = DockerManager(ssh_manager=MagicMock()).pull_images(
+            [('alpine', 'latest'), ('missing', '1.0')], client
+        )
+        
+        assert results['alpine:latest'] is None
+        assert 'manifest unknown' in str(results['missing:1.0'])
+        client.images.pull.assert_not_called()
 
 
 class TestDockerComposeIntegration:
@@ -258,6 +258,264 @@ class TestK8sMultiNamespace:
         assert len(pods) > 0
         assert pods[0]['namespace'] == 'production'
 
+    
+    def test_api_handles_share_one_client(self):
+        """Test every API handle reuses the manager's ApiClient until close()."""
+        from src.mcp.k8s_manager import KubernetesManager
+        
+        manager = KubernetesManager()
+        with patch('src.mcp.k8s_manager.client.ApiClient') as api_client, \
+             patch('src.mcp.k8s_manager.client.CoreV1Api') as core_api, \
+             patch('src.mcp.k8s_manager.client.AppsV1Api') as apps_api:
+            manager.delete_pod('a')
+            manager.delete_pod('b')
+            manager.scale_deployment('web', 3)
+            
+            api_client.assert_called_once_with(pool_threads=1)
+            shared = api_client.return_value
+            assert all(c.args == (shared,) for c in core_api.call_args_list + apps_api.call_args_list)
+            
+            manager.close()
+            shared.close.assert_called_once()
+            assert manager.api_client is None
+    
+    @pytest.mark.asyncio
+    async def test_list_pods_multi_collects_per_namespace(self):
+        """Test namespaces are queried together and errors stay per namespace."""
+        from src.mcp.k8s_manager import KubernetesManager
+        
+        def list_pods(namespace, label_selector=None):
+            if namespace == 'forbidden':
+                raise ApiException(status=403, reason="Forbidden")
+            return [{'name': f'{namespace}-pod', 'namespace': namespace}]
+        
+        manager = KubernetesManager()
+        with patch.object(manager, 'list_pods', side_effect=list_pods):
+            results = await manager.list_pods_multi(['default', 'forbidden', 'production'])
+        
+        assert list(results) == ['default', 'forbidden', 'production']
+        assert results['production'][0]['name'] == 'production-pod'
+        assert isinstance(results['forbidden'], ApiException)
+
+    
+    def test_list_pods_follows_continue_token(self):
+        """Test pods are fetched page by page until the continue token runs out."""
+        import json
+        from datetime import datetime, timezone
+        from src.mcp.k8s_manager import KubernetesManager
+        
+        def page(names, continue_token=None):
+            body = {
+                'metadata': {'continue': continue_token} if continue_token else {},
+                'items': [{
+                    'metadata': {'name': name, 'namespace': 'default',
+                                 'creationTimestamp': '2024-05-01T12:00:00Z'},
+                    'spec': {'nodeName': 'node-1', 'containers': [{'name': 'app'}]},
+                    'status': {'phase': 'Running', 'podIP': '10.0.0.1'}
+                } for name in names]
+            }
+            return MagicMock(status=200, data=json.dumps(body).encode())
+        
+        with patch('src.mcp.k8s_manager.client.CoreV1Api') as core_api:
+            list_call = core_api.return_value.list_namespaced_pod
+            list_call.side_effect = [page(['a', 'b'], 'tok'), page(['c'])]
+            pods = KubernetesManager().list_pods('default', page_size=2)
+        
+        assert [p['name'] for p in pods] == ['a', 'b', 'c']
+        assert pods[0] == {
+            'name': 'a', 'namespace': 'default', 'status': 'Running',
+            'node': 'node-1', 'ip': '10.0.0.1', 'containers': 1,
+            'created': datetime(2024, 5, 1, 12, tzinfo=timezone.utc)
+        }
+        assert [c.kwargs['_continue'] for c in list_call.call_args_list] == [None, 'tok']
+        assert all(c.kwargs['limit'] == 2 for c in list_call.call_args_list)
+        assert all(c.kwargs['_preload_content'] is False for c in list_call.call_args_list)
+    
+    def test_list_pods_all_namespaces_single_query(self):
+        """Test cluster-wide listing uses one paginated all-namespaces query."""
+        import json
+        from src.mcp.k8s_manager import KubernetesManager
+        
+        body = {'metadata': {}, 'items': [
+            {'metadata': {'name': 'a', 'namespace': 'default'}, 'spec': {}},
+            {'metadata': {'name': 'b', 'namespace': 'kube-system'}, 'spec': {}},
+        ]}
+        
+        with patch('src.mcp.k8s_manager.client.CoreV1Api') as core_api:
+            v1 = core_api.return_value
+            v1.list_pod_for_all_namespaces.return_value = MagicMock(
+                status=200, data=json.dumps(body).encode()
+            )
+            pods = KubernetesManager().list_pods_all_namespaces(label_selector='app=web')
+        
+        assert [(p['namespace'], p['name']) for p in pods] == [('default', 'a'), ('kube-system', 'b')]
+        assert v1.list_pod_for_all_namespaces.call_args.kwargs['label_selector'] == 'app=web'
+        v1.list_namespaced_pod.assert_not_called()
+    
+    def test_pod_log_lines_split_across_chunks(self):
+        """Test streamed log chunks are re-joined into whole lines."""
+        from src.mcp.k8s_manager import KubernetesManager
+        
+        resp = MagicMock(status=200)
+        resp.stream.return_value = iter([b'first li', b'ne\nsecond\nthi', b'rd'])
+        
+        with patch('src.mcp.k8s_manager.client.CoreV1Api') as core_api:
+            core_api.return_value.read_namespaced_pod_log.return_value = resp
+            lines = list(KubernetesManager().iter_pod_log_lines('web', tail_lines=10))
+        
+        assert lines == ['first line', 'second', 'third']
+        assert core_api.return_value.read_namespaced_pod_log.call_args.kwargs['_preload_content'] is False
+        resp.release_conn.assert_called_once()
+    
+    def test_pod_logs_read_raw_body(self):
+        """Test get_pod_logs returns the raw tail text without client deserialization."""
+        from src.mcp.k8s_manager import KubernetesManager
+        
+        with patch('src.mcp.k8s_manager.client.CoreV1Api') as core_api:
+            read_log = core_api.return_value.read_namespaced_pod_log
+            read_log.return_value = MagicMock(status=200, data=b'{"level": "info"}\nready\n')
+            logs = KubernetesManager().get_pod_logs('web', tail_lines=10)
+        
+        assert logs == '{"level": "info"}\nready\n'
+        assert read_log.call_args.kwargs['_preload_content'] is False
+        read_log.return_value.release_conn.assert_called_once()
+    
+    def test_mcp_logs_tool_only_reduces_when_asked(self, tmp_path):
+        """Test the k8s_logs tool returns the tail unchanged unless optimize is set."""
+        from src.mcp.mcp_server import MCPDevOpsServer
+        
+        lines = [f"line {i}" for i in range(600)]
+        lines[10] = "ERROR something broke"
+        log_text = '\n'.join(lines)
+        
+        server = MCPDevOpsServer(config_path=str(tmp_path / 'config.yaml'))
+        server.k8s_manager = MagicMock()
+        server.k8s_manager.get_pod_logs.return_value = log_text
+        
+        plain = server._tool_k8s_logs({'pod': 'web', 'tail': 600}).to_dict()
+        reduced = server._tool_k8s_logs({'pod': 'web', 'tail': 600, 'optimize': True}).to_dict()
+        
+        assert plain['content'][0]['text'] == f"Logs for pod web:\n\n{log_text}"
+        reduced_text = reduced['content'][0]['text']
+        assert reduced_text.startswith("Logs for pod web:\n\nERROR something broke")
+        assert 'line 11\n' not in reduced_text
+    
+    def test_large_logs_reduced_in_spawned_worker(self, tmp_path):
+        """Test large logs go to a spawn-context process pool, shut down on close."""
+        import asyncio
+        from src.mcp.mcp_server import MCPDevOpsServer
+        from src.mcp.llm.cost_manager import reduce_log_content
+        
+        lines = [f"line {i}" for i in range(600)]
+        lines[10] = "ERROR something broke"
+        log_text = '\n'.join(lines)
+        
+        server = MCPDevOpsServer(config_path=str(tmp_path / 'config.yaml'))
+        server.LOG_OFFLOAD_MIN_CHARS = 1000
+        
+        try:
+            assert server._reduce_logs(log_text) == reduce_log_content(log_text)
+            pool = server._log_pool
+            assert pool is not None
+            assert pool._mp_context.get_start_method() == 'spawn'
+        finally:
+            asyncio.run(server.aclose())
+        
+        assert server._log_pool is None
+        assert pool._shutdown_thread
+    
+    def test_raw_list_error_raises_api_exception(self):
+        """Test a failed raw LIST surfaces as ApiException."""
+        from src.mcp.k8s_manager import KubernetesManager
+        
+        with patch('src.mcp.k8s_manager.client.CoreV1Api') as core_api:
+            core_api.return_value.list_namespace.return_value = MagicMock(
+                status=403, reason='Forbidden'
+            )
+            with pytest.raises(ApiException) as exc_info:
+                KubernetesManager().list_namespaces()
+        
+        assert exc_info.value.status == 403
+    
+    def test_exec_output_streamed_in_chunks(self):
+        """Test exec output is yielded per frame, including frames left at close."""
+        from src.mcp.k8s_manager import KubernetesManager
+        
+        class FakeWSClient:
+            def __init__(self):
+                self.frames = [{'stdout': 'line 1\n'}, {'stderr': 'warn\n'},
+                               {'stdout': 'line 2\n'}]
+                self.channels = {}
+                self.closed = False
+            
+            def is_open(self):
+                return bool(self.frames)
+            
+            def update(self, timeout=0):
+                self.channels.update(self.frames.pop(0))
+                # The last frame arrives together with the close
+                if len(self.frames) == 1:
+                    self.channels.update(self.frames.pop())
+            
+            def peek_stdout(self):
+                return self.channels.get('stdout', '')
+            
+            def peek_stderr(self):
+                return self.channels.get('stderr', '')
+            
+            def read_stdout(self):
+                return self.channels.pop('stdout')
+            
+            def read_stderr(self):
+                return self.channels.pop('stderr')
+            
+            def close(self):
+                self.closed = True
+        
+        ws = FakeWSClient()
+        manager = KubernetesManager()
+        with patch('src.mcp.k8s_manager.client.CoreV1Api'), \
+             patch('kubernetes.stream.stream', return_value=ws) as stream:
+            chunks = list(manager.exec_stream('web', ['cat', 'app.log']))
+        
+        assert chunks == ['line 1\n', 'line 2\n', 'warn\n']
+        assert stream.call_args.kwargs['_preload_content'] is False
+        assert ws.closed
+        
+        with patch('src.mcp.k8s_manager.client.CoreV1Api'), \
+             patch('kubernetes.stream.stream', return_value=FakeWSClient()):
+            assert manager.execute_in_pod('web', ['cat']) == 'line 1\nline 2\nwarn\n'
+    
+    def test_kubeconfig_parsed_once_until_changed(self, tmp_path):
+        """Test contexts and context switches reuse the parsed kubeconfig."""
+        import os
+        import yaml
+        from src.mcp.k8s_manager import KubernetesManager
+        
+        kubeconfig = tmp_path / "config"
+        kubeconfig.write_text(yaml.safe_dump({
+            'clusters': [{'name': 'c', 'cluster': {'server': 'https://k8s.example.com'}}],
+            'users': [{'name': 'u', 'user': {'token': 'secret'}}],
+            'contexts': [{'name': 'dev', 'context': {'cluster': 'c', 'user': 'u'}},
+                         {'name': 'prod', 'context': {'cluster': 'c', 'user': 'u'}}],
+            'current-context': 'dev',
+        }))
+        
+        manager = KubernetesManager()
+        with patch('src.mcp.k8s_manager.yaml.safe_load', wraps=yaml.safe_load) as safe_load:
+            assert manager.load_kubeconfig(str(kubeconfig)) == 'dev'
+            assert manager.list_contexts(str(kubeconfig)) == ['dev', 'prod']
+            manager.switch_context('prod', str(kubeconfig))
+            assert manager.current_context == 'prod'
+            assert manager.api_client.configuration.host == 'https://k8s.example.com'
+            assert safe_load.call_count == 1
+            
+            stat = kubeconfig.stat()
+            os.utime(kubeconfig, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000))
+            manager.list_contexts(str(kubeconfig))
+            assert safe_load.call_count == 2
+        
+        manager.close()
 
 class TestK8sResourceFiltering:
     """Test Kubernetes resource filtering."""
@@ -279,6 +537,23 @@ class TestK8sResourceFiltering:
         assert len(pods) > 0
         assert pods[0]['labels']['app'] == 'web'
     
+    def test_label_selector_matching(self):
+        """Test the local label selector grammar used by the pod informer."""
+        from src.mcp.k8s_manager import _parse_selector, _selector_matches
+        
+        labels = {'app': 'web', 'tier': 'frontend', 'canary': 'true'}
+        
+        def matches(selector):
+            return _selector_matches(_parse_selector(selector), labels)
+        
+        assert matches('app=web,tier==frontend')
+        assert matches('app in (web, api), env notin (prod)')
+        assert matches('canary, !legacy')
+        assert not matches('app!=web')
+        assert not matches('tier in (backend)')
+        with pytest.raises(ValueError):
+            _parse_selector('app=web,,(')
+    
     def test_k8s_filter_by_field(self, mock_k8s_manager):
         """Test filtering by field selector."""
         mock_k8s_manager.list_pods.return_value = [
@@ -294,6 +569,88 @@ class TestK8sResourceFiltering:
         assert pods[0]['status'] == 'Running'
 
 
+
+class TestK8sPodInformer:
+    """Test the list+watch pod cache."""
+    
+    @staticmethod
+    def _pod(name, labels=None):
+        return k8s_client.V1Pod(
+            metadata=k8s_client.V1ObjectMeta(name=name, namespace='default', labels=labels),
+            spec=k8s_client.V1PodSpec(containers=[k8s_client.V1Container(name='app')]),
+            status=k8s_client.V1PodStatus(phase='Running')
+        )
+    
+    def test_informer_applies_watch_events(self):
+        """Test the cache is listed once and then updated from watch deltas."""
+        from src.mcp.k8s_manager import KubernetesManager, PodInformer
+        
+        pod = self._pod
+        
+        class FakeWatch:
+            resource_version = '12'
+            
+            def stream(self, list_call, namespace, **kwargs):
+                assert kwargs['resource_version'] == '10'
+                yield {'type': 'ADDED', 'object': pod('c', {'app': 'web'})}
+                yield {'type': 'DELETED', 'object': pod('a')}
+                yield {'type': 'BOOKMARK', 'object': {}}
+                informer.stop()
+            
+            def stop(self):
+                pass
+        
+        with patch('src.mcp.k8s_manager.client.CoreV1Api') as core_api, \
+             patch('src.mcp.k8s_manager.watch.Watch', FakeWatch):
+            v1 = core_api.return_value
+            v1.list_namespaced_pod.return_value = k8s_client.V1PodList(
+                items=[pod('a'), pod('b', {'app': 'web'})],
+                metadata=k8s_client.V1ListMeta(resource_version='10')
+            )
+            
+            informer = PodInformer(None, 'default')
+            informer._relist()
+            informer._run()
+            
+            manager = KubernetesManager()
+            manager.informers['default'] = informer
+            names = [p['name'] for p in manager.list_pods('default', label_selector='app=web')]
+            
+            assert names == ['b', 'c']
+            assert informer._rv == '12'
+            assert manager.get_pod('c')['name'] == 'c'
+            v1.read_namespaced_pod.assert_not_called()
+            assert v1.list_namespaced_pod.call_count == 1
+
+    
+    def test_watch_pod_yields_phase_changes(self):
+        """Test watch_pod follows one pod and reports only phase transitions."""
+        from src.mcp.k8s_manager import KubernetesManager
+        
+        def event(event_type, phase):
+            pod = self._pod('web')
+            pod.status.phase = phase
+            return {'type': event_type, 'object': pod}
+        
+        events = [
+            event('ADDED', 'Pending'),
+            event('MODIFIED', 'Pending'),
+            event('MODIFIED', 'Running'),
+            event('DELETED', 'Running'),
+            event('ADDED', 'Pending'),
+        ]
+        
+        with patch('src.mcp.k8s_manager.client.CoreV1Api'), \
+             patch('src.mcp.k8s_manager.watch.Watch') as watch_cls:
+            watch_cls.return_value.stream.return_value = iter(events)
+            phases = list(KubernetesManager().watch_pod('web', timeout=30))
+        
+        assert phases == ['Pending', 'Running']
+        kwargs = watch_cls.return_value.stream.call_args.kwargs
+        assert kwargs['field_selector'] == 'metadata.name=web'
+        assert kwargs['timeout_seconds'] == 30
+
+
 class TestK8sDeploymentOperations:
     """Test Kubernetes deployment operations."""
     
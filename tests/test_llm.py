@@ -123,6 +123,343 @@ Log Summary:
         # Should handle gracefully
         assert response.content == ""
         assert response.tokens_used == 0
+    
+    @pytest.mark.asyncio
+    async def test_ollama_session_reused_until_closed(self):
+        """Ollama requests share one pooled HTTP session."""
+        from src.mcp.llm.providers import LLMClient
+        
+        llm = LLMClient({'providers': {'ollama': {'model': 'llama2'}}})
+        provider = llm.get_provider('ollama')
+        session = provider._get_session()
+        
+        assert provider._get_session() is session
+        
+        await llm.aclose()
+        assert session.closed
+    
+    def test_missing_sdk_reported_at_setup(self, monkeypatch):
+        """A provider whose SDK isn't installed fails to initialize, with a clear error."""
+        import importlib.util
+        from src.mcp.llm.providers import LLMClient, OpenAIProvider
+        
+        find_spec = importlib.util.find_spec
+        monkeypatch.setattr(importlib.util, 'find_spec',
+                            lambda name, *args: None if name == 'openai' else find_spec(name, *args))
+        
+        with pytest.raises(ImportError, match="pip install openai"):
+            OpenAIProvider(api_key='sk-test')
+        
+        llm = LLMClient({'providers': {'openai': {'api_key': 'sk-test'},
+                                       'ollama': {'model': 'llama2'}}})
+        assert llm.list_providers() == ['ollama']
+    
+    def test_pricing_matches_dated_model_ids(self):
+        """Versioned model ids are priced as their base model, not the fallback."""
+        from src.mcp.llm.providers import OpenAIProvider, AnthropicProvider
+        
+        assert OpenAIProvider('gpt-4o-mini-2024-07-18', api_key='sk-test')._pricing() == \
+            OpenAIProvider.PRICING['gpt-4o-mini']
+        assert AnthropicProvider('claude-3-5-haiku-20241022', api_key='sk-test')._pricing() == \
+            AnthropicProvider.PRICING['claude-3-5-haiku']
+        assert OpenAIProvider('unknown-model', api_key='sk-test')._pricing() == \
+            OpenAIProvider.DEFAULT_PRICING
+    
+    @pytest.mark.asyncio
+    async def test_batch_falls_back_to_concurrent_requests(self):
+        """Providers without a batch API answer each prompt, in order."""
+        from src.mcp.llm.providers import LLMClient, LLMResponse
+        
+        llm = LLMClient({'providers': {'ollama': {'model': 'llama2'}}})
+        
+        async def generate(messages, **kwargs):
+            return LLMResponse(content=messages[-1].content.upper(), model='llama2', tokens_used=1)
+        
+        llm.get_provider('ollama').generate = generate
+        responses = await llm.generate_batch(['a', 'b', 'c'])
+        
+        assert [r.content for r in responses] == ['A', 'B', 'C']
+    
+    @pytest.mark.asyncio
+    async def test_generate_many_bounds_concurrency(self):
+        """Prompts run concurrently up to the limit; failures stay per prompt."""
+        import asyncio
+        from src.mcp.llm.providers import LLMClient, LLMResponse
+        
+        llm = LLMClient({'providers': {'ollama': {'model': 'llama2'}}})
+        in_flight = []
+        peak = []
+        
+        async def generate(messages, **kwargs):
+            in_flight.append(1)
+            peak.append(len(in_flight))
+            await asyncio.sleep(0.01)
+            in_flight.pop()
+            if messages[-1].content == 'bad':
+                raise ValueError("bad prompt")
+            return LLMResponse(content=messages[-1].content, model='llama2', tokens_used=1)
+        
+        llm.get_provider('ollama').generate = generate
+        results = await llm.generate_many(['a', 'bad', 'c', 'd', 'e'], max_concurrency=2)
+        
+        assert max(peak) == 2
+        assert [r.content for r in results if not isinstance(r, Exception)] == ['a', 'c', 'd', 'e']
+        assert isinstance(results[1], ValueError)
+    
+    @pytest.mark.asyncio
+    async def test_generate_many_spaces_out_requests(self):
+        """A per-minute rate limit spaces request starts evenly."""
+        import asyncio
+        from src.mcp.llm.providers import LLMClient, LLMResponse
+        
+        llm = LLMClient({'providers': {'ollama': {'model': 'llama2'}}})
+        loop = asyncio.get_running_loop()
+        starts = []
+        
+        async def generate(messages, **kwargs):
+            starts.append(loop.time())
+            return LLMResponse(content='', model='llama2', tokens_used=1)
+        
+        llm.get_provider('ollama').generate = generate
+        await llm.generate_many(['a', 'b', 'c'], rate_limit_per_min=1200)
+        
+        gaps = [later - earlier for earlier, later in zip(starts, starts[1:])]
+        assert all(gap >= 0.045 for gap in gaps)
+    
+    @pytest.mark.asyncio
+    async def test_openai_batch_api_round_trip(self, monkeypatch):
+        """OpenAI batches upload one JSONL file and map results back by custom_id."""
+        import json
+        from types import SimpleNamespace
+        from src.mcp.llm.providers import OpenAIProvider, LLMMessage
+        
+        provider = OpenAIProvider(api_key='sk-test')
+        monkeypatch.setattr(provider, 'BATCH_POLL_INTERVAL', 0)
+        client = MagicMock()
+        provider._client = client
+        
+        def result(i, text):
+            return json.dumps({'custom_id': str(i), 'response': {'status_code': 200, 'body': {
+                'choices': [{'message': {'content': text}, 'finish_reason': 'stop'}],
+                'usage': {'prompt_tokens': 800, 'completion_tokens': 200, 'total_tokens': 1000}
+            }}})
+        
+        client.files.create = AsyncMock(return_value=SimpleNamespace(id='file-in'))
+        client.batches.create = AsyncMock(return_value=SimpleNamespace(id='b1', status='in_progress'))
+        client.batches.retrieve = AsyncMock(return_value=SimpleNamespace(
+            id='b1', status='completed', output_file_id='file-out'))
+        client.files.content = AsyncMock(return_value=SimpleNamespace(
+            text=result(1, 'second') + '\n' + result(0, 'first')))
+        
+        responses = await provider.generate_batch([
+            [LLMMessage(role='user', content='one')],
+            [LLMMessage(role='user', content='two')],
+        ])
+        
+        assert [r.content for r in responses] == ['first', 'second']
+        assert responses[0].cost == pytest.approx(provider.estimate_cost(800, 200) / 2)
+        uploaded = client.files.create.call_args.kwargs['file'][1].decode().splitlines()
+        assert [json.loads(line)['body']['messages'][0]['content'] for line in uploaded] == ['one', 'two']
+        assert client.batches.create.call_args.kwargs['endpoint'] == '/v1/chat/completions'
+    
+    @pytest.mark.asyncio
+    async def test_anthropic_batch_reports_failed_requests(self, monkeypatch):
+        """A request that didn't succeed in an Anthropic batch raises."""
+        from types import SimpleNamespace
+        from src.mcp.llm.providers import AnthropicProvider, LLMMessage
+        
+        provider = AnthropicProvider(api_key='sk-test')
+        monkeypatch.setattr(provider, 'BATCH_POLL_INTERVAL', 0)
+        client = MagicMock()
+        provider._client = client
+        
+        message = SimpleNamespace(content=[SimpleNamespace(text='ok')], stop_reason='end_turn',
+                                  usage=SimpleNamespace(input_tokens=10, output_tokens=5))
+        entries = [
+            SimpleNamespace(custom_id='0', result=SimpleNamespace(type='succeeded', message=message)),
+            SimpleNamespace(custom_id='1', result=SimpleNamespace(type='errored')),
+        ]
+        
+        async def results(batch_id):
+            for entry in entries:
+                yield entry
+        
+        client.messages.batches.create = AsyncMock(return_value=SimpleNamespace(
+            id='mb1', processing_status='in_progress'))
+        client.messages.batches.retrieve = AsyncMock(return_value=SimpleNamespace(
+            id='mb1', processing_status='ended'))
+        client.messages.batches.results = AsyncMock(side_effect=lambda batch_id: results(batch_id))
+        
+        conversations = [[LLMMessage(role='system', content='be brief'),
+                          LLMMessage(role='user', content='hi')]] * 2
+        with pytest.raises(RuntimeError, match=r"requests \[1\] failed"):
+            await provider.generate_batch(conversations)
+        
+        params = client.messages.batches.create.call_args.kwargs['requests'][0]['params']
+        assert params['system'] == 'be brief'
+        assert params['messages'] == [{'role': 'user', 'content': 'hi'}]
+    
+    @pytest.mark.asyncio
+    async def test_provider_pools_sized_from_config(self):
+        """Pool settings in a provider's config reach its HTTP client."""
+        from src.mcp.llm.providers import LLMClient
+        
+        llm = LLMClient({'providers': {
+            'ollama': {'model': 'llama2', 'max_connections': 256, 'keepalive': 30, 'timeout': 90},
+            'openai': {'api_key': 'sk-test', 'timeout': 45.0},
+            'anthropic': {'api_key': 'sk-test'},
+        }})
+        
+        session = llm.get_provider('ollama')._get_session()
+        assert session.connector.limit == 256
+        assert session.connector.limit_per_host == 256
+        assert session.timeout.total == 90
+        
+        assert llm.get_provider('openai')._get_client().timeout.read == 45.0
+        # Nothing configured: the SDK keeps its own HTTP client
+        anthropic_provider = llm.get_provider('anthropic')
+        anthropic_provider.config['http2'] = False
+        assert anthropic_provider._http_client(None) is None
+        
+        sdk = MagicMock()
+        anthropic_provider.config['http2'] = True
+        anthropic_provider._http_client(sdk)
+        assert sdk.DefaultAsyncHttpxClient.call_args.kwargs['http2'] is True
+        
+        await llm.aclose()
+    
+    @pytest.mark.asyncio
+    async def test_api_providers_share_one_http_client(self):
+        """OpenAI and Anthropic reuse one HTTP pool, closed once by the client."""
+        from src.mcp.llm.providers import LLMClient
+        
+        llm = LLMClient({
+            'http': {'timeout': 60.0},
+            'providers': {
+                'openai': {'api_key': 'sk-test'},
+                'anthropic': {'api_key': 'sk-test'},
+            }
+        })
+        
+        openai_client = llm.get_provider('openai')._get_client()
+        anthropic_client = llm.get_provider('anthropic')._get_client()
+        shared = llm._http._client
+        assert openai_client._client is shared
+        assert anthropic_client._client is shared
+        assert shared.timeout.read == 60.0
+        
+        await llm.aclose()
+        assert shared.is_closed
+        assert llm._http._client is None
+    
+    @pytest.mark.asyncio
+    async def test_ollama_stream_parses_lines_split_across_chunks(self):
+        """NDJSON lines are reassembled across chunk boundaries."""
+        from src.mcp.llm.providers import OllamaProvider, LLMMessage
+        
+        chunks = [b'{"response": "Hel', b'lo"}\n{"response": " wor', b'ld"}\n\n{"done": true}']
+        
+        async def iter_chunked(size):
+            for chunk in chunks:
+                yield chunk
+        
+        response = MagicMock()
+        response.content.iter_chunked = iter_chunked
+        post = MagicMock()
+        post.return_value.__aenter__ = AsyncMock(return_value=response)
+        post.return_value.__aexit__ = AsyncMock(return_value=False)
+        
+        provider = OllamaProvider()
+        provider._session = MagicMock(closed=False, post=post)
+        
+        text = [t async for t in provider.generate_stream([LLMMessage(role='user', content='hi')])]
+        
+        assert text == ['Hello', ' world']
+    
+    def test_ollama_prompt_reuses_system_prefix(self):
+        """The formatted system prefix is built once per system prompt."""
+        from src.mcp.llm.providers import OllamaProvider, LLMMessage
+        
+        provider = OllamaProvider()
+        system = LLMMessage(role='system', content='Classify the ticket.')
+        
+        first = provider._format_messages([system, LLMMessage(role='user', content='disk full')])
+        second = provider._format_messages([system, LLMMessage(role='user', content='login fails')])
+        
+        assert first == "System: Classify the ticket.\n\nHuman: disk full\n\nAssistant:"
+        assert second.endswith("Human: login fails\n\nAssistant:")
+        assert list(provider._system_prefixes) == [('Classify the ticket.',)]
+        assert provider._format_messages([LLMMessage(role='user', content='hi')]) == \
+            "Human: hi\n\nAssistant:"
+    
+    @pytest.mark.asyncio
+    async def test_abandoned_stream_closes_provider_stream(self):
+        """Stopping a chat stream early closes the provider's stream right away."""
+        from src.mcp.llm.providers import LLMClient, LLMMessage
+        
+        llm = LLMClient({'providers': {'ollama': {'model': 'llama2'}}})
+        read = []
+        closed = []
+        
+        async def generate_stream(messages, **kwargs):
+            try:
+                for token in ['a', 'b', 'c']:
+                    read.append(token)
+                    yield token
+            finally:
+                closed.append(True)
+        
+        llm.get_provider('ollama').generate_stream = generate_stream
+        stream = llm.chat_stream([LLMMessage(role='user', content='hi')])
+        
+        assert await stream.__anext__() == 'a'
+        await stream.aclose()
+        
+        assert read == ['a']
+        assert closed == [True]
+    
+    @pytest.mark.asyncio
+    async def test_client_close_continues_past_failing_provider(self):
+        """A provider that fails to close doesn't keep the others open."""
+        from src.mcp.llm.providers import LLMClient
+        
+        llm = LLMClient({'providers': {'ollama': {'model': 'llama2'},
+                                       'anthropic': {'api_key': 'sk-test'}}})
+        session = llm.get_provider('ollama')._get_session()
+        llm.get_provider('anthropic').aclose = AsyncMock(side_effect=RuntimeError("boom"))
+        
+        await llm.aclose()
+        
+        assert session.closed
+    
+    @pytest.mark.asyncio
+    async def test_openai_uses_shared_async_client(self):
+        """OpenAI requests await the pooled AsyncOpenAI client directly."""
+        from types import SimpleNamespace
+        from src.mcp.llm.providers import OpenAIProvider, LLMMessage
+        
+        provider = OpenAIProvider(api_key='sk-test')
+        client = provider._get_client()
+        assert provider._get_client() is client
+        
+        completion = SimpleNamespace(
+            choices=[SimpleNamespace(message=SimpleNamespace(content='pong'),
+                                     finish_reason='stop')],
+            usage=SimpleNamespace(prompt_tokens=10, completion_tokens=2, total_tokens=12)
+        )
+        with patch.object(client.chat.completions, 'create',
+                          AsyncMock(return_value=completion)) as create:
+            response = await provider.generate([LLMMessage(role='user', content='ping')])
+        
+        assert response.content == 'pong'
+        assert response.tokens_used == 12
+        # gpt-3.5-turbo: $0.0005 / $0.0015 per 1K prompt / completion tokens
+        assert response.cost == pytest.approx((10 * 0.0005 + 2 * 0.0015) / 1000)
+        assert create.call_args.kwargs['messages'] == [{'role': 'user', 'content': 'ping'}]
+        
+        await provider.aclose()
+        assert client.is_closed()
+        assert provider._client is None
 
 
 @pytest.mark.integration
@@ -313,6 +650,108 @@ class TestLLMCostManagement:
         # Should be blocked
         assert not can_proceed
     
+    def test_usage_summary_served_from_memory(self, tmp_path, monkeypatch):
+        """Reading the summary is served from memory between recordings."""
+        from src.mcp.llm.cost_manager import CostManager
+        
+        monkeypatch.setattr('src.mcp.llm.cost_manager.Path.home', lambda: tmp_path)
+        cost_mgr = CostManager({'daily_budget': 10.0})
+        
+        first = cost_mgr.get_usage_summary()
+        assert cost_mgr.get_usage_summary() is first
+        
+        cost_mgr.record_usage('openai', 100, 0.01)
+        assert cost_mgr.get_usage_summary() is not first
+        cost_mgr.close()
+    
+    def test_usage_persisted_in_database(self, tmp_path, monkeypatch):
+        """Recorded calls are aggregated by later instances, legacy totals included."""
+        import json
+        from datetime import datetime
+        from src.mcp.llm.cost_manager import CostManager
+        
+        monkeypatch.setattr('src.mcp.llm.cost_manager.Path.home', lambda: tmp_path)
+        legacy = tmp_path / '.orbit' / 'usage.json'
+        legacy.parent.mkdir()
+        legacy.write_text(json.dumps({
+            'daily': {'date': datetime.now().date().isoformat(), 'cost': 0.5, 'tokens': 50},
+            'monthly': {'month': datetime.now().strftime('%Y-%m'), 'cost': 2.0, 'tokens': 200},
+            'total': {'cost': 5.0, 'tokens': 500}
+        }))
+        
+        first = CostManager({})
+        first.record_usage('openai', 10, 0.25)
+        first.close()
+        
+        summary = CostManager({}).get_usage_summary()
+        assert summary['daily']['cost'] == pytest.approx(0.75)
+        assert summary['daily']['tokens'] == 60
+        assert summary['monthly']['tokens'] == 210
+        assert summary['total']['cost'] == pytest.approx(5.25)
+    
+    def test_usage_writes_are_batched(self, tmp_path, monkeypatch):
+        """Recorded calls are buffered and written in one batch."""
+        import sqlite3
+        from src.mcp.llm.cost_manager import CostManager
+        
+        monkeypatch.setattr('src.mcp.llm.cost_manager.Path.home', lambda: tmp_path)
+        cost_mgr = CostManager({})
+        cost_mgr.FLUSH_INTERVAL = 60
+        
+        def stored_rows():
+            with sqlite3.connect(str(cost_mgr.usage_db)) as db:
+                return db.execute("SELECT COUNT(*) FROM usage").fetchone()[0]
+        
+        for _ in range(3):
+            cost_mgr.record_usage('openai', 10, 0.01)
+        assert stored_rows() == 0
+        assert cost_mgr.get_usage_summary()['daily']['tokens'] == 30
+        
+        for _ in range(CostManager.FLUSH_BATCH_SIZE - 3):
+            cost_mgr.record_usage('openai', 10, 0.01)
+        assert stored_rows() == CostManager.FLUSH_BATCH_SIZE
+        
+        cost_mgr.record_usage('ollama', 5, 0.0)
+        cost_mgr.close()
+        assert stored_rows() == CostManager.FLUSH_BATCH_SIZE + 1
+    
+    def test_period_rollover_checked_against_cached_boundary(self, tmp_path, monkeypatch):
+        """The day boundary is computed once; crossing it re-aggregates the totals."""
+        import time
+        from src.mcp.llm.cost_manager import CostManager
+        
+        monkeypatch.setattr('src.mcp.llm.cost_manager.Path.home', lambda: tmp_path)
+        cost_mgr = CostManager({})
+        cost_mgr.record_usage('openai', 10, 0.5)
+        
+        assert cost_mgr._day_end > time.time()
+        assert not cost_mgr._reset_if_needed()
+        
+        cost_mgr._day_end = time.time() - 1
+        assert cost_mgr._reset_if_needed()
+        assert cost_mgr._day_end > time.time()
+        # Still the same day, so the recorded call is counted again
+        assert cost_mgr.usage['daily']['tokens'] == 10
+        cost_mgr.close()
+    
+    def test_budget_check_fast_path(self, tmp_path, monkeypatch):
+        """Requests well under budget skip the rollover check; near the limit they don't."""
+        from src.mcp.llm.cost_manager import CostManager
+        
+        monkeypatch.setattr('src.mcp.llm.cost_manager.Path.home', lambda: tmp_path)
+        cost_mgr = CostManager({'daily_budget': 1.0, 'monthly_budget': 10.0, 'alert_at': 0.8})
+        checks = []
+        monkeypatch.setattr(cost_mgr, '_reset_if_needed', lambda: checks.append(1))
+        
+        assert cost_mgr.can_make_request(0.5)
+        assert checks == []
+        
+        cost_mgr.record_usage('openai', 10, 0.7)
+        assert cost_mgr.can_make_request(0.2)
+        assert not cost_mgr.can_make_request(0.5)
+        assert len(checks) == 3
+        cost_mgr.close()
+    
     def test_token_optimization(self, sample_log_file):
         """Test token optimization for logs."""
         from src.mcp.llm.cost_manager import TokenOptimizer
@@ -330,6 +769,68 @@ class TestLLMCostManagement:
         # Should still contain key errors
         assert 'ERROR' in optimized or 'error' in optimized.lower()
 
+    
+    def test_token_optimization_streams_lines(self, sample_log_file):
+        """Test an iterable of lines gives the same result as the full string."""
+        from src.mcp.llm.cost_manager import TokenOptimizer
+        
+        optimizer = TokenOptimizer()
+        log_content = sample_log_file.read_text()
+        lines = log_content.split('\n')
+        
+        assert optimizer.optimize_log_content(iter(lines), max_lines=5) == \
+            optimizer.optimize_log_content(log_content, max_lines=5)
+        
+        long_log = [f"line {i}" for i in range(1000)] + ["ERROR disk full"]
+        optimized = optimizer.optimize_log_content(iter(long_log)).split('\n')
+        assert optimized[0] == "ERROR disk full"
+        assert optimized[-1] == "line 999"
+        assert len(optimized) == 100
+        
+        assert optimizer.optimize_log_content(iter(["a", "b"])) == "a\nb"
+
+    
+    def test_token_counts_use_tokenizer_when_available(self, monkeypatch):
+        """Test exact tokenizer counts are used, with the estimate as fallback."""
+        from src.mcp.llm import cost_manager
+        
+        class WordEncoding:
+            def encode(self, text, disallowed_special=()):
+                return text.split()
+            
+            def decode(self, tokens):
+                return ' '.join(tokens)
+        
+        optimizer = cost_manager.TokenOptimizer(max_context_tokens=4)
+        text = "alpha beta gamma delta epsilon zeta"
+        
+        monkeypatch.setattr(cost_manager, '_get_encoding', lambda: None)
+        assert optimizer.estimate_tokens(text) == len(text) // 4
+        
+        monkeypatch.setattr(cost_manager, '_get_encoding', WordEncoding)
+        assert optimizer.estimate_tokens(text) == 6
+        
+        truncated = optimizer.optimize_context(text)
+        assert truncated.startswith("alpha beta\n")
+        assert truncated.endswith("\nepsilon zeta")
+        assert "TRUNCATED 2 tokens" in truncated
+        assert optimizer.optimize_context("short text") == "short text"
+    
+    def test_context_truncated_on_line_boundaries(self, monkeypatch):
+        """Test the kept head and tail only contain whole lines."""
+        from src.mcp.llm import cost_manager
+        
+        monkeypatch.setattr(cost_manager, '_get_encoding', lambda: None)
+        optimizer = cost_manager.TokenOptimizer(max_context_tokens=20)
+        lines = [f"line {i:03d} some log output" for i in range(50)]
+        
+        truncated = optimizer.optimize_context("\n".join(lines))
+        head, tail = truncated.split("\n\n... [TRUNCATED")
+        tail = tail.split("] ...\n\n", 1)[1]
+        
+        assert head.split("\n") == lines[:len(head.split("\n"))]
+        assert tail.split("\n") == lines[-len(tail.split("\n")):]
+
 
 class TestLLMPromptSafety:
     """Test prompt safety and content filtering."""
@@ -0,0 +1,39 @@
+"""Tests for the persistent one-shot response cache."""
+
+from src.mcp.ai.response_cache import ResponseCache
+
+
+class TestResponseCache:
+    """Tests for ResponseCache."""
+
+    def test_normalized_prompts_share_entry(self, tmp_path):
+        """Whitespace and trailing punctuation do not affect lookup."""
+        cache = ResponseCache(tmp_path / 'cache.db')
+        cache.put('List pods in staging', 'pod-a, pod-b', namespace='ollama:llama2')
+
+        assert cache.get('  List   pods in staging? ', namespace='ollama:llama2') == 'pod-a, pod-b'
+        assert cache.get('List pods in staging', namespace='openai:gpt-4') is None
+
+    def test_case_is_significant(self, tmp_path):
+        """Container and host names are case-sensitive."""
+        cache = ResponseCache(tmp_path / 'cache.db')
+        cache.put('logs for container Web', 'web logs')
+
+        assert cache.get('logs for container web') is None
+
+    def test_expired_entries_are_dropped(self, tmp_path):
+        """Entries older than the TTL are treated as misses."""
+        cache = ResponseCache(tmp_path / 'cache.db', ttl=-1)
+        cache.put('docker ps', 'no containers')
+
+        assert cache.get('docker ps') is None
+
+    def test_least_recently_used_evicted(self, tmp_path):
+        """Cache size is bounded by max_entries."""
+        cache = ResponseCache(tmp_path / 'cache.db', max_entries=2)
+        cache.put('a', '1')
+        cache.put('b', '2')
+        cache.put('c', '3')
+
+        assert cache.get('a') is None
+        assert cache.get('c') == '3'
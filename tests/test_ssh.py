@@ -93,8 +93,154 @@ class TestSSHToolUnit:
         mock_ssh_manager.execute_command.assert_called_once()
 
 
+class TestSSHConnectionPool:
+    """Unit tests for SSHManager connection reuse (mocked paramiko)."""
+    
+    def test_live_connection_is_reused(self):
+        """Second connect to the same user@host:port skips the handshake."""
+        from src.mcp.ssh_manager import SSHManager
+        
+        with patch('src.mcp.ssh_manager.paramiko.SSHClient') as client_cls:
+            ssh = SSHManager()
+            first = ssh.connect('web-01', 'deploy')
+            second = ssh.connect('web-01', 'deploy')
+        
+        assert first is second
+        assert client_cls.call_count == 1
+        first.get_transport().set_keepalive.assert_called_once_with(SSHManager.KEEPALIVE_INTERVAL)
+    
+    def test_least_recently_used_connection_closed(self):
+        """Pool size is bounded; the oldest idle connection is closed."""
+        from src.mcp.ssh_manager import SSHManager
+        
+        with patch('src.mcp.ssh_manager.paramiko.SSHClient', side_effect=lambda: MagicMock()):
+            ssh = SSHManager(max_connections=1)
+            first = ssh.connect('web-01', 'deploy')
+            ssh.connect('web-02', 'deploy')
+        
+        first.close.assert_called_once()
+        assert list(ssh.connections) == ['deploy@web-02:22']
+    
+    def test_concurrent_dial_keeps_one_connection(self):
+        """When two threads dial the same host, the loser's client is closed."""
+        from src.mcp.ssh_manager import SSHManager
+        
+        ssh = SSHManager()
+        winner, loser = MagicMock(), MagicMock()
+        
+        assert ssh._add_pooled('deploy@web-01:22', winner) is winner
+        assert ssh._add_pooled('deploy@web-01:22', loser) is winner
+        
+        loser.close.assert_called_once()
+        winner.close.assert_not_called()
+        assert ssh.connections['deploy@web-01:22'] is winner
+    
+    def test_eviction_waits_for_running_command(self):
+        """A connection evicted mid-command is closed once the command ends."""
+        from src.mcp.ssh_manager import SSHManager
+        
+        ssh = SSHManager(max_connections=1)
+        busy = MagicMock()
+        ssh._add_pooled('deploy@web-01:22', busy)
+        
+        with ssh._in_use(busy):
+            ssh._add_pooled('deploy@web-02:22', MagicMock())
+            busy.close.assert_not_called()
+        
+        busy.close.assert_called_once()
+    
+    def test_managers_are_not_pinned_by_exit_hook(self):
+        """The exit hook holds managers weakly."""
+        import gc
+        import weakref
+        from src.mcp.ssh_manager import SSHManager
+        
+        ref = weakref.ref(SSHManager())
+        gc.collect()
+        
+        assert ref() is None
+    
+    def test_no_pool_opens_fresh_connections(self):
+        """With pooling disabled every connect dials again."""
+        from src.mcp.ssh_manager import SSHManager
+        
+        with patch('src.mcp.ssh_manager.paramiko.SSHClient') as client_cls:
+            ssh = SSHManager(pool=False)
+            ssh.connect('web-01', 'deploy')
+            ssh.connect('web-01', 'deploy')
+        
+        assert client_cls.call_count == 2
+        assert not ssh.connections
+
+
+class TestSSHLogStream:
+    """Unit tests for SSHManager.stream_log (mocked channel)."""
+    
+    def _client(self, chunks, exit_code=0, error=b''):
+        client = MagicMock()
+        stdout, stderr = MagicMock(), MagicMock()
+        stdout.channel.recv.side_effect = [*chunks, b'']
+        stdout.channel.recv_exit_status.return_value = exit_code
+        stderr.read.return_value = error
+        client.exec_command.return_value = (MagicMock(), stdout, stderr)
+        return client
+    
+    def test_grep_filters_on_server(self):
+        """Path and pattern are shell-quoted and grep runs remotely."""
+        from src.mcp.ssh_manager import SSHManager
+        
+        client = self._client([b'error: a\n'])
+        chunks = list(SSHManager(pool=False).stream_log(
+            client, '/var/log/my app.log', 10, follow=True, pattern='error: a'
+        ))
+        
+        assert chunks == [b'error: a\n']
+        client.exec_command.assert_called_once_with(
+            "tail -F -n 10 '/var/log/my app.log' | grep --line-buffered -e 'error: a'"
+        )
+    
+    def test_grep_without_matches_is_not_an_error(self):
+        """grep's exit status 1 (no match) is not reported as a failure."""
+        from src.mcp.ssh_manager import SSHManager
+        
+        client = self._client([], exit_code=1)
+        ssh = SSHManager(pool=False)
+        
+        assert list(ssh.stream_log(client, '/var/log/app.log', pattern='panic')) == []
+        
+        failing = self._client([], exit_code=1, error=b'tail: cannot open')
+        with pytest.raises(RuntimeError, match='cannot open'):
+            list(ssh.stream_log(failing, '/var/log/missing.log'))
+
+
 @pytest.mark.integration
 @pytest.mark.ssh
+class TestSSHExecMany:
+    """Unit tests for running one command on several servers."""
+    
+    def test_output_with_brackets_is_not_markup(self):
+        """Remote output containing [brackets] is printed literally."""
+        from rich.console import Console
+        from src.mcp import cmd_ssh
+        
+        ssh_mgr = MagicMock()
+        ssh_mgr.execute_command.side_effect = [
+            ('[/etc] ok\n', '', 0),
+            ('', "ls: cannot access '[/tmp]': No such file\n", 2),
+        ]
+        servers = {'web-01': {'host': 'a', 'user': 'u'}, 'web-02': {'host': 'b', 'user': 'u'}}
+        console = Console(record=True, width=200)
+        
+        with patch.object(cmd_ssh, 'console', console):
+            ok = cmd_ssh._ssh_exec_many(ssh_mgr, servers, 'ls [/tmp]')
+        
+        text = console.export_text()
+        assert not ok
+        assert '[/etc] ok' in text
+        assert "cannot access '[/tmp]'" in text
+        assert 'Results: ls [/tmp]' in text
+
+
 class TestSSHToolIntegration:
     """Integration tests for SSH tool (requires SSH server)."""
     
@@ -355,3 +355,68 @@ class TestMCPProtocolCompliance:
         assert isinstance(batch, list)
         assert len(batch) == 3
         assert all('id' in req for req in batch)
+
+
+class TestServerEventLoop:
+    """Tests for the event loop used by the MCP server entry point."""
+    
+    def test_stock_loop_without_uvloop(self):
+        """Without uvloop the server runs on the default asyncio loop."""
+        from src.mcp import mcp_main
+        
+        async def loop_type():
+            return type(asyncio.get_running_loop())
+        
+        with patch.object(mcp_main, 'uvloop', None):
+            assert mcp_main.run(loop_type()) is type(asyncio.new_event_loop())
+    
+    def test_uvloop_used_when_available(self):
+        """When uvloop is importable its loop factory drives the run."""
+        from src.mcp import mcp_main
+        
+        fake_uvloop = MagicMock()
+        fake_uvloop.new_event_loop.side_effect = asyncio.new_event_loop
+        fake_uvloop.install.side_effect = lambda: None
+        
+        async def answer():
+            return 42
+        
+        with patch.object(mcp_main, 'uvloop', fake_uvloop):
+            assert mcp_main.run(answer()) == 42
+        
+        if hasattr(asyncio, 'Runner'):
+            fake_uvloop.new_event_loop.assert_called_once()
+            fake_uvloop.install.assert_not_called()
+        else:
+            fake_uvloop.install.assert_called_once()
+    
+    def test_server_connections_closed_when_transport_fails(self):
+        """The server's pooled connections are released on the serving loop."""
+        from types import SimpleNamespace
+        from unittest.mock import AsyncMock
+        from src.mcp import mcp_main
+        
+        server = MagicMock()
+        server.aclose = AsyncMock()
+        args = SimpleNamespace(transport='stdio')
+        
+        with patch.object(mcp_main, 'run_stdio_server', AsyncMock(side_effect=RuntimeError('boom'))):
+            with pytest.raises(RuntimeError):
+                mcp_main.run(mcp_main._amain(server, args))
+        
+        server.aclose.assert_awaited_once()
+    
+    @pytest.mark.asyncio
+    async def test_messages_handled_off_the_event_loop(self, tmp_path):
+        """Synchronous tool handlers run in a worker thread, not on the loop."""
+        import threading
+        from src.mcp.mcp_server import MCPDevOpsServer
+        
+        server = MCPDevOpsServer(config_path=str(tmp_path / 'config.yaml'))
+        handled_on = []
+        server.protocol.process_message = lambda message: handled_on.append(threading.get_ident()) or message
+        
+        assert await server.aprocess_message('{}') == '{}'
+        assert handled_on != [threading.get_ident()]
+        
+        await server.aclose()